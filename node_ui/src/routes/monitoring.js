@@ -13,13 +13,15 @@ const router = express.Router();
  */
 router.get('/health', async (req, res) => {
     try {
-        // Get last run
+        // Get last run (timestamps are stored as unix epoch seconds)
         const lastRun = await db.get(`
-            SELECT id, run_date, started_at, completed_at, status,
-                   symbols_attempted, symbols_succeeded, symbols_failed,
+            SELECT id, run_date,
+                   strftime('%Y-%m-%dT%H:%M:%S', started_at, 'unixepoch', 'localtime') as started_at,
+                   strftime('%Y-%m-%dT%H:%M:%S', completed_at, 'unixepoch', 'localtime') as completed_at,
+                   status, symbols_attempted, symbols_succeeded, symbols_failed,
                    total_picks, duration_seconds
             FROM pipeline_runs
-            ORDER BY started_at DESC
+            ORDER BY pipeline_runs.started_at DESC, pipeline_runs.id DESC
             LIMIT 1
         `);
 
@@ -29,14 +31,14 @@ router.get('/health', async (req, res) => {
                 COUNT(*) as total_runs,
                 SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as successful_runs
             FROM pipeline_runs
-            WHERE started_at >= datetime('now', '-7 days')
+            WHERE started_at >= strftime('%s', 'now') - 7 * 86400
         `);
 
         // Get recent alerts
         const recentAlerts = await db.get(`
             SELECT COUNT(*) as count
             FROM monitoring_alerts
-            WHERE created_at >= datetime('now', '-24 hours')
+            WHERE created_at >= strftime('%s', 'now') - 86400
             AND severity IN ('warning', 'critical')
         `);
 
@@ -123,12 +125,14 @@ router.get('/runs', async (req, res) => {
         const offset = parseInt(req.query.offset) || 0;
 
         const runs = await db.all(`
-            SELECT id, run_date, started_at, completed_at, status,
-                   symbols_attempted, symbols_succeeded, symbols_failed,
+            SELECT id, run_date,
+                   strftime('%Y-%m-%dT%H:%M:%S', started_at, 'unixepoch', 'localtime') as started_at,
+                   strftime('%Y-%m-%dT%H:%M:%S', completed_at, 'unixepoch', 'localtime') as completed_at,
+                   status, symbols_attempted, symbols_succeeded, symbols_failed,
                    total_picks, cc_picks, csp_picks, api_calls,
                    duration_seconds, error_message
             FROM pipeline_runs
-            ORDER BY started_at DESC
+            ORDER BY pipeline_runs.started_at DESC, pipeline_runs.id DESC
             LIMIT ? OFFSET ?
         `, [limit, offset]);
 
@@ -167,7 +171,7 @@ router.get('/performance', async (req, res) => {
                 AVG(total_picks) as avg_picks,
                 COUNT(*) as total_runs
             FROM pipeline_runs
-            WHERE started_at >= datetime('now', '-' || ? || ' days')
+            WHERE started_at >= strftime('%s', 'now') - ? * 86400
             AND status = 'success'
         `, [days]);
 
@@ -202,7 +206,7 @@ router.get('/alerts', async (req, res) => {
 
         let query = `
             SELECT id, alert_type, severity, message, details,
-                   sent_via, acknowledged, created_at
+                   sent_via, acknowledged, datetime(created_at, 'unixepoch') as created_at
             FROM monitoring_alerts
         `;
 
@@ -212,7 +216,7 @@ router.get('/alerts', async (req, res) => {
             params.push(severity);
         }
 
-        query += ' ORDER BY created_at DESC LIMIT ?';
+        query += ' ORDER BY monitoring_alerts.created_at DESC LIMIT ?';
         params.push(limit);
 
         const alerts = await db.all(query, params);
@@ -272,10 +276,11 @@ router.get('/metrics/:runId', async (req, res) => {
         const { runId } = req.params;
 
         const metrics = await db.all(`
-            SELECT metric_name, metric_value, metric_unit, recorded_at
+            SELECT metric_name, metric_value, metric_unit,
+                   datetime(recorded_at, 'unixepoch') as recorded_at
             FROM performance_metrics
             WHERE run_id = ?
-            ORDER BY recorded_at DESC
+            ORDER BY performance_metrics.recorded_at DESC
         `, [runId]);
 
         res.json({
@@ -24,6 +24,9 @@ TELEGRAM_CHAT_IDS = os.getenv("TELEGRAM_CHAT_IDS", "").split(",") if os.getenv("
 DB_URL = os.getenv("DATABASE_URL", "data/screener.db")
 MARKET_TZ = os.getenv("MARKET_TIMEZONE", "America/New_York")
 
+# On-disk cache of API responses for finalized dates (makes reruns free)
+RESPONSE_CACHE_PATH = os.getenv("RESPONSE_CACHE_PATH", "data/api_cache.db")
+
 # Screening schedule
 RUN_HOUR = int(os.getenv("SCREENER_RUN_HOUR", "18"))
 UNIVERSE_FILE = os.getenv("UNIVERSE_FILE", "python_app/src/data/universe.csv")
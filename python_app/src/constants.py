@@ -75,6 +75,7 @@ RSI_NEUTRAL = 50                  # RSI = 50 = neutral momentum
 # Historical data requirements
 HISTORICAL_BARS_REQUIRED = 200    # Minimum bars for SMA200 calculation
 HISTORICAL_DAYS_TO_FETCH = 300    # Calendar days to fetch (ensures 200+ trading days, accounting for weekends/holidays)
+HISTORICAL_OVERLAP_DAYS = 7       # Calendar days re-fetched before a cached window's end to detect re-adjusted bars
 
 # ===== Scoring Weights =====
 # Covered Calls scoring weights (must sum to 1.0)
@@ -102,8 +103,20 @@ CSP_SCORING_WEIGHTS = {
 # ===== Penalties & Adjustments =====
 BELOW_SMA200_PENALTY = 0.85  # Score multiplier when below 200 SMA
 
+# Earnings proximity penalty: days until earnings below EARNINGS_PENALTY_CUTOFFS[i]
+# (and not below any earlier cutoff) multiply the score by EARNINGS_PENALTY_MULTIPLIERS[i]
+EARNINGS_PENALTY_CUTOFFS = (7, 14, 21, 30)
+EARNINGS_PENALTY_MULTIPLIERS = (
+    0.50,  # <7 days: severe (high risk)
+    0.70,  # 7-14 days: strong
+    0.85,  # 14-21 days: moderate
+    0.93,  # 21-30 days: light
+    1.0    # 30+ days: no penalty
+)
+
 # ===== Data Processing =====
 BATCH_SIZE = 50  # Symbols per batch for API calls
+SCREENING_MAX_WORKERS = 16  # Symbols screened concurrently (I/O-bound API calls)
 MAX_RETRIES = 3  # Max retries for failed API calls
 RETRY_DELAY = 1.0  # Initial delay in seconds for retries
 
@@ -15,6 +15,7 @@ from typing import List, Dict, Any, Optional
 from ..constants import USE_MOCK_DATA, CC_DTE_RANGE, CSP_DTE_RANGE
 from ..utils.dates import get_expiry_candidates, calculate_dte
 from ..utils.logging import get_logger, log_api_call
+from .response_cache import ResponseCache
 
 
 class PolygonClient:
@@ -39,10 +40,12 @@ class PolygonClient:
         if self.use_mock:
             self.logger.info("Polygon client initialized in MOCK mode")
             self.real_client = None
+            self.cache = None
         else:
             self.logger.info("Polygon client initialized in PRODUCTION mode")
             from .polygon_api_impl import PolygonAPIImpl
             self.real_client = PolygonAPIImpl(api_key)
+            self.cache = ResponseCache()
 
     def get_universe(self) -> List[str]:
         """
@@ -84,8 +87,24 @@ class PolygonClient:
         if self.use_mock:
             return self._mock_daily_prices(symbols, asof)
 
-        # Use real Polygon API client
-        return self.real_client.get_daily_prices(symbols, asof)
+        # Serve finalized dates from the on-disk cache, fetch only the misses
+        prices = {}
+        missing = []
+        for symbol in symbols:
+            cached = self.cache.get("daily_prices", symbol, asof)
+            if cached is not None:
+                prices[symbol] = cached
+            else:
+                missing.append(symbol)
+
+        if missing:
+            # Use real Polygon API client
+            fetched = self.real_client.get_daily_prices(missing, asof)
+            for symbol, data in fetched.items():
+                self.cache.set("daily_prices", symbol, asof, data)
+            prices.update(fetched)
+
+        return prices
 
     def get_option_chain(self, symbol: str, asof: date) -> List[Dict[str, Any]]:
         """
@@ -103,7 +122,8 @@ class PolygonClient:
         if self.use_mock:
             return self._mock_option_chain(symbol, asof)
 
-        # Use real Polygon API client
+        # Not cached: the API lists the current (unexpired) contracts rather
+        # than the chain as of asof, so a past date's entry would be wrong
         return self.real_client.get_option_chain(symbol, asof)
 
     def get_earnings(self, symbol: str) -> Optional[date]:
@@ -7,7 +7,8 @@ Uses proper options endpoints for Options Advanced account.
 import os
 import time
 import requests
-from datetime import date, datetime, timedelta
+from requests.adapters import HTTPAdapter
+from datetime import date, datetime, timedelta, timezone
 from typing import Dict, List, Optional
 import logging
 
@@ -17,13 +18,30 @@ logger = logging.getLogger(__name__)
 class RealOptionsFetcher:
     """Fetches real options data from Massive.com Options API (formerly Polygon.io)."""
 
-    def __init__(self, api_key: str):
-        """Initialize with Massive API key (Polygon API keys still work)."""
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None,
+                 pool_size: int = 64):
+        """
+        Initialize with Massive API key (Polygon API keys still work).
+
+        Args:
+            api_key: Massive.com API key
+            session: Optional pre-configured HTTP session to share
+            pool_size: Keep-alive connections kept per host when creating a session.
+                       Sized above the screening thread count so concurrent
+                       workers reuse connections instead of re-handshaking.
+        """
         self.api_key = api_key
         self.base_url = "https://api.massive.com"
-        self.session = requests.Session()
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+            session.mount('https://', adapter)
+        self.session = session
         self.session.headers.update({
-            'Authorization': f'Bearer {api_key}'
+            'Authorization': f'Bearer {api_key}',
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip'
         })
 
     def get_stock_price(self, symbol: str) -> Optional[float]:
@@ -48,7 +66,8 @@ class RealOptionsFetcher:
 
         return None
 
-    def get_historical_prices(self, symbol: str, days: int = 250) -> Optional[Dict]:
+    def get_historical_prices(self, symbol: str, days: int = 250,
+                              start_date: Optional[date] = None) -> Optional[Dict]:
         """
         Get historical OHLC price data for a symbol.
         Uses /v2/aggs/ticker/{ticker}/range/{multiplier}/{timespan}/{from}/{to} endpoint.
@@ -56,13 +75,15 @@ class RealOptionsFetcher:
         Args:
             symbol: Stock symbol
             days: Number of calendar days to fetch (default 250 to ensure 200+ trading days)
+            start_date: Fetch bars from this date instead (used to extend a cached window)
 
         Returns:
-            Dict with lists of close, high, low prices (most recent last), or None if error
+            Dict with lists of close, high, low prices and bar dates (most recent
+            last), or None if error
         """
         # Calculate date range
         to_date = date.today() - timedelta(days=1)  # Yesterday
-        from_date = to_date - timedelta(days=days)
+        from_date = start_date or to_date - timedelta(days=days)
 
         url = f"{self.base_url}/v2/aggs/ticker/{symbol}/range/1/day/{from_date.isoformat()}/{to_date.isoformat()}"
         params = {"apiKey": self.api_key, "adjusted": "true", "sort": "asc", "limit": 5000}
@@ -82,6 +103,11 @@ class RealOptionsFetcher:
                     highs = [bar['h'] for bar in results]
                     lows = [bar['l'] for bar in results]
                     volumes = [bar['v'] for bar in results]
+                    # Bar timestamps are midnight Eastern, so the UTC date is the trading day
+                    dates = [
+                        datetime.fromtimestamp(bar['t'] / 1000, tz=timezone.utc).date()
+                        for bar in results
+                    ]
 
                     logger.info(f"{symbol} historical data: {len(closes)} bars fetched")
 
@@ -91,6 +117,7 @@ class RealOptionsFetcher:
                         'highs': highs,
                         'lows': lows,
                         'volumes': volumes,
+                        'dates': dates,
                         'bars': len(closes)
                     }
                 else:
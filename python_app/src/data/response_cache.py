@@ -0,0 +1,141 @@
+"""
+On-disk cache for market data API responses.
+
+Stores responses keyed by (endpoint, symbol, asof) in a small SQLite file so
+pipeline reruns for an already-finalized date do not re-download identical data.
+Python 3.12 compatible following CLAUDE.md standards.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+from datetime import date
+from typing import Any, Optional, Tuple
+
+from ..config import RESPONSE_CACHE_PATH
+from ..utils.logging import get_logger
+
+
+class ResponseCache:
+    """
+    Date-keyed response cache backed by SQLite.
+
+    Only responses for dates strictly before today are cached: data for a past
+    trading day is final, so entries never need to be invalidated.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the response cache.
+
+        Args:
+            path: Cache file path (defaults to config.RESPONSE_CACHE_PATH)
+        """
+        self.path = path or RESPONSE_CACHE_PATH
+        self.logger = get_logger("screener.api")
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        # One connection shared by screening worker threads, serialized by a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                endpoint TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                asof DATE NOT NULL,
+                payload BLOB NOT NULL,
+                PRIMARY KEY (endpoint, symbol, asof)
+            )
+        ''')
+        self._conn.commit()
+
+    @staticmethod
+    def is_cacheable(asof: date) -> bool:
+        """Return True if data for this date is finalized and safe to cache."""
+        return asof < date.today()
+
+    def get(self, endpoint: str, symbol: str, asof: date) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            endpoint: Logical endpoint name (e.g., "daily_prices")
+            symbol: Stock symbol
+            asof: As-of date of the response
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM responses WHERE endpoint = ? AND symbol = ? AND asof = ?",
+                (endpoint, symbol, asof.isoformat())
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        self.logger.debug(f"Cache hit - {endpoint} {symbol} {asof}")
+        return pickle.loads(row[0])
+
+    def set(self, endpoint: str, symbol: str, asof: date, value: Any) -> None:
+        """
+        Store a response if its date is finalized.
+
+        Args:
+            endpoint: Logical endpoint name
+            symbol: Stock symbol
+            asof: As-of date of the response
+            value: Response to cache
+        """
+        if not self.is_cacheable(asof):
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (endpoint, symbol, asof, payload) VALUES (?, ?, ?, ?)",
+                (endpoint, symbol, asof.isoformat(), pickle.dumps(value))
+            )
+            self._conn.commit()
+
+    def get_latest(self, endpoint: str, symbol: str) -> Optional[Tuple[date, Any]]:
+        """
+        Look up the most recent cached response for a symbol.
+
+        Args:
+            endpoint: Logical endpoint name
+            symbol: Stock symbol
+
+        Returns:
+            Tuple of (asof, response), or None if nothing is cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT asof, payload FROM responses WHERE endpoint = ? AND symbol = ? "
+                "ORDER BY asof DESC LIMIT 1",
+                (endpoint, symbol)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return date.fromisoformat(row[0]), pickle.loads(row[1])
+
+    def delete_before(self, endpoint: str, symbol: str, asof: date) -> None:
+        """
+        Drop cached responses older than a date (superseded rolling entries).
+
+        Args:
+            endpoint: Logical endpoint name
+            symbol: Stock symbol
+            asof: Entries dated strictly before this are removed
+        """
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM responses WHERE endpoint = ? AND symbol = ? AND asof < ?",
+                (endpoint, symbol, asof.isoformat())
+            )
+            self._conn.commit()
@@ -11,16 +11,18 @@ Author: Options Income Screener v2.7
 import logging
 from typing import Dict, List, Optional, Tuple
 from datetime import date
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import statistics
 
+import numpy as np
+
 from .real_options_fetcher import RealOptionsFetcher
 from ..features.technicals import calculate_chaikin_money_flow
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SentimentMetrics:
     """Container for all sentiment metrics for a symbol."""
     symbol: str
@@ -47,6 +49,78 @@ class SentimentMetrics:
     data_quality: str = 'complete'       # 'complete', 'partial', 'insufficient'
 
 
+@dataclass
+class SentimentMetricsTable:
+    """
+    Column-oriented view of a universe's SentimentMetrics.
+
+    One NumPy array per field with one row per symbol, so universe-wide scans
+    (e.g. the sentiment filter) run as array operations. Missing (None)
+    numeric values are NaN, which fails every threshold comparison.
+    """
+    symbols: np.ndarray
+    metrics: np.ndarray  # The SentimentMetrics objects themselves
+    put_call_ratio_volume: np.ndarray
+    cmf_20: np.ndarray
+    sentiment_score: np.ndarray
+    sentiment_rank: np.ndarray
+    sentiment_extreme: np.ndarray
+    contrarian_signal: np.ndarray
+    data_quality: np.ndarray
+
+    # Derived columns, computed once when the table is built
+    sentiment_extremeness: np.ndarray = field(init=False)  # Distance from neutral (0.5)
+    cmf_magnitude: np.ndarray = field(init=False)          # |CMF|, 0 when missing
+    pc_divergence: np.ndarray = field(init=False)          # P/C distance beyond 1.5 / 0.7
+
+    def __post_init__(self):
+        pc_ratio = self.put_call_ratio_volume
+        self.sentiment_extremeness = np.abs(self.sentiment_score - 0.5)
+        self.cmf_magnitude = np.where(np.isnan(self.cmf_20), 0.0, np.abs(self.cmf_20))
+        # Missing or zero ratios have no divergence
+        self.pc_divergence = np.where(
+            pc_ratio >= 1.5, pc_ratio - 1.5,
+            np.where((pc_ratio <= 0.7) & (pc_ratio != 0), 0.7 - pc_ratio, 0.0)
+        )
+
+    @classmethod
+    def from_metrics(cls, sentiment_metrics: Dict[str, SentimentMetrics]) -> 'SentimentMetricsTable':
+        """
+        Build the table from a symbol -> SentimentMetrics mapping.
+
+        Args:
+            sentiment_metrics: Dictionary mapping symbol to SentimentMetrics
+
+        Returns:
+            SentimentMetricsTable with rows in dict order
+        """
+        n = len(sentiment_metrics)
+        metrics = sentiment_metrics.values()
+
+        def floats(values):
+            return np.fromiter(
+                (np.nan if v is None else v for v in values), dtype=np.float64, count=n
+            )
+
+        def labels(values):
+            return np.fromiter(values, dtype=object, count=n)
+
+        return cls(
+            symbols=labels(sentiment_metrics),
+            metrics=labels(metrics),
+            put_call_ratio_volume=floats(m.put_call_ratio_volume for m in metrics),
+            cmf_20=floats(m.cmf_20 for m in metrics),
+            sentiment_score=floats(m.sentiment_score for m in metrics),
+            sentiment_rank=floats(m.sentiment_rank for m in metrics),
+            sentiment_extreme=labels(m.sentiment_extreme for m in metrics),
+            contrarian_signal=labels(m.contrarian_signal for m in metrics),
+            data_quality=labels(m.data_quality for m in metrics)
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+
 class SentimentAggregator:
     """
     Aggregates sentiment data from multiple sources and calculates composite scores.
@@ -339,8 +413,8 @@ class SentimentAggregator:
             metrics.sentiment_rank = percentile
 
             logger.debug(
-                f"{symbol} sentiment rank: {percentile}th percentile "
-                f"(score: {metrics.sentiment_score:.3f})"
+                "%s sentiment rank: %sth percentile (score: %.3f)",
+                symbol, percentile, metrics.sentiment_score
             )
 
 
@@ -11,8 +11,15 @@ import sys
 import csv
 import sqlite3
 import logging
+import threading
+import numpy as np
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
-from typing import Dict, Any, List, Optional
+from functools import cache
+from operator import itemgetter
+from typing import Dict, Any, Iterator, List, Optional
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -22,21 +29,93 @@ load_dotenv()
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from ..data.real_options_fetcher import RealOptionsFetcher
+from ..data.response_cache import ResponseCache
 from ..data.sentiment_aggregator import SentimentAggregator
 from ..screeners.sentiment_filter import SentimentFilter, FilterConfig
 from ..services.telegram_service import TelegramService
 from ..services.claude_service import ClaudeService
 from ..services.monitoring_service import MonitoringService
-from ..scoring.score_cc import score_cc_pick
-from ..scoring.score_csp import score_csp_pick
+from ..scoring.score_cc import score_cc_pick, cc_score_vec
+from ..scoring.score_csp import score_csp_pick, csp_score_vec
 from ..features.technicals import compute_technical_features
-from ..constants import HISTORICAL_DAYS_TO_FETCH
+from ..utils.math import ranked_indices
+from ..constants import HISTORICAL_DAYS_TO_FETCH, HISTORICAL_OVERLAP_DAYS, SCREENING_MAX_WORKERS
+from ..config import CLAUDE_ENABLED, TELEGRAM_ENABLED
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+# Columns written for each pick, in the order of the parameter rows built by
+# save_picks_to_db (the row ID is assigned by SQLite)
+PICKS_COLUMNS = (
+    "date, asof, symbol, strategy, strike, expiry, "
+    "premium, stock_price, roi_30d, annualized_return, "
+    "iv_rank, score, trend, earnings_days, dividend_yield, "
+    "put_call_ratio, cmf_20, sentiment_score, contrarian_signal"
+)
+PICKS_INSERT_SQL = (
+    f"INSERT INTO picks ({PICKS_COLUMNS}) "
+    f"VALUES ({', '.join('?' * len(PICKS_COLUMNS.split(',')))})"
+)
+PICKS_INSERT_RETURNING_SQL = PICKS_INSERT_SQL + " RETURNING id"
+
+# Trend labels indexed by (strength > 0.5) + (strength >= -0.5)
+TREND_LABELS = ('downtrend', 'neutral', 'uptrend')
+
+
+# Shared service instances. Cached at module level so repeated pipeline runs in
+# the same process reuse one HTTP session (and its pooled TLS connections) and
+# skip re-initializing monitoring tables.
+@cache
+def _options_fetcher(api_key: str) -> RealOptionsFetcher:
+    """Get the shared options fetcher for an API key."""
+    return RealOptionsFetcher(api_key)
+
+
+@cache
+def _telegram_service() -> TelegramService:
+    """Get the shared Telegram service."""
+    return TelegramService()
+
+
+@cache
+def _claude_service() -> ClaudeService:
+    """Get the shared Claude service."""
+    return ClaudeService()
+
+
+@cache
+def _monitoring_service() -> MonitoringService:
+    """Get the shared monitoring service."""
+    return MonitoringService()
+
+
+@cache
+def _response_cache() -> ResponseCache:
+    """Get the shared on-disk API response cache."""
+    return ResponseCache()
+
+
+def _parse_day(value: Optional[str]) -> np.datetime64:
+    """Parse a YYYY-MM-DD date, or return NaT if it is missing or malformed."""
+    try:
+        return np.datetime64(datetime.strptime(value, '%Y-%m-%d').date(), 'D')
+    except (TypeError, ValueError):
+        return np.datetime64('NaT', 'D')
+
+
+def _top_by_score(picks: List[Dict], k: int) -> List[Dict]:
+    """Return the k highest-scoring picks, best first, ties in input order."""
+    if len(picks) <= k:
+        # Nothing to select; a plain sort of a few items beats building an array
+        return sorted(picks, key=itemgetter('score'), reverse=True) if len(picks) > 1 else list(picks)
+
+    scores = np.fromiter(map(itemgetter('score'), picks), dtype=np.float64, count=len(picks))
+    return [picks[i] for i in ranked_indices(scores, k)]
+
+
 class ProductionPipeline:
     """
     Production-ready pipeline for daily options screening.
@@ -59,9 +138,10 @@ class ProductionPipeline:
         """
         symbols = []
         try:
-            with open(universe_file, 'r') as f:
-                reader = csv.DictReader(f)
-                symbols = [row['symbol'] for row in reader]
+            with open(universe_file, 'r', newline='') as f:
+                reader = csv.reader(f)
+                symbol_idx = next(reader).index('symbol')
+                symbols = [row[symbol_idx] for row in reader if row]
             logger.info(f"Loaded {len(symbols)} symbols from {universe_file}")
         except FileNotFoundError:
             logger.error(f"Universe file not found: {universe_file}")
@@ -95,25 +175,38 @@ class ProductionPipeline:
         # Load symbols from universe.csv or use provided symbols
         self.symbols = symbols or self.load_universe_symbols()
 
-        # Initialize services
-        self.fetcher = RealOptionsFetcher(api_key)
+        # Initialize services (I/O services are shared and created on first use)
+        self.fetcher = _options_fetcher(api_key)
+        self.price_cache = _response_cache()
         self.sentiment_aggregator = SentimentAggregator(self.fetcher)
         self.sentiment_filter = SentimentFilter(FilterConfig(
             sentiment_percentile_cutoff=85,
             max_symbols_to_screen=20,  # Top 20 sentiment-ranked symbols
             enabled=True
         ))
-        self.telegram = TelegramService()
-        self.claude = ClaudeService()
-        self.monitoring = MonitoringService()
 
         # Database paths (unified - run from project root)
         self.python_db_path = "data/screener.db"
         self.node_db_path = "data/screener.db"
 
+        # Shared connection to the Python database, opened on first use
+        self._db = None
+        self._db_lock = threading.RLock()
+
         # Run tracking
         self.run_id = None
 
+        # Price history fetches prefetched by run(), keyed by symbol
+        self._history_futures = {}
+
+        # Post-screening steps, resolved once from feature flags so run()
+        # executes them without re-checking configuration
+        self._steps = [self._save_step]
+        if CLAUDE_ENABLED:
+            self._steps.append(self._rationales_step)
+        if TELEGRAM_ENABLED:
+            self._steps.append(self._alerts_step)
+
         # Statistics
         self.stats = {
             'symbols_attempted': 0,
@@ -125,6 +218,65 @@ class ProductionPipeline:
             'api_calls': 0,
             'errors': []
         }
+        self._stats_lock = threading.Lock()
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        """Connection to the Python database, opened once and kept until close()."""
+        with self._db_lock:
+            if self._db is None:
+                self._db = sqlite3.connect(
+                    self.python_db_path, isolation_level=None, check_same_thread=False
+                )
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+                self._db.execute("PRAGMA temp_store=MEMORY")
+            return self._db
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Run statements on the shared connection inside one transaction.
+
+        Commits on success and rolls back if the block raises. Holds the
+        connection lock, so screening worker threads can write safely.
+        """
+        with self._db_lock:
+            cursor = self.db.cursor()
+            cursor.execute("BEGIN")
+            try:
+                yield cursor
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+
+    def close(self) -> None:
+        """Close the shared database connection, if open."""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _count_api_calls(self, count: int) -> None:
+        """Add to the API call counter (safe to call from screening worker threads)."""
+        with self._stats_lock:
+            self.stats['api_calls'] += count
+
+    @property
+    def telegram(self) -> TelegramService:
+        """Telegram service, initialized on first access."""
+        return _telegram_service()
+
+    @property
+    def claude(self) -> ClaudeService:
+        """Claude service, initialized on first access."""
+        return _claude_service()
+
+    @property
+    def monitoring(self) -> MonitoringService:
+        """Monitoring service, initialized on first access."""
+        return _monitoring_service()
 
     def apply_sentiment_prefilter(self, all_symbols: List[str]) -> tuple[List[str], Dict]:
         """
@@ -136,7 +288,7 @@ class ProductionPipeline:
         Returns:
             Tuple of (filtered_symbols, sentiment_metrics_dict)
         """
-        today = date.today()
+        today_iso = date.today().isoformat()
 
         logger.info(f"\n{'='*60}")
         logger.info("SENTIMENT PRE-FILTER (v2.7)")
@@ -154,29 +306,25 @@ class ProductionPipeline:
 
         # Save sentiment metrics to database
         try:
-            conn = sqlite3.connect(self.python_db_path)
-            cursor = conn.cursor()
-
-            for symbol, metrics in sentiment_metrics.items():
-                cursor.execute('''
-                    INSERT OR REPLACE INTO sentiment_metrics (
-                        symbol, asof, put_call_ratio_volume, put_call_ratio_oi,
-                        total_call_volume, total_put_volume, total_call_oi, total_put_oi,
-                        cmf_20, sentiment_extreme, contrarian_signal,
-                        sentiment_score, sentiment_rank, data_quality, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
-                ''', (
-                    symbol, today.isoformat(),
-                    metrics.put_call_ratio_volume, metrics.put_call_ratio_oi,
-                    metrics.total_call_volume, metrics.total_put_volume,
-                    metrics.total_call_oi, metrics.total_put_oi,
-                    metrics.cmf_20, metrics.sentiment_extreme,
-                    metrics.contrarian_signal, metrics.sentiment_score,
-                    metrics.sentiment_rank, metrics.data_quality
-                ))
+            with self._transaction() as cursor:
+                for symbol, metrics in sentiment_metrics.items():
+                    cursor.execute('''
+                        INSERT OR REPLACE INTO sentiment_metrics (
+                            symbol, asof, put_call_ratio_volume, put_call_ratio_oi,
+                            total_call_volume, total_put_volume, total_call_oi, total_put_oi,
+                            cmf_20, sentiment_extreme, contrarian_signal,
+                            sentiment_score, sentiment_rank, data_quality, updated_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
+                    ''', (
+                        symbol, today_iso,
+                        metrics.put_call_ratio_volume, metrics.put_call_ratio_oi,
+                        metrics.total_call_volume, metrics.total_put_volume,
+                        metrics.total_call_oi, metrics.total_put_oi,
+                        metrics.cmf_20, metrics.sentiment_extreme,
+                        metrics.contrarian_signal, metrics.sentiment_score,
+                        metrics.sentiment_rank, metrics.data_quality
+                    ))
 
-            conn.commit()
-            conn.close()
             logger.info(f"✓ Saved {len(sentiment_metrics)} sentiment records to database")
         except Exception as e:
             logger.warning(f"Could not save sentiment metrics: {e}")
@@ -203,29 +351,25 @@ class ProductionPipeline:
 
         # Log universe scan results to database
         try:
-            conn = sqlite3.connect(self.python_db_path)
-            cursor = conn.cursor()
+            with self._transaction() as cursor:
+                for symbol in all_symbols:
+                    if symbol in sentiment_metrics:
+                        m = sentiment_metrics[symbol]
+                        passed = symbol in filtered_symbols
+                        reason = filter_reasons.get(symbol, "Did not pass sentiment filter")
 
-            for symbol in all_symbols:
-                if symbol in sentiment_metrics:
-                    m = sentiment_metrics[symbol]
-                    passed = symbol in filtered_symbols
-                    reason = filter_reasons.get(symbol, "Did not pass sentiment filter")
-
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO universe_scan_log (
-                            run_date, symbol, scanned, passed_sentiment_filter,
-                            sentiment_score, sentiment_rank, contrarian_signal,
-                            exclusion_reason, included_in_screening, created_at
-                        ) VALUES (?, ?, 1, ?, ?, ?, ?, ?, ?, datetime('now'))
-                    ''', (
-                        today.isoformat(), symbol, 1 if passed else 0,
-                        m.sentiment_score, m.sentiment_rank, m.contrarian_signal,
-                        None if passed else reason, 1 if passed else 0
-                    ))
+                        cursor.execute('''
+                            INSERT OR REPLACE INTO universe_scan_log (
+                                run_date, symbol, scanned, passed_sentiment_filter,
+                                sentiment_score, sentiment_rank, contrarian_signal,
+                                exclusion_reason, included_in_screening, created_at
+                            ) VALUES (?, ?, 1, ?, ?, ?, ?, ?, ?, datetime('now'))
+                        ''', (
+                            today_iso, symbol, 1 if passed else 0,
+                            m.sentiment_score, m.sentiment_rank, m.contrarian_signal,
+                            None if passed else reason, 1 if passed else 0
+                        ))
 
-            conn.commit()
-            conn.close()
             logger.info(f"✓ Logged scan results for {len(all_symbols)} symbols")
         except Exception as e:
             logger.warning(f"Could not log scan results: {e}")
@@ -234,6 +378,99 @@ class ProductionPipeline:
 
         return filtered_symbols, sentiment_metrics
 
+    def get_historical_prices(self, symbol: str) -> Optional[Dict]:
+        """
+        Get the trailing daily bar window for a symbol, fetching only new bars.
+
+        The window ends yesterday. The latest window is kept in the response
+        cache; later runs request just the bars since its as-of date (plus a
+        few before it, to check the cache is still valid), append them and drop
+        as many of the oldest bars, keeping the window length fixed. Reruns on
+        the same day make no API call at all.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Dict with prices/highs/lows/volumes/dates lists (most recent last), or None
+        """
+        asof = date.today() - timedelta(days=1)
+        cached = self.price_cache.get_latest("historical_prices", symbol)
+
+        history = None
+        if cached is not None:
+            cached_asof, cached_history = cached
+            if cached_asof == asof:
+                return cached_history
+
+            if (asof - cached_asof).days < HISTORICAL_DAYS_TO_FETCH and 'dates' in cached_history:
+                history = self._extend_price_history(symbol, cached_asof, cached_history)
+
+        if history is None:
+            history = self.fetcher.get_historical_prices(symbol, days=HISTORICAL_DAYS_TO_FETCH)
+            self._count_api_calls(1)
+
+        if history:
+            self.price_cache.set("historical_prices", symbol, asof, history)
+            self.price_cache.delete_before("historical_prices", symbol, asof)
+
+        return history
+
+    def _extend_price_history(self, symbol: str, cached_asof: date, history: Dict) -> Optional[Dict]:
+        """
+        Append the bars since a cached window's as-of date to the window.
+
+        Bars are split-adjusted, so a split re-adjusts every earlier bar. The
+        fetch therefore starts HISTORICAL_OVERLAP_DAYS before cached_asof, and
+        the overlapping closes must match the cached ones.
+
+        Args:
+            symbol: Stock symbol
+            cached_asof: As-of date of the cached window
+            history: Cached window (as returned by get_historical_prices)
+
+        Returns:
+            Extended window of unchanged length, or None if the fetch failed or
+            the cached bars no longer match (the caller refetches in full)
+        """
+        bars = self.fetcher.get_historical_prices(
+            symbol, start_date=cached_asof - timedelta(days=HISTORICAL_OVERLAP_DAYS)
+        )
+        self._count_api_calls(1)
+
+        if not bars:
+            # The overlap always holds trading days, so no bars means the fetch failed
+            logger.warning(f"  {symbol} incremental price fetch failed, refetching full history")
+            return None
+
+        overlap = bisect_right(bars['dates'], cached_asof)
+        if (
+            overlap == 0
+            or bars['dates'][:overlap] != history['dates'][-overlap:]
+            or bars['prices'][:overlap] != history['prices'][-overlap:]
+        ):
+            logger.info(f"  {symbol} cached bars were re-adjusted (split?), refetching full history")
+            return None
+
+        added = bars['bars'] - overlap
+        if added == 0:
+            # No bars since the cached window (weekend/holiday)
+            return history
+
+        def extend(key: str) -> List:
+            return (history[key] + bars[key][overlap:])[added:]
+
+        logger.info(f"  {symbol} price history extended by {added} bars from cache")
+        return {
+            'symbol': symbol,
+            'prices': extend('prices'),
+            'highs': extend('highs'),
+            'lows': extend('lows'),
+            'volumes': extend('volumes'),
+            'dates': extend('dates'),
+            'bars': history['bars']
+        }
+
     def calculate_score(self, option: Dict, strategy: str) -> float:
         """
         Calculate composite score for an option using Greek-enhanced scoring.
@@ -270,7 +507,7 @@ class ProductionPipeline:
                     logger.warning(f"Could not get stock price for {symbol}")
                     return {'symbol': symbol, 'cc_picks': [], 'csp_picks': []}
 
-                self.stats['api_calls'] += 1
+                self._count_api_calls(1)
 
                 # Fetch earnings data
                 earnings_info = self.fetcher.get_earnings_date(symbol)
@@ -284,26 +521,23 @@ class ProductionPipeline:
 
                     # Cache earnings data in database
                     try:
-                        conn = sqlite3.connect(self.python_db_path)
-                        cursor = conn.cursor()
-                        cursor.execute('''
-                            INSERT OR REPLACE INTO earnings (
-                                symbol, earnings_date, date_status, fiscal_period, fiscal_year, estimated_eps, updated_at
-                            ) VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
-                        ''', (
-                            symbol,
-                            earnings_info['date'],
-                            earnings_info['date_status'],
-                            earnings_info['fiscal_period'],
-                            earnings_info['fiscal_year'],
-                            earnings_info.get('estimated_eps')
-                        ))
-                        conn.commit()
-                        conn.close()
+                        with self._transaction() as cursor:
+                            cursor.execute('''
+                                INSERT OR REPLACE INTO earnings (
+                                    symbol, earnings_date, date_status, fiscal_period, fiscal_year, estimated_eps, updated_at
+                                ) VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
+                            ''', (
+                                symbol,
+                                earnings_info['date'],
+                                earnings_info['date_status'],
+                                earnings_info['fiscal_period'],
+                                earnings_info['fiscal_year'],
+                                earnings_info.get('estimated_eps')
+                            ))
                     except Exception as e:
                         logger.warning(f"  Could not cache earnings for {symbol}: {e}")
 
-                    self.stats['api_calls'] += 1
+                    self._count_api_calls(1)
                 else:
                     logger.info(f"  {symbol} has no upcoming earnings in next 90 days")
 
@@ -314,12 +548,17 @@ class ProductionPipeline:
                 if dividend_info:
                     dividend_yield = dividend_info['dividend_yield']
                     logger.info(f"  {symbol} dividend: ${dividend_info['annual_dividend']:.2f}/yr ({dividend_yield*100:.2f}% yield)")
-                    self.stats['api_calls'] += 1
+                    self._count_api_calls(1)
                 else:
                     logger.info(f"  {symbol} has no dividend data")
 
-                # Fetch historical price data for trend analysis
-                historical_data = self.fetcher.get_historical_prices(symbol, days=HISTORICAL_DAYS_TO_FETCH)
+                # Fetch historical price data for trend analysis (prefetched by
+                # run(); popped so that a retry fetches it again)
+                history_future = self._history_futures.pop(symbol, None)
+                if history_future is not None:
+                    historical_data = history_future.result()
+                else:
+                    historical_data = self.get_historical_prices(symbol)
                 technical_features = {}
 
                 if historical_data and len(historical_data.get('prices', [])) >= 200:
@@ -331,7 +570,6 @@ class ProductionPipeline:
                         'lows': historical_data.get('lows')
                     }
                     technical_features = compute_technical_features(price_data)
-                    self.stats['api_calls'] += 1
                     logger.info(f"  {symbol} technical features: trend_strength={technical_features.get('trend_strength', 0):.2f}, trend_stability={technical_features.get('trend_stability', 0.5):.2f}")
                 else:
                     logger.warning(f"  Insufficient historical data for {symbol}, using default values")
@@ -349,97 +587,21 @@ class ProductionPipeline:
 
                 # Find covered calls
                 cc_candidates = self.fetcher.find_covered_call_candidates(symbol, stock_price)
-                cc_picks = []
-
-                for candidate in cc_candidates:
-                    if candidate['mid'] > 0:
-                        candidate['strategy'] = 'CC'
-                        candidate['premium'] = candidate['mid']
-
-                        # Add fields required by scoring function
-                        candidate['iv_rank'] = candidate.get('iv', 0) * 100  # Convert IV to rank (0-100)
-                        candidate['trend_strength'] = technical_features.get('trend_strength', 0)
-                        candidate['dividend_yield'] = dividend_yield  # Real dividend data from API
-                        candidate['below_200sma'] = technical_features.get('below_200sma', False)
-
-                        # Determine trend classification
-                        ts = candidate['trend_strength']
-                        if ts > 0.5:
-                            candidate['trend'] = 'uptrend'
-                        elif ts < -0.5:
-                            candidate['trend'] = 'downtrend'
-                        else:
-                            candidate['trend'] = 'neutral'
-
-                        # Calculate days from option expiry to earnings
-                        if earnings_date and candidate.get('expiry'):
-                            try:
-                                expiry_dt = datetime.strptime(candidate['expiry'], '%Y-%m-%d').date()
-                                earnings_dt = datetime.strptime(earnings_date, '%Y-%m-%d').date()
-                                candidate['earnings_days'] = (earnings_dt - expiry_dt).days
-                            except:
-                                candidate['earnings_days'] = 999  # Fallback if date parsing fails
-                        else:
-                            candidate['earnings_days'] = 999  # No earnings data = safe
-
-                        # Add earnings_days_until for scoring
-                        candidate['earnings_days_until'] = earnings_days_until if earnings_days_until else 999
-                        candidate['earnings_date'] = earnings_date if earnings_date else None
-
-                        candidate['score'] = self.calculate_score(candidate, 'CC')
-                        cc_picks.append(candidate)
-
-                self.stats['api_calls'] += len(cc_candidates)
+                cc_picks, cc_found = self.score_candidates(
+                    cc_candidates, 'CC', stock_price, technical_features,
+                    dividend_yield, earnings_date, earnings_days_until
+                )
+                self._count_api_calls(len(cc_candidates))
 
                 # Find cash-secured puts
                 csp_candidates = self.fetcher.find_cash_secured_put_candidates(symbol, stock_price)
-                csp_picks = []
-
-                for candidate in csp_candidates:
-                    if candidate['mid'] > 0:
-                        candidate['strategy'] = 'CSP'
-                        candidate['premium'] = candidate['mid']
-
-                        # Add fields required by scoring function
-                        candidate['iv_rank'] = candidate.get('iv', 0) * 100  # Convert IV to rank (0-100)
-                        candidate['margin_of_safety'] = (stock_price - candidate['strike']) / stock_price if stock_price > 0 else 0
-                        candidate['trend_stability'] = technical_features.get('trend_stability', 0.5)
-                        candidate['in_uptrend'] = technical_features.get('in_uptrend', False)
-
-                        # Determine trend classification
-                        ts = technical_features.get('trend_strength', 0)
-                        if ts > 0.5:
-                            candidate['trend'] = 'uptrend'
-                        elif ts < -0.5:
-                            candidate['trend'] = 'downtrend'
-                        else:
-                            candidate['trend'] = 'neutral'
-
-                        # Calculate days from option expiry to earnings
-                        if earnings_date and candidate.get('expiry'):
-                            try:
-                                expiry_dt = datetime.strptime(candidate['expiry'], '%Y-%m-%d').date()
-                                earnings_dt = datetime.strptime(earnings_date, '%Y-%m-%d').date()
-                                candidate['earnings_days'] = (earnings_dt - expiry_dt).days
-                            except:
-                                candidate['earnings_days'] = 999  # Fallback if date parsing fails
-                        else:
-                            candidate['earnings_days'] = 999  # No earnings data = safe
-
-                        # Add earnings_days_until for scoring
-                        candidate['earnings_days_until'] = earnings_days_until if earnings_days_until else 999
-                        candidate['earnings_date'] = earnings_date if earnings_date else None
-
-                        candidate['score'] = self.calculate_score(candidate, 'CSP')
-                        csp_picks.append(candidate)
-
-                self.stats['api_calls'] += len(csp_candidates)
-
-                # Sort by score
-                cc_picks.sort(key=lambda x: x['score'], reverse=True)
-                csp_picks.sort(key=lambda x: x['score'], reverse=True)
-
-                logger.info(f"  Found {len(cc_picks)} CC and {len(csp_picks)} CSP candidates for {symbol}")
+                csp_picks, csp_found = self.score_candidates(
+                    csp_candidates, 'CSP', stock_price, technical_features,
+                    dividend_yield, earnings_date, earnings_days_until
+                )
+                self._count_api_calls(len(csp_candidates))
+
+                logger.info(f"  Found {cc_found} CC and {csp_found} CSP candidates for {symbol}")
 
                 # Attach sentiment metrics to picks (if available)
                 sentiment_data = getattr(self, '_current_sentiment_metrics', {}).get(symbol)
@@ -452,8 +614,8 @@ class ProductionPipeline:
 
                 return {
                     'symbol': symbol,
-                    'cc_picks': cc_picks[:2],  # Top 2 of each
-                    'csp_picks': csp_picks[:2]
+                    'cc_picks': cc_picks,
+                    'csp_picks': csp_picks
                 }
 
             except Exception as e:
@@ -469,10 +631,122 @@ class ProductionPipeline:
 
         return {'symbol': symbol, 'cc_picks': [], 'csp_picks': []}
 
+    def score_candidates(self, candidates: List[Dict], strategy: str, stock_price: float,
+                         technical_features: Dict, dividend_yield: float,
+                         earnings_date: Optional[str], earnings_days_until: Optional[int],
+                         top_n: int = 2) -> tuple[List[Dict], int]:
+        """
+        Score a symbol's option candidates as arrays and materialize the best ones.
+
+        Derived fields and scores for the whole chain are computed with NumPy
+        vector operations; scoring fields are written back only to the top picks.
+
+        Args:
+            candidates: Candidate contracts from the options fetcher
+            strategy: "CC" or "CSP"
+            stock_price: Current stock price
+            technical_features: Technical features for the symbol
+            dividend_yield: Annual dividend yield as decimal
+            earnings_date: Next earnings date (YYYY-MM-DD), if known
+            earnings_days_until: Days until next earnings, if known
+            top_n: Number of picks to keep
+
+        Returns:
+            Tuple of (top picks sorted by score, number of priced candidates)
+        """
+        candidates = [c for c in candidates if c['mid'] > 0]
+        if not candidates:
+            return [], 0
+
+        # Trend is per symbol: classify once and share the label across candidates
+        trend_strength = technical_features.get('trend_strength', 0)
+        trend = TREND_LABELS[(trend_strength > 0.5) + (trend_strength >= -0.5)]
+
+        count = len(candidates)
+        iv = np.fromiter((c.get('iv') or 0 for c in candidates), dtype=np.float64, count=count)
+        iv_rank = np.minimum(iv * 100, 100)
+        roi_30d = np.fromiter((c['roi_30d'] for c in candidates), dtype=np.float64, count=count)
+        theta_abs = np.abs(np.fromiter((c.get('theta') or 0.0 for c in candidates), dtype=np.float64, count=count))
+        gamma = np.fromiter((c.get('gamma') or 0.0 for c in candidates), dtype=np.float64, count=count)
+        vega = np.fromiter((c.get('vega') or 0.0 for c in candidates), dtype=np.float64, count=count)
+        oi = np.fromiter((c.get('oi', 0) for c in candidates), dtype=np.float64, count=count)
+        spread_pct = np.fromiter((c.get('spread_pct', 0) for c in candidates), dtype=np.float64, count=count)
+
+        # Days from option expiry to earnings (999 = no earnings data / unparseable)
+        earnings_days = np.full(count, 999, dtype=np.int64)
+        if earnings_date:
+            try:
+                earnings_day = np.datetime64(earnings_date, 'D')
+            except ValueError:
+                earnings_day = None
+            if earnings_day is not None:
+                expiries = [c.get('expiry') for c in candidates]
+                try:
+                    expiry_days = np.array(expiries, dtype='datetime64[D]')
+                except ValueError:
+                    # A malformed expiry only costs its own row the earnings data
+                    expiry_days = np.array([_parse_day(e) for e in expiries], dtype='datetime64[D]')
+                valid = ~np.isnat(expiry_days)
+                earnings_days[valid] = (earnings_day - expiry_days[valid]).astype(np.int64)
+
+        days_until = earnings_days_until if earnings_days_until else 999
+
+        if strategy == 'CC':
+            below_200sma = technical_features.get('below_200sma', False)
+            scores = cc_score_vec(
+                iv_rank, roi_30d, trend_strength,
+                dividend_yield=dividend_yield,
+                theta_abs=theta_abs, gamma=gamma, vega=vega,
+                below_200sma=below_200sma,
+                oi=oi, spread_pct=spread_pct,
+                earnings_days_until=days_until
+            )
+        else:
+            strikes = np.fromiter((c['strike'] for c in candidates), dtype=np.float64, count=count)
+            margin_of_safety = (stock_price - strikes) / stock_price if stock_price > 0 else np.zeros(count)
+            trend_stability = technical_features.get('trend_stability', 0.5)
+            in_uptrend = technical_features.get('in_uptrend', False)
+            scores = csp_score_vec(
+                iv_rank, roi_30d, margin_of_safety, trend_stability,
+                theta_abs=theta_abs, gamma=gamma, vega=vega,
+                in_uptrend=in_uptrend,
+                oi=oi, spread_pct=spread_pct,
+                earnings_days_until=days_until
+            )
+
+        # Ties keep chain order, as the per-candidate sort did
+        top = ranked_indices(scores, top_n)
+
+        picks = []
+        for i in top:
+            pick = candidates[i]
+            pick['strategy'] = strategy
+            pick['premium'] = pick['mid']
+            pick['iv_rank'] = float(iv_rank[i])
+            if strategy == 'CC':
+                pick['trend_strength'] = trend_strength
+                pick['dividend_yield'] = dividend_yield
+                pick['below_200sma'] = below_200sma
+            else:
+                pick['margin_of_safety'] = float(margin_of_safety[i])
+                pick['trend_stability'] = trend_stability
+                pick['in_uptrend'] = in_uptrend
+            pick['trend'] = trend
+            pick['earnings_days'] = int(earnings_days[i])
+            pick['earnings_days_until'] = days_until
+            pick['earnings_date'] = earnings_date if earnings_date else None
+            pick['score'] = float(scores[i])
+            picks.append(pick)
+
+        return picks, count
+
     def save_picks_to_db(self, all_picks: List[Dict]) -> tuple[int, List[Dict]]:
         """
         Save picks to both Python and Node.js databases.
 
+        Picks are inserted into the Python database in a single transaction,
+        then bulk-copied to the Node.js database when it is a separate file.
+
         Args:
             all_picks: List of all picks
 
@@ -482,98 +756,61 @@ class ProductionPipeline:
         if not all_picks:
             return 0, []
 
-        today = date.today()
+        today_iso = date.today().isoformat()
         inserted = 0
         picks_with_ids = []
 
-        try:
-            # Save to Python database
-            conn = sqlite3.connect(self.python_db_path)
-            cursor = conn.cursor()
-
-            # Clear today's picks
-            cursor.execute("DELETE FROM picks WHERE date = ?", (today.isoformat(),))
-
-            for pick in all_picks:
-                try:
-                    # Calculate IV rank
-                    iv_rank = min(pick.get('iv', 0.5) * 100, 100) if pick.get('iv') else 50
-
-                    cursor.execute('''
-                        INSERT INTO picks (
-                            date, asof, symbol, strategy, strike, expiry,
-                            premium, stock_price, roi_30d, annualized_return,
-                            iv_rank, score, trend, earnings_days, dividend_yield,
-                            put_call_ratio, cmf_20, sentiment_score, contrarian_signal
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        today.isoformat(), today.isoformat(),
-                        pick['symbol'], pick['strategy'],
-                        pick['strike'], pick['expiry'],
-                        pick['premium'], pick['stock_price'],
-                        pick['roi_30d'], pick['annualized_return'],
-                        iv_rank, pick['score'],
-                        pick['trend'], pick['earnings_days'],
-                        pick.get('dividend_yield', 0),
-                        pick.get('put_call_ratio'), pick.get('cmf_20'),
-                        pick.get('sentiment_score', 0.5), pick.get('contrarian_signal', 'none')
-                    ))
-
-                    pick_id = cursor.lastrowid
-                    pick_copy = pick.copy()
-                    pick_copy['id'] = pick_id
-                    pick_copy['spot_price'] = pick['stock_price']
-                    pick_copy['iv_rank'] = iv_rank
-                    picks_with_ids.append(pick_copy)
-                    inserted += 1
-
-                except Exception as e:
-                    logger.error(f"Error inserting pick: {e}")
-
-            conn.commit()
-            conn.close()
-
-            logger.info(f"Saved {inserted} picks to Python database")
-
-            # Sync to Node.js database
+        # Build parameter rows once, skipping malformed picks
+        rows = []
+        valid_picks = []
+        for pick in all_picks:
             try:
-                conn2 = sqlite3.connect(self.node_db_path)
-                cursor2 = conn2.cursor()
-                cursor2.execute("DELETE FROM picks WHERE date = ?", (today.isoformat(),))
+                rows.append((
+                    today_iso, today_iso,
+                    pick['symbol'], pick['strategy'],
+                    pick['strike'], pick['expiry'],
+                    pick['premium'], pick['stock_price'],
+                    pick['roi_30d'], pick['annualized_return'],
+                    pick['iv_rank'], pick['score'],
+                    pick['trend'], pick['earnings_days'],
+                    pick.get('dividend_yield', 0),
+                    pick.get('put_call_ratio'), pick.get('cmf_20'),
+                    pick.get('sentiment_score', 0.5), pick.get('contrarian_signal', 'none')
+                ))
+                valid_picks.append(pick)
 
-                for pick in all_picks:
-                    try:
-                        iv_rank = min(pick.get('iv', 0.5) * 100, 100) if pick.get('iv') else 50
-
-                        cursor2.execute('''
-                            INSERT INTO picks (
-                                date, asof, symbol, strategy, strike, expiry,
-                                premium, stock_price, roi_30d, annualized_return,
-                                iv_rank, score, trend, earnings_days, dividend_yield,
-                                put_call_ratio, cmf_20, sentiment_score, contrarian_signal
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            today.isoformat(), today.isoformat(),
-                            pick['symbol'], pick['strategy'],
-                            pick['strike'], pick['expiry'],
-                            pick['premium'], pick['stock_price'],
-                            pick['roi_30d'], pick['annualized_return'],
-                            iv_rank, pick['score'],
-                            pick['trend'], pick['earnings_days'],
-                            pick.get('dividend_yield', 0),
-                            pick.get('put_call_ratio'), pick.get('cmf_20'),
-                            pick.get('sentiment_score', 0.5), pick.get('contrarian_signal', 'none')
-                        ))
-                    except Exception as e:
-                        logger.error(f"Error syncing pick to Node DB: {e}")
+            except Exception as e:
+                logger.error(f"Error inserting pick: {e}")
 
-                conn2.commit()
-                conn2.close()
-                logger.info(f"Synced {inserted} picks to Node.js database")
+        try:
+            # Save to Python database in one transaction
+            with self._transaction() as cursor:
+                # Clear today's picks
+                cursor.execute("DELETE FROM picks WHERE date = ?", (today_iso,))
+
+                # RETURNING keeps each new ID without a follow-up query
+                pick_ids = [
+                    cursor.execute(PICKS_INSERT_RETURNING_SQL, row).fetchone()[0]
+                    for row in rows
+                ]
+
+            # Annotate picks in place only once the IDs are committed
+            for pick, pick_id in zip(valid_picks, pick_ids, strict=True):
+                pick['id'] = pick_id
+                pick['spot_price'] = pick['stock_price']
+            picks_with_ids = valid_picks
+
+            inserted = len(picks_with_ids)
+            logger.info(f"Saved {inserted} picks to Python database")
 
-            except Exception as e:
-                logger.error(f"Error syncing to Node database: {e}")
-                # Continue even if sync fails
+            # Sync to Node.js database (nothing to do when both share one file)
+            if os.path.abspath(self.node_db_path) != os.path.abspath(self.python_db_path):
+                try:
+                    self._sync_picks_to_node_db(today_iso)
+                    logger.info(f"Synced {inserted} picks to Node.js database")
+                except Exception as e:
+                    logger.error(f"Error syncing to Node database: {e}")
+                    # Continue even if sync fails
 
         except Exception as e:
             logger.error(f"Error saving to Python database: {e}")
@@ -581,10 +818,35 @@ class ProductionPipeline:
 
         return inserted, picks_with_ids
 
+    def _sync_picks_to_node_db(self, day: str) -> None:
+        """
+        Copy one day's picks from the Python database into the Node.js database.
+
+        The Node.js database is attached to the shared connection so the copy
+        runs as a single INSERT ... SELECT inside SQLite.
+
+        Args:
+            day: ISO date of the picks to copy
+        """
+        with self._db_lock:
+            self.db.execute("ATTACH DATABASE ? AS node_db", (self.node_db_path,))
+            try:
+                with self._transaction() as cursor:
+                    cursor.execute("DELETE FROM node_db.picks WHERE date = ?", (day,))
+                    cursor.execute(
+                        f"INSERT INTO node_db.picks ({PICKS_COLUMNS}) "
+                        f"SELECT {PICKS_COLUMNS} FROM main.picks WHERE date = ?",
+                        (day,)
+                    )
+            finally:
+                self.db.execute("DETACH DATABASE node_db")
+
     def generate_and_save_rationales(self, picks: List[Dict]) -> int:
         """
         Generate Claude AI rationales for top picks and save to database.
 
+        Saved rationales are also set as pick['rationale'] on the given picks.
+
         Args:
             picks: List of picks with IDs
 
@@ -596,7 +858,7 @@ class ProductionPipeline:
 
         try:
             # Take top 5 picks for rationale generation to manage API costs
-            top_picks = sorted(picks, key=lambda x: x.get('score', 0), reverse=True)[:5]
+            top_picks = _top_by_score(picks, 5)
 
             logger.info(f"Generating AI rationales for top {len(top_picks)} picks...")
 
@@ -618,42 +880,51 @@ class ProductionPipeline:
                 if 'margin_of_safety' not in pick:
                     pick['margin_of_safety'] = abs(pick['stock_price'] - pick['strike']) / pick['stock_price']
 
-            # Generate rationales
-            rationales = self.claude.generate_batch_rationales(top_picks)
+            # Generate rationales concurrently, within the Claude API rate limit
+            picks_to_explain = [p for p in top_picks if p.get('id')]
+            rationales = self.claude.generate_batch_rationales(picks_to_explain, max_workers=5)
 
             if rationales:
                 logger.info(f"Generated {len(rationales)} rationales")
 
                 # Save rationales to database
-                conn = sqlite3.connect(self.python_db_path)
-                cursor = conn.cursor()
-
-                for pick_id, rationale_text in rationales.items():
-                    try:
-                        # Update pick with rationale
-                        cursor.execute('''
-                            UPDATE picks
-                            SET rationale = ?
-                            WHERE id = ?
-                        ''', (rationale_text, pick_id))
-
-                        # Delete existing rationales for this pick to prevent duplicates
-                        cursor.execute('''
-                            DELETE FROM rationales WHERE pick_id = ?
-                        ''', (pick_id,))
-
-                        # Insert new rationale
-                        cursor.execute('''
-                            INSERT INTO rationales (pick_id, summary, created_at)
-                            VALUES (?, ?, datetime('now'))
-                        ''', (pick_id, rationale_text))
-
-                        logger.debug(f"Saved rationale for pick {pick_id} ({rationale_text[:50]}...)")
-                    except Exception as e:
-                        logger.error(f"Error saving rationale for pick {pick_id}: {e}")
+                saved_picks = []
+
+                with self._transaction() as cursor:
+                    for pick in picks_to_explain:
+                        pick_id = pick['id']
+                        rationale_text = rationales.get(pick_id)
+                        if not rationale_text:
+                            continue
+
+                        try:
+                            # Update pick with rationale
+                            cursor.execute('''
+                                UPDATE picks
+                                SET rationale = ?
+                                WHERE id = ?
+                            ''', (rationale_text, pick_id))
+
+                            # Delete existing rationales for this pick to prevent duplicates
+                            cursor.execute('''
+                                DELETE FROM rationales WHERE pick_id = ?
+                            ''', (pick_id,))
+
+                            # Insert new rationale
+                            cursor.execute('''
+                                INSERT INTO rationales (pick_id, summary, created_at)
+                                VALUES (?, ?, datetime('now'))
+                            ''', (pick_id, rationale_text))
+
+                            saved_picks.append((pick, rationale_text))
+                            logger.debug(f"Saved rationale for pick {pick_id} ({rationale_text[:50]}...)")
+                        except Exception as e:
+                            logger.error(f"Error saving rationale for pick {pick_id}: {e}")
+
+                # Attach saved rationales to the in-memory picks for the alert step
+                for pick, rationale_text in saved_picks:
+                    pick['rationale'] = rationale_text
 
-                conn.commit()
-                conn.close()
                 logger.info(f"Saved {len(rationales)} rationales to database")
                 return len(rationales)
 
@@ -679,97 +950,39 @@ class ProductionPipeline:
             return False
 
         try:
-            # Get rationales from database
-            conn = sqlite3.connect(self.python_db_path)
-            cursor = conn.cursor()
-            rationales_map = {}
-
-            try:
-                cursor.execute('''
-                    SELECT id, rationale FROM picks
-                    WHERE date = ? AND rationale IS NOT NULL
-                ''', (date.today().isoformat(),))
-
-                for row in cursor.fetchall():
-                    rationales_map[row[0]] = row[1]
-            finally:
-                conn.close()
-
             success = False
 
             # Send header message
-            header = f"🎯 **Daily Options Screening Results**\n"
-            header += f"📅 {date.today()}\n"
-            header += f"━━━━━━━━━━━━━━━━━━━━\n"
+            header = "".join([
+                "🎯 **Daily Options Screening Results**\n",
+                f"📅 {date.today()}\n",
+                "━━━━━━━━━━━━━━━━━━━━\n"
+            ])
             if self.telegram.send_message(header):
                 success = True
 
             # Send CC picks as separate message
             if cc_picks:
-                cc_message = f"\n📈 **Top Covered Calls ({len(cc_picks)})**\n"
-                for pick in cc_picks[:3]:
-                    cc_message += f"\n• **{pick['symbol']}** @ ${pick['strike']:.2f} (Exp: {pick.get('expiry', 'N/A')})\n"
-                    cc_message += f"  Premium: ${pick.get('premium', 0):.2f} | ROI: {pick.get('roi_30d', 0):.1%}\n"
-                    if pick.get('iv_rank'):
-                        cc_message += f"  IV Rank: {pick['iv_rank']:.1f}% | Score: {pick.get('score', 0):.2f}\n"
-
-                    # Add earnings proximity warning
-                    if pick.get('earnings_date') and pick.get('earnings_days_until') is not None:
-                        days_until = pick['earnings_days_until']
-                        if days_until < 999:
-                            earn_date = pick['earnings_date']
-                            if days_until < 7:
-                                cc_message += f"  ⚠️ Earnings: {earn_date} ({days_until}d) 🔴\n"
-                            elif days_until < 14:
-                                cc_message += f"  ⚠️ Earnings: {earn_date} ({days_until}d) 🟠\n"
-                            elif days_until < 21:
-                                cc_message += f"  Earnings: {earn_date} ({days_until}d) 🟡\n"
-                            elif days_until < 30:
-                                cc_message += f"  Earnings: {earn_date} ({days_until}d) 🟢\n"
-
-                    # Add full rationale (no truncation needed with separate messages)
-                    if pick.get('id') and pick['id'] in rationales_map:
-                        rationale = rationales_map[pick['id']]
-                        cc_message += f"\n  💡 {rationale}\n"
-
+                cc_message = self._format_alert_section(
+                    f"📈 **Top Covered Calls ({len(cc_picks)})**", cc_picks
+                )
                 if self.telegram.send_message(cc_message):
                     success = True
 
             # Send CSP picks as separate message
             if csp_picks:
-                csp_message = f"\n💰 **Top Cash-Secured Puts ({len(csp_picks)})**\n"
-                for pick in csp_picks[:3]:
-                    csp_message += f"\n• **{pick['symbol']}** @ ${pick['strike']:.2f} (Exp: {pick.get('expiry', 'N/A')})\n"
-                    csp_message += f"  Premium: ${pick.get('premium', 0):.2f} | ROI: {pick.get('roi_30d', 0):.1%}\n"
-                    if pick.get('iv_rank'):
-                        csp_message += f"  IV Rank: {pick['iv_rank']:.1f}% | Score: {pick.get('score', 0):.2f}\n"
-
-                    # Add earnings proximity warning
-                    if pick.get('earnings_date') and pick.get('earnings_days_until') is not None:
-                        days_until = pick['earnings_days_until']
-                        if days_until < 999:
-                            earn_date = pick['earnings_date']
-                            if days_until < 7:
-                                csp_message += f"  ⚠️ Earnings: {earn_date} ({days_until}d) 🔴\n"
-                            elif days_until < 14:
-                                csp_message += f"  ⚠️ Earnings: {earn_date} ({days_until}d) 🟠\n"
-                            elif days_until < 21:
-                                csp_message += f"  Earnings: {earn_date} ({days_until}d) 🟡\n"
-                            elif days_until < 30:
-                                csp_message += f"  Earnings: {earn_date} ({days_until}d) 🟢\n"
-
-                    # Add full rationale (no truncation needed with separate messages)
-                    if pick.get('id') and pick['id'] in rationales_map:
-                        rationale = rationales_map[pick['id']]
-                        csp_message += f"\n  💡 {rationale}\n"
-
+                csp_message = self._format_alert_section(
+                    f"💰 **Top Cash-Secured Puts ({len(csp_picks)})**", csp_picks
+                )
                 if self.telegram.send_message(csp_message):
                     success = True
 
             # Send footer message
-            footer = f"\n📊 Dashboard: https://oiscreener.com"
-            footer += f"\n🤖 AI rationales powered by Claude"
-            footer += f"\n\n⚠️ For educational purposes only. Not financial advice."
+            footer = "".join([
+                "\n📊 Dashboard: https://oiscreener.com",
+                "\n🤖 AI rationales powered by Claude",
+                "\n\n⚠️ For educational purposes only. Not financial advice."
+            ])
             if self.telegram.send_message(footer):
                 success = True
 
@@ -780,6 +993,71 @@ class ProductionPipeline:
             self.stats['errors'].append(f"Telegram error: {str(e)}")
             return False
 
+    def _format_alert_section(self, title: str, picks: List[Dict]) -> str:
+        """
+        Format one strategy's top picks as a Telegram message.
+
+        Args:
+            title: Section title line
+            picks: Picks for one strategy (with 'rationale' when generated)
+
+        Returns:
+            Message text
+        """
+        parts = [f"\n{title}\n"]
+        for pick in _top_by_score(picks, 3):
+            parts.append(f"\n• **{pick['symbol']}** @ ${pick['strike']:.2f} (Exp: {pick.get('expiry', 'N/A')})\n")
+            parts.append(f"  Premium: ${pick.get('premium', 0):.2f} | ROI: {pick.get('roi_30d', 0):.1%}\n")
+            if pick.get('iv_rank'):
+                parts.append(f"  IV Rank: {pick['iv_rank']:.1f}% | Score: {pick.get('score', 0):.2f}\n")
+
+            # Add earnings proximity warning
+            if pick.get('earnings_date') and pick.get('earnings_days_until') is not None:
+                days_until = pick['earnings_days_until']
+                if days_until < 999:
+                    earn_date = pick['earnings_date']
+                    if days_until < 7:
+                        parts.append(f"  ⚠️ Earnings: {earn_date} ({days_until}d) 🔴\n")
+                    elif days_until < 14:
+                        parts.append(f"  ⚠️ Earnings: {earn_date} ({days_until}d) 🟠\n")
+                    elif days_until < 21:
+                        parts.append(f"  Earnings: {earn_date} ({days_until}d) 🟡\n")
+                    elif days_until < 30:
+                        parts.append(f"  Earnings: {earn_date} ({days_until}d) 🟢\n")
+
+            # Add full rationale (no truncation needed with separate messages)
+            if pick.get('rationale'):
+                parts.append(f"\n  💡 {pick['rationale']}\n")
+
+        return "".join(parts)
+
+    def _save_step(self, context: Dict[str, Any]) -> None:
+        """Pipeline step: save picks and record their database IDs in the context."""
+        logger.info("\nSaving to database...")
+        saved, context['picks_with_ids'] = self.save_picks_to_db(context['all_picks'])
+        logger.info(f"Saved {saved} picks")
+
+    def _rationales_step(self, context: Dict[str, Any]) -> None:
+        """Pipeline step: generate AI rationales for the top saved picks."""
+        rationales_count = self.generate_and_save_rationales(context['picks_with_ids'])
+        logger.info(f"Generated {rationales_count} AI rationales")
+
+    def _alerts_step(self, context: Dict[str, Any]) -> None:
+        """Pipeline step: send Telegram alerts for the saved picks."""
+        # Use picks_with_ids, which carry the rationales attached by the previous step
+        logger.info("\nSending alerts...")
+        cc_picks_with_ids = []
+        csp_picks_with_ids = []
+        for pick in context['picks_with_ids']:
+            if pick.get('strategy') == 'CC':
+                cc_picks_with_ids.append(pick)
+            elif pick.get('strategy') == 'CSP':
+                csp_picks_with_ids.append(pick)
+        if self.send_alerts(cc_picks_with_ids, csp_picks_with_ids):
+            logger.info("Telegram alert sent successfully")
+        else:
+            logger.warning("Failed to send Telegram alert")
+
     def run(self) -> Dict[str, Any]:
         """
         Execute the complete production pipeline.
@@ -787,6 +1065,13 @@ class ProductionPipeline:
         Returns:
             Dictionary with pipeline results and statistics
         """
+        try:
+            return self._run()
+        finally:
+            self.close()
+
+    def _run(self) -> Dict[str, Any]:
+        """Run all pipeline phases on the shared database connection."""
         start_time = time.time()
 
         # Record pipeline start in monitoring
@@ -809,36 +1094,46 @@ class ProductionPipeline:
         logger.info(f"Screening {len(symbols_to_screen)} sentiment-filtered symbols")
         logger.info("-"*60)
 
-        all_picks = []
+        cc_picks = []
+        csp_picks = []
+
+        # Screen symbols concurrently (from filtered list). The work is dominated
+        # by API latency, so a bounded thread pool overlaps requests across
+        # symbols; the pool size also caps load on the API. Price history does
+        # not depend on anything fetched during screening, so it is prefetched
+        # for every symbol on a separate pool up front.
+        with ThreadPoolExecutor(max_workers=SCREENING_MAX_WORKERS) as prefetch_pool, \
+                ThreadPoolExecutor(max_workers=SCREENING_MAX_WORKERS) as pool:
+            self._history_futures = {
+                symbol: prefetch_pool.submit(self.get_historical_prices, symbol)
+                for symbol in symbols_to_screen
+            }
+            futures = [
+                (symbol, pool.submit(self.screen_symbol_with_retry, symbol))
+                for symbol in symbols_to_screen
+            ]
+
+            # Collect in universe order so results are deterministic
+            for symbol, future in futures:
+                self.stats['symbols_attempted'] += 1
 
-        # Screen each symbol (from filtered list)
-        for symbol in symbols_to_screen:
-            self.stats['symbols_attempted'] += 1
+                try:
+                    result = future.result()
 
-            try:
-                result = self.screen_symbol_with_retry(symbol)
+                    if result['cc_picks'] or result['csp_picks']:
+                        self.stats['symbols_succeeded'] += 1
+                        cc_picks.extend(result['cc_picks'])
+                        csp_picks.extend(result['csp_picks'])
+                    else:
+                        self.stats['symbols_failed'] += 1
 
-                if result['cc_picks'] or result['csp_picks']:
-                    self.stats['symbols_succeeded'] += 1
-                    all_picks.extend(result['cc_picks'])
-                    all_picks.extend(result['csp_picks'])
-                else:
+                except Exception as e:
+                    logger.error(f"Fatal error screening {symbol}: {e}")
                     self.stats['symbols_failed'] += 1
+                    self.stats['errors'].append(f"{symbol}: {str(e)}")
 
-                # Minimal delay for API politeness (no rate limits with Options Advanced)
-                time.sleep(0.1)
-
-            except Exception as e:
-                logger.error(f"Fatal error screening {symbol}: {e}")
-                self.stats['symbols_failed'] += 1
-                self.stats['errors'].append(f"{symbol}: {str(e)}")
-
-        # Sort all picks by score
-        all_picks.sort(key=lambda x: x['score'], reverse=True)
-
-        # Separate by strategy
-        cc_picks = [p for p in all_picks if p['strategy'] == 'CC']
-        csp_picks = [p for p in all_picks if p['strategy'] == 'CSP']
+        # Picks are collected per strategy; alerts and rationales select their own top picks
+        all_picks = cc_picks + csp_picks
 
         self.stats['total_picks'] = len(all_picks)
         self.stats['cc_picks'] = len(cc_picks)
@@ -846,25 +1141,11 @@ class ProductionPipeline:
 
         logger.info(f"\nFound {len(cc_picks)} CC and {len(csp_picks)} CSP picks")
 
-        # Save to database
-        picks_with_ids = []
+        # Save, explain and alert (steps built in __init__)
         if all_picks:
-            logger.info("\nSaving to database...")
-            saved, picks_with_ids = self.save_picks_to_db(all_picks)
-            logger.info(f"Saved {saved} picks")
-
-            # Generate AI rationales for top picks
-            rationales_count = self.generate_and_save_rationales(picks_with_ids)
-            logger.info(f"Generated {rationales_count} AI rationales")
-
-            # Send alerts (use picks_with_ids so rationales can be looked up by ID)
-            logger.info("\nSending alerts...")
-            cc_picks_with_ids = [p for p in picks_with_ids if p.get('strategy') == 'CC']
-            csp_picks_with_ids = [p for p in picks_with_ids if p.get('strategy') == 'CSP']
-            if self.send_alerts(cc_picks_with_ids, csp_picks_with_ids):
-                logger.info("Telegram alert sent successfully")
-            else:
-                logger.warning("Failed to send Telegram alert")
+            context = {'all_picks': all_picks, 'picks_with_ids': []}
+            for step in self._steps:
+                step(context)
 
         # Calculate duration
         duration = time.time() - start_time
@@ -970,7 +1251,7 @@ def run_daily_job(
 
         # Try to send error notification
         try:
-            telegram = TelegramService()
+            telegram = _telegram_service()
             telegram.send_message(
                 f"❌ **Pipeline Fatal Error**\n"
                 f"━━━━━━━━━━━━━━━━━━━━\n"
@@ -5,55 +5,152 @@ Calculates comprehensive scores for CC picks based on multiple factors.
 Python 3.12 compatible following CLAUDE.md standards.
 """
 
-from typing import Dict, Any, List
+import numpy as np
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from ..constants import (
     CC_SCORING_WEIGHTS, BELOW_SMA200_PENALTY,
     THETA_OPTIMAL_RANGE, GAMMA_LOW_THRESHOLD, GAMMA_HIGH_THRESHOLD,
-    VEGA_HIGH_THRESHOLD, VEGA_LOW_THRESHOLD
+    VEGA_HIGH_THRESHOLD, VEGA_LOW_THRESHOLD,
+    EARNINGS_PENALTY_CUTOFFS, EARNINGS_PENALTY_MULTIPLIERS
+)
+from .pick_table import PickTable
+from ..utils.math import make_normalizer, ranked_indices, zscore_normalize
+
+
+__all__ = [
+    'cc_score',
+    'cc_score_vec',
+    'score_cc_pick',
+    'score_cc_picks',
+    'score_cc_table',
+    'CC_PICK_COLUMNS',
+    'rank_cc_picks',
+    'explain_cc_score',
+    'explain_cc_score_components',
+    'format_cc_explanation'
+]
+
+THETA_OPTIMAL_MIN, THETA_OPTIMAL_MAX = THETA_OPTIMAL_RANGE
+
+# Gamma factor indexed by (gamma > low) + (gamma > high): prefer low gamma
+GAMMA_FACTORS = (1.0, 0.7, 0.3)
+
+# Vega factor indexed by [IV bucket][vega bucket] to match vega to the IV
+# environment. IV bucket: (iv_rank >= 30) + (iv_rank > 70).
+# Vega bucket: (vega >= low) + (vega > low) + (vega > high).
+VEGA_FACTORS = (
+    (0.9, 0.6, 0.6, 0.6),  # Low IV: low vega = good stability
+    (0.6, 0.6, 0.6, 0.6),  # Moderate IV: moderate match
+    (0.6, 0.6, 0.8, 1.0),  # High IV: high vega = excellent
 )
-from ..utils.math import zscore
 
+# z-score normalization (target, scale) per component
+_IV_RANK_NORM = (50, 15)  # IV Rank: 0-100 scale
+_ROI_NORM = (1.5, 0.5)  # ROI in percent: 0-3% monthly is typical
+_normalize_iv_rank = make_normalizer(*_IV_RANK_NORM)
+_normalize_roi = make_normalizer(*_ROI_NORM)
+
+# Sentiment-based adjustment (v2.7). For CCs, we want upside potential when
+# the crowd is pessimistic (LONG signal)
+_CONTRARIAN_MULTIPLIERS = {
+    'long': 1.10,  # 10% boost for contrarian long opportunity
+    'short': 0.95  # 5% penalty - crowd too optimistic, limited upside
+}
+
+# Component weights, and the factor tables pre-scaled by their weight
+_W_IV_RANK = CC_SCORING_WEIGHTS['iv_rank']
+_W_ROI_30D = CC_SCORING_WEIGHTS['roi_30d']
+_W_TREND_STRENGTH = CC_SCORING_WEIGHTS['trend_strength']
+_W_DIVIDEND_YIELD = CC_SCORING_WEIGHTS['dividend_yield']
+_W_THETA = CC_SCORING_WEIGHTS['theta']
+_W_GAMMA = CC_SCORING_WEIGHTS['gamma']
+_W_VEGA = CC_SCORING_WEIGHTS['vega']
+_GAMMA_COMPONENTS = tuple(f * _W_GAMMA for f in GAMMA_FACTORS)
+_VEGA_COMPONENTS = tuple(tuple(f * _W_VEGA for f in row) for row in VEGA_FACTORS)
+_GAMMA_COMPONENTS_ARRAY = np.array(_GAMMA_COMPONENTS)
+_VEGA_COMPONENTS_ARRAY = np.array(_VEGA_COMPONENTS)
+_EARNINGS_PENALTY_CUTOFFS_ARRAY = np.array(EARNINGS_PENALTY_CUTOFFS, dtype=np.float64)
+_EARNINGS_PENALTY_MULTIPLIERS_ARRAY = np.array(EARNINGS_PENALTY_MULTIPLIERS)
+
+
+# Scoring inputs as PickTable columns, with the same defaults as score_cc_pick
+CC_PICK_COLUMNS = (
+    ('iv_rank', 50, np.float64),
+    ('roi_30d', 0.01, np.float64),
+    ('trend_strength', 0, np.float64),
+    ('dividend_yield', 0, np.float64),
+    ('theta', 0.0, np.float64),
+    ('gamma', 0.0, np.float64),
+    ('vega', 0.0, np.float64),
+    ('below_200sma', False, bool),
+    ('contrarian_signal', 'none', str),
+    ('oi', 0, np.float64),
+    ('spread_pct', 0, np.float64),
+    ('trend_consistency', 0.5, np.float64),
+    ('earnings_days_until', 999, np.float64)
+)
 
-def normalize_metric(value: float, min_val: float = 0, max_val: float = 100,
-                    target: float = 50, scale: float = 15) -> float:
-    """
-    Normalize a metric to a 0-1 scale using z-score approach.
 
-    Args:
-        value: The metric value to normalize
-        min_val: Minimum expected value
-        max_val: Maximum expected value
-        target: Target/mean value for z-score
-        scale: Standard deviation for z-score
+# Explanation labels as (threshold, label) pairs: the first pair whose
+# threshold the value exceeds wins, the final pair is the fallback
+_IV_LABELS = (
+    (70, "Excellent volatility premium"),
+    (50, "Good volatility environment"),
+    (float('-inf'), "Moderate volatility")
+)
+_ROI_LABELS = (
+    (0.02, "Outstanding returns"),
+    (0.015, "Strong returns"),
+    (float('-inf'), "Acceptable returns")
+)
+_TREND_LABELS = (
+    (0.5, "Strong uptrend"),
+    (0, "Positive momentum"),
+    (float('-inf'), "Weak or negative trend")
+)
 
-    Returns:
-        float: Normalized value between 0 and 1
-    """
-    # Use z-score normalization
-    z = zscore(value, target, scale)
+# Earnings warning per EARNINGS_PENALTY_CUTOFFS band (None past the last cutoff)
+_EARNINGS_NOTES = (
+    "⚠️ SEVERE: Earnings in <7 days (-50%)",
+    "⚠️ WARNING: Earnings in 7-14 days (-30%)",
+    "⚠️ Caution: Earnings in 14-21 days (-15%)",
+    "⚠️ Note: Earnings in 21-30 days (-7%)",
+    None
+)
 
-    # Convert to 0-1 scale (assuming ±3 sigma covers most range)
-    normalized = (z + 3) / 6
 
-    # Clamp to 0-1
-    return max(0.0, min(1.0, normalized))
+def _label(value: float, labels: tuple) -> str:
+    """Return the label of the first threshold the value exceeds."""
+    for threshold, label in labels:
+        if value > threshold:
+            return label
+    return labels[-1][1]
 
 
+@lru_cache(maxsize=16384)
 def cc_score(
     iv_rank: float,
     roi_30d: float,
     trend_strength: float,
     dividend_yield: float = 0.0,
-    theta: float = 0.0,
+    theta_abs: float = 0.0,
     gamma: float = 0.0,
     vega: float = 0.0,
     below_200sma: bool = False,
     contrarian_signal: str = 'none',
-    additional_factors: Dict[str, Any] = None
+    oi: float = 0,
+    spread_pct: float = 0,
+    trend_consistency: float = 0.5,
+    earnings_days_until: float = 999
 ) -> float:
     """
     Calculate comprehensive score for a covered call pick.
 
+    Memoized (LRU) on the exact inputs, so re-scoring an unchanged pick,
+    e.g. when re-ranking the same chain, is a cache lookup.
+
     Formula:
     Base Score = w1*IV_Rank + w2*ROI + w3*Trend + w4*Dividend + w5*Theta + w6*Gamma + w7*Vega
     Final Score = Base Score * Penalties * Sentiment_Adjustment
@@ -63,110 +160,155 @@ def cc_score(
         roi_30d: 30-day ROI as decimal (e.g., 0.015 for 1.5%)
         trend_strength: Trend strength score (-1 to 1)
         dividend_yield: Annual dividend yield as decimal
-        theta: Theta (time decay per day, as absolute value)
+        theta_abs: Absolute theta (time decay per day)
         gamma: Gamma (delta change per $1 stock move)
         vega: Vega (price change per 1% IV change)
         below_200sma: Whether stock is below 200-day SMA
         contrarian_signal: Sentiment-based contrarian signal ('long', 'short', 'none')
-        additional_factors: Optional dict with extra scoring factors
+        oi: Open interest
+        spread_pct: Bid-ask spread as fraction of mid
+        trend_consistency: Trend consistency score (0 to 1)
+        earnings_days_until: Days until next earnings
 
     Returns:
         float: Final score (0 to 1, higher is better)
     """
-    weights = CC_SCORING_WEIGHTS
-    additional_factors = additional_factors or {}
-
     # Normalize components
-    iv_component = normalize_metric(iv_rank, 0, 100, 50, 15) * weights['iv_rank']
+    iv_component = _normalize_iv_rank(iv_rank) * _W_IV_RANK
 
     # ROI: normalize assuming 0-3% monthly is typical range
-    roi_component = normalize_metric(roi_30d * 100, 0, 3, 1.5, 0.5) * weights['roi_30d']
+    roi_component = _normalize_roi(roi_30d * 100) * _W_ROI_30D
 
     # Trend: already -1 to 1, convert to 0-1
-    trend_component = (trend_strength + 1) / 2 * weights['trend_strength']
+    trend_component = (trend_strength + 1) / 2 * _W_TREND_STRENGTH
 
     # Dividend: normalize assuming 0-5% annual yield
-    div_component = min(dividend_yield / 0.05, 1.0) * weights['dividend_yield']
+    div_component = min(dividend_yield / 0.05, 1.0) * _W_DIVIDEND_YIELD
 
     # Theta: normalize assuming 0.03-0.25 range, optimal 0.05-0.15
-    theta_abs = abs(theta)
-    theta_optimal_min, theta_optimal_max = THETA_OPTIMAL_RANGE
-    if theta_optimal_min <= theta_abs <= theta_optimal_max:
-        theta_component = 1.0 * weights['theta']
-    elif theta_abs < theta_optimal_min:
-        theta_component = (theta_abs / theta_optimal_min) * weights['theta']
-    else:
-        theta_component = max(0.3, 1.0 - (theta_abs - theta_optimal_max) / 0.15) * weights['theta']
+    # (ramps up below the optimal range, decays to a 0.3 floor above it)
+    theta_component = min(
+        theta_abs / THETA_OPTIMAL_MIN,
+        1.0,
+        max(0.3, 1.0 - (theta_abs - THETA_OPTIMAL_MAX) / 0.15)
+    ) * _W_THETA
 
     # Gamma: prefer low gamma (more stable), penalize high gamma
-    if gamma <= GAMMA_LOW_THRESHOLD:
-        gamma_component = 1.0 * weights['gamma']
-    elif gamma <= GAMMA_HIGH_THRESHOLD:
-        gamma_component = 0.7 * weights['gamma']
-    else:
-        gamma_component = 0.3 * weights['gamma']
+    gamma_component = _GAMMA_COMPONENTS[
+        int(gamma > GAMMA_LOW_THRESHOLD) + (gamma > GAMMA_HIGH_THRESHOLD)
+    ]
 
     # Vega: match to IV environment
-    if iv_rank > 70 and vega > VEGA_HIGH_THRESHOLD:
-        vega_component = 1.0 * weights['vega']  # High vega in high IV = excellent
-    elif iv_rank > 70 and vega > VEGA_LOW_THRESHOLD:
-        vega_component = 0.8 * weights['vega']
-    elif iv_rank < 30 and vega < VEGA_LOW_THRESHOLD:
-        vega_component = 0.9 * weights['vega']  # Low vega in low IV = good stability
-    else:
-        vega_component = 0.6 * weights['vega']  # Moderate match
+    vega_component = _VEGA_COMPONENTS[int(iv_rank >= 30) + (iv_rank > 70)][
+        int(vega >= VEGA_LOW_THRESHOLD) + (vega > VEGA_LOW_THRESHOLD) + (vega > VEGA_HIGH_THRESHOLD)
+    ]
 
     # Calculate base score
     base_score = (iv_component + roi_component + trend_component + div_component +
                   theta_component + gamma_component + vega_component)
 
-    # Apply penalties and bonuses
-    final_score = base_score
-
-    # Penalty for being below 200 SMA
-    if below_200sma:
-        final_score *= BELOW_SMA200_PENALTY
-
-    # Additional factors from pick data
-    if additional_factors:
-        # Bonus for high liquidity
-        if additional_factors.get('oi', 0) > 2000:
-            final_score *= 1.05
-
-        # Penalty for wide spread
-        if additional_factors.get('spread_pct', 0) > 0.07:
-            final_score *= 0.95
-
-        # Bonus for stability
-        if additional_factors.get('trend_consistency', 0) > 0.7:
-            final_score *= 1.03
-
-        # Earnings proximity penalty (stronger than before)
-        earnings_days_until = additional_factors.get('earnings_days_until', 999)
-        if earnings_days_until < 7:
-            # Severe penalty for earnings within 7 days (high risk)
-            final_score *= 0.50
-        elif earnings_days_until < 14:
-            # Strong penalty for earnings 7-14 days out
-            final_score *= 0.70
-        elif earnings_days_until < 21:
-            # Moderate penalty for earnings 14-21 days out
-            final_score *= 0.85
-        elif earnings_days_until < 30:
-            # Light penalty for earnings 21-30 days out
-            final_score *= 0.93
-
-    # Apply sentiment-based adjustment (v2.7)
-    # For CCs, we want upside potential when crowd is pessimistic (LONG signal)
-    if contrarian_signal == 'long':
-        final_score *= 1.10  # 10% boost for contrarian long opportunity
-    elif contrarian_signal == 'short':
-        final_score *= 0.95  # 5% penalty - crowd too optimistic, limited upside
+    # Apply penalties and bonuses as one product (1.0 when inactive)
+    final_score = (
+        base_score
+        * (BELOW_SMA200_PENALTY if below_200sma else 1.0)  # Below 200 SMA
+        * (1.05 if oi > 2000 else 1.0)  # High liquidity
+        * (0.95 if spread_pct > 0.07 else 1.0)  # Wide spread
+        * (1.03 if trend_consistency > 0.7 else 1.0)  # Stability
+        * EARNINGS_PENALTY_MULTIPLIERS[bisect_right(EARNINGS_PENALTY_CUTOFFS, earnings_days_until)]
+        * _CONTRARIAN_MULTIPLIERS.get(contrarian_signal, 1.0)
+    )
 
     # Ensure score stays in bounds
     return max(0.0, min(1.0, final_score))
 
 
+def cc_score_vec(
+    iv_rank: np.ndarray,
+    roi_30d: np.ndarray,
+    trend_strength: np.ndarray,
+    dividend_yield: np.ndarray = 0.0,
+    theta_abs: np.ndarray = 0.0,
+    gamma: np.ndarray = 0.0,
+    vega: np.ndarray = 0.0,
+    below_200sma: np.ndarray = False,
+    contrarian_signal: np.ndarray = 'none',
+    oi: np.ndarray = 0,
+    spread_pct: np.ndarray = 0,
+    trend_consistency: np.ndarray = 0.5,
+    earnings_days_until: np.ndarray = 999
+) -> np.ndarray:
+    """
+    Vectorized cc_score over a batch of contracts.
+
+    Applies the same components, penalties and bonuses as score_cc_pick. Every
+    input may be an array (one value per contract) or a scalar shared by all
+    contracts, e.g. per-symbol inputs when scoring a single option chain.
+
+    Args:
+        iv_rank: IV Rank percentages (0-100)
+        roi_30d: 30-day ROIs as decimals
+        trend_strength: Trend strength scores (-1 to 1)
+        dividend_yield: Annual dividend yields as decimals
+        theta_abs: Absolute thetas (time decay per day)
+        gamma: Gammas
+        vega: Vegas
+        below_200sma: Whether each stock is below its 200-day SMA
+        contrarian_signal: Sentiment-based contrarian signals ('long', 'short', 'none')
+        oi: Open interest
+        spread_pct: Bid-ask spread as fraction of mid
+        trend_consistency: Trend consistency scores (0 to 1)
+        earnings_days_until: Days until next earnings
+
+    Returns:
+        np.ndarray: Final scores (0 to 1, higher is better)
+    """
+    iv_rank = np.asarray(iv_rank, dtype=np.float64)
+    theta_abs = np.asarray(theta_abs, dtype=np.float64)
+    gamma = np.asarray(gamma, dtype=np.float64)
+    vega = np.asarray(vega, dtype=np.float64)
+    earnings_days_until = np.asarray(earnings_days_until, dtype=np.float64)
+
+    iv_component = zscore_normalize(iv_rank, *_IV_RANK_NORM) * _W_IV_RANK
+    roi_component = zscore_normalize(np.asarray(roi_30d) * 100, *_ROI_NORM) * _W_ROI_30D
+    trend_component = (trend_strength + 1) / 2 * _W_TREND_STRENGTH
+    div_component = np.minimum(np.asarray(dividend_yield) / 0.05, 1.0) * _W_DIVIDEND_YIELD
+
+    theta_component = np.minimum(
+        np.minimum(theta_abs / THETA_OPTIMAL_MIN, 1.0),
+        np.maximum(0.3, 1.0 - (theta_abs - THETA_OPTIMAL_MAX) / 0.15)
+    ) * _W_THETA
+
+    gamma_component = _GAMMA_COMPONENTS_ARRAY[
+        (gamma > GAMMA_LOW_THRESHOLD).astype(np.intp) + (gamma > GAMMA_HIGH_THRESHOLD)
+    ]
+
+    vega_component = _VEGA_COMPONENTS_ARRAY[
+        (iv_rank >= 30).astype(np.intp) + (iv_rank > 70),
+        (vega >= VEGA_LOW_THRESHOLD).astype(np.intp) + (vega > VEGA_LOW_THRESHOLD) + (vega > VEGA_HIGH_THRESHOLD)
+    ]
+
+    final_score = (iv_component + roi_component + trend_component + div_component +
+                   theta_component + gamma_component + vega_component)
+
+    final_score *= np.where(below_200sma, BELOW_SMA200_PENALTY, 1.0)
+    final_score *= np.where(np.asarray(oi) > 2000, 1.05, 1.0)
+    final_score *= np.where(np.asarray(spread_pct) > 0.07, 0.95, 1.0)
+    final_score *= np.where(np.asarray(trend_consistency) > 0.7, 1.03, 1.0)
+
+    final_score *= _EARNINGS_PENALTY_MULTIPLIERS_ARRAY[
+        np.searchsorted(_EARNINGS_PENALTY_CUTOFFS_ARRAY, earnings_days_until, side='right')
+    ]
+
+    contrarian_signal = np.asarray(contrarian_signal)
+    final_score *= np.where(
+        contrarian_signal == 'long', _CONTRARIAN_MULTIPLIERS['long'],
+        np.where(contrarian_signal == 'short', _CONTRARIAN_MULTIPLIERS['short'], 1.0)
+    )
+
+    np.maximum(final_score, 0.0, out=final_score)
+    return np.minimum(final_score, 1.0, out=final_score)
+
+
 def score_cc_pick(pick: Dict[str, Any]) -> float:
     """
     Score a covered call pick using all available data.
@@ -177,129 +319,170 @@ def score_cc_pick(pick: Dict[str, Any]) -> float:
     Returns:
         float: Score between 0 and 1
     """
-    # Extract main scoring inputs
-    iv_rank = pick.get('iv_rank', 50)
-    roi_30d = pick.get('roi_30d', 0.01)
-    trend_strength = pick.get('trend_strength', 0)
-    dividend_yield = pick.get('dividend_yield', 0)
-    below_200sma = pick.get('below_200sma', False)
-    contrarian_signal = pick.get('contrarian_signal', 'none')
-
-    # Extract Greeks
-    theta = pick.get('theta', 0.0)
-    gamma = pick.get('gamma', 0.0)
-    vega = pick.get('vega', 0.0)
-
-    # Prepare additional factors
-    additional = {
-        'oi': pick.get('oi', 0),
-        'spread_pct': pick.get('spread_pct', 0),
-        'trend_consistency': pick.get('trend_consistency', 0.5),
-        'near_earnings': pick.get('near_earnings', False),
-        'earnings_days_until': pick.get('earnings_days_until', 999),
-        'hv_60': pick.get('hv_60', 0),
-        'volume': pick.get('volume', 0)
-    }
+    return cc_score(
+        iv_rank=pick.get('iv_rank', 50),
+        roi_30d=pick.get('roi_30d', 0.01),
+        trend_strength=pick.get('trend_strength', 0),
+        dividend_yield=pick.get('dividend_yield', 0),
+        theta_abs=abs(pick.get('theta', 0.0)),
+        gamma=pick.get('gamma', 0.0),
+        vega=pick.get('vega', 0.0),
+        below_200sma=pick.get('below_200sma', False),
+        contrarian_signal=pick.get('contrarian_signal', 'none'),
+        oi=pick.get('oi', 0),
+        spread_pct=pick.get('spread_pct', 0),
+        trend_consistency=pick.get('trend_consistency', 0.5),
+        earnings_days_until=pick.get('earnings_days_until', 999)
+    )
 
-    # Calculate score
-    score = cc_score(
-        iv_rank=iv_rank,
-        roi_30d=roi_30d,
-        trend_strength=trend_strength,
-        dividend_yield=dividend_yield,
-        theta=theta,
-        gamma=gamma,
-        vega=vega,
-        below_200sma=below_200sma,
-        contrarian_signal=contrarian_signal,
-        additional_factors=additional
+
+def score_cc_table(table: PickTable) -> np.ndarray:
+    """
+    Score every row of a CC pick table in one vectorized pass.
+
+    Args:
+        table: PickTable built with CC_PICK_COLUMNS
+
+    Returns:
+        np.ndarray: Scores between 0 and 1, in table order
+    """
+    return cc_score_vec(
+        iv_rank=table['iv_rank'],
+        roi_30d=table['roi_30d'],
+        trend_strength=table['trend_strength'],
+        dividend_yield=table['dividend_yield'],
+        theta_abs=np.abs(table['theta']),
+        gamma=table['gamma'],
+        vega=table['vega'],
+        below_200sma=table['below_200sma'],
+        contrarian_signal=table['contrarian_signal'],
+        oi=table['oi'],
+        spread_pct=table['spread_pct'],
+        trend_consistency=table['trend_consistency'],
+        earnings_days_until=table['earnings_days_until']
     )
 
-    return score
+
+def score_cc_picks(picks: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Score a batch of covered call picks in one vectorized pass.
+
+    Args:
+        picks: List of pick dictionaries from screener
+
+    Returns:
+        np.ndarray: Scores between 0 and 1, in the order of picks
+    """
+    return score_cc_table(_cc_table(picks))
+
+
+def _cc_table(picks: List[Dict[str, Any]]) -> PickTable:
+    """Build the columnar table scored by score_cc_table."""
+    return PickTable.from_dicts(picks, CC_PICK_COLUMNS)
 
 
-def rank_cc_picks(picks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def rank_cc_picks(picks: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Score and rank multiple covered call picks.
 
+    Picks are converted to a columnar PickTable once; scoring and the ranking
+    permutation both operate on its columns.
+
     Args:
         picks: List of pick dictionaries from screener
+        top_k: If set, only the top_k picks are ranked and returned (as a new
+            list, leaving picks in place) without sorting the whole list
 
     Returns:
-        List[Dict]: Picks with scores added, sorted by score descending
+        List[Dict]: Picks with scores and ranks added, sorted by score descending
     """
-    # Score each pick
-    for pick in picks:
-        pick['score'] = score_cc_pick(pick)
+    if not picks:
+        return picks
+
+    table = _cc_table(picks)
+    table['score'] = score_cc_table(table)
 
-    # Sort by score (highest first)
-    picks.sort(key=lambda x: x['score'], reverse=True)
+    # Highest score first; ties keep their input order
+    ranked = table.take(ranked_indices(table['score'], top_k))
+    ranked['rank'] = np.arange(1, len(ranked) + 1)
+    ranked_picks = ranked.to_dicts(('score', 'rank'))
 
-    # Add rank
-    for i, pick in enumerate(picks, 1):
-        pick['rank'] = i
+    if top_k is not None:
+        return ranked_picks
 
+    picks[:] = ranked_picks
     return picks
 
 
-def explain_cc_score(pick: Dict[str, Any]) -> str:
+def explain_cc_score_components(pick: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Generate human-readable explanation of score components.
+    Classify a pick's score components without building any text.
+
+    Cheap enough to run for every ranked pick; pass the result to
+    format_cc_explanation only for the picks actually displayed.
 
     Args:
         pick: Pick dictionary with score
 
     Returns:
-        str: Explanation of score calculation
+        Dict: Score, IV rank/ROI values, their tier labels, the trend label
+        and a tuple of penalty/bonus notes
     """
-    score = pick.get('score', 0)
     iv_rank = pick.get('iv_rank', 50)
     roi_30d = pick.get('roi_30d', 0.01)
-    trend_strength = pick.get('trend_strength', 0)
-
-    explanation = f"Score: {score:.2f}\n"
-    explanation += f"Components:\n"
-    explanation += f"  • IV Rank ({iv_rank:.0f}%): "
-
-    if iv_rank > 70:
-        explanation += "Excellent volatility premium\n"
-    elif iv_rank > 50:
-        explanation += "Good volatility environment\n"
-    else:
-        explanation += "Moderate volatility\n"
-
-    explanation += f"  • ROI ({roi_30d:.2%}/month): "
-    if roi_30d > 0.02:
-        explanation += "Outstanding returns\n"
-    elif roi_30d > 0.015:
-        explanation += "Strong returns\n"
-    else:
-        explanation += "Acceptable returns\n"
-
-    explanation += f"  • Trend: "
-    if trend_strength > 0.5:
-        explanation += "Strong uptrend\n"
-    elif trend_strength > 0:
-        explanation += "Positive momentum\n"
-    else:
-        explanation += "Weak or negative trend\n"
-
-    # Add penalties/bonuses
-    if pick.get('below_200sma'):
-        explanation += "  • Penalty: Below 200 SMA\n"
-
-    # Earnings warnings
-    earnings_days = pick.get('earnings_days_until', 999)
-    if earnings_days < 7:
-        explanation += "  • ⚠️ SEVERE: Earnings in <7 days (-50%)\n"
-    elif earnings_days < 14:
-        explanation += "  • ⚠️ WARNING: Earnings in 7-14 days (-30%)\n"
-    elif earnings_days < 21:
-        explanation += "  • ⚠️ Caution: Earnings in 14-21 days (-15%)\n"
-    elif earnings_days < 30:
-        explanation += "  • ⚠️ Note: Earnings in 21-30 days (-7%)\n"
 
+    notes = []
+    if pick.get('below_200sma'):
+        notes.append("Penalty: Below 200 SMA")
+    earnings_note = _EARNINGS_NOTES[
+        bisect_right(EARNINGS_PENALTY_CUTOFFS, pick.get('earnings_days_until', 999))
+    ]
+    if earnings_note:
+        notes.append(earnings_note)
     if pick.get('oi', 0) > 2000:
-        explanation += "  • Bonus: Excellent liquidity\n"
+        notes.append("Bonus: Excellent liquidity")
+
+    return {
+        'score': pick.get('score', 0),
+        'iv_rank': iv_rank,
+        'iv_rank_label': _label(iv_rank, _IV_LABELS),
+        'roi_30d': roi_30d,
+        'roi_label': _label(roi_30d, _ROI_LABELS),
+        'trend_label': _label(pick.get('trend_strength', 0), _TREND_LABELS),
+        'notes': tuple(notes)
+    }
 
-    return explanation
\ No newline at end of file
+
+def format_cc_explanation(components: Dict[str, Any]) -> str:
+    """
+    Render explain_cc_score_components output as human-readable text.
+
+    Args:
+        components: Dict from explain_cc_score_components
+
+    Returns:
+        str: Explanation of score calculation
+    """
+    parts = [
+        f"Score: {components['score']:.2f}",
+        "Components:",
+        f"  • IV Rank ({components['iv_rank']:.0f}%): {components['iv_rank_label']}",
+        f"  • ROI ({components['roi_30d']:.2%}/month): {components['roi_label']}",
+        f"  • Trend: {components['trend_label']}"
+    ]
+    parts.extend(f"  • {note}" for note in components['notes'])
+    parts.append("")
+    return "\n".join(parts)
+
+
+def explain_cc_score(pick: Dict[str, Any]) -> str:
+    """
+    Generate human-readable explanation of score components.
+
+    Args:
+        pick: Pick dictionary with score
+
+    Returns:
+        str: Explanation of score calculation
+    """
+    return format_cc_explanation(explain_cc_score_components(pick))
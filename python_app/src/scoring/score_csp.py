@@ -5,54 +5,164 @@ Calculates comprehensive scores for CSP picks based on multiple factors.
 Python 3.12 compatible following CLAUDE.md standards.
 """
 
-from typing import Dict, Any, List
+import numpy as np
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from ..constants import (
     CSP_SCORING_WEIGHTS,
     THETA_OPTIMAL_RANGE, GAMMA_LOW_THRESHOLD, GAMMA_HIGH_THRESHOLD,
-    VEGA_HIGH_THRESHOLD, VEGA_LOW_THRESHOLD
+    VEGA_HIGH_THRESHOLD, VEGA_LOW_THRESHOLD,
+    EARNINGS_PENALTY_CUTOFFS, EARNINGS_PENALTY_MULTIPLIERS
+)
+from .pick_table import PickTable
+from ..utils.math import make_normalizer, ranked_indices, zscore_normalize
+
+
+__all__ = [
+    'csp_score',
+    'csp_score_vec',
+    'score_csp_pick',
+    'score_csp_picks',
+    'score_csp_table',
+    'CSP_PICK_COLUMNS',
+    'rank_csp_picks',
+    'explain_csp_score',
+    'explain_csp_score_components',
+    'format_csp_explanation',
+    'compare_csp_picks'
+]
+
+THETA_OPTIMAL_MIN, THETA_OPTIMAL_MAX = THETA_OPTIMAL_RANGE
+
+# Gamma factor indexed by (gamma > low) + (gamma > high): prefer low gamma
+GAMMA_FACTORS = (1.0, 0.7, 0.3)
+
+# Vega factor indexed by [IV bucket][vega bucket] to match vega to the IV
+# environment. IV bucket: (iv_rank >= 30) + (iv_rank > 70).
+# Vega bucket: (vega >= low) + (vega > low) + (vega > high).
+VEGA_FACTORS = (
+    (0.9, 0.6, 0.6, 0.6),  # Low IV: low vega = good stability
+    (0.6, 0.6, 0.6, 0.6),  # Moderate IV: moderate match
+    (0.6, 0.6, 0.8, 1.0),  # High IV: high vega = excellent
 )
-from ..utils.math import zscore
 
+# z-score normalization (target, scale) per component
+_IV_RANK_NORM = (55, 15)  # IV Rank: 0-100 scale
+_ROI_NORM = (1.2, 0.4)  # ROI in percent: 0-2.5% monthly is typical for CSP
+_MARGIN_NORM = (7.5, 3)  # Margin of safety in percent: 0-15% is typical
+_normalize_iv_rank = make_normalizer(*_IV_RANK_NORM)
+_normalize_roi = make_normalizer(*_ROI_NORM)
+_normalize_margin = make_normalizer(*_MARGIN_NORM)
+
+# Sentiment-based adjustment (v2.7). For CSPs, we want to sell puts when the
+# crowd is pessimistic (LONG signal)
+_CONTRARIAN_MULTIPLIERS = {
+    'long': 1.10,  # 10% boost - crowd fearful, good time to sell puts
+    'short': 0.90  # 10% penalty - crowd greedy, avoid selling puts
+}
+
+# Component weights, and the factor tables pre-scaled by their weight
+_W_IV_RANK = CSP_SCORING_WEIGHTS['iv_rank']
+_W_ROI_30D = CSP_SCORING_WEIGHTS['roi_30d']
+_W_MARGIN_OF_SAFETY = CSP_SCORING_WEIGHTS['margin_of_safety']
+_W_TREND_STABILITY = CSP_SCORING_WEIGHTS['trend_stability']
+_W_THETA = CSP_SCORING_WEIGHTS['theta']
+_W_GAMMA = CSP_SCORING_WEIGHTS['gamma']
+_W_VEGA = CSP_SCORING_WEIGHTS['vega']
+_GAMMA_COMPONENTS = tuple(f * _W_GAMMA for f in GAMMA_FACTORS)
+_VEGA_COMPONENTS = tuple(tuple(f * _W_VEGA for f in row) for row in VEGA_FACTORS)
+_GAMMA_COMPONENTS_ARRAY = np.array(_GAMMA_COMPONENTS)
+_VEGA_COMPONENTS_ARRAY = np.array(_VEGA_COMPONENTS)
+_EARNINGS_PENALTY_CUTOFFS_ARRAY = np.array(EARNINGS_PENALTY_CUTOFFS, dtype=np.float64)
+_EARNINGS_PENALTY_MULTIPLIERS_ARRAY = np.array(EARNINGS_PENALTY_MULTIPLIERS)
+
+
+# Scoring inputs as PickTable columns, with the same defaults as score_csp_pick
+CSP_PICK_COLUMNS = (
+    ('iv_rank', 50, np.float64),
+    ('roi_30d', 0.01, np.float64),
+    ('margin_of_safety', 0.07, np.float64),
+    ('trend_stability', 0.5, np.float64),
+    ('theta', 0.0, np.float64),
+    ('gamma', 0.0, np.float64),
+    ('vega', 0.0, np.float64),
+    ('contrarian_signal', 'none', str),
+    ('in_uptrend', False, bool),
+    ('oi', 0, np.float64),
+    ('spread_pct', 0, np.float64),
+    ('iv_percentile', 50, np.float64),
+    ('_near_support', False, bool),
+    ('_earnings_band', 0, np.intp)
+)
 
-def normalize_metric(value: float, min_val: float = 0, max_val: float = 100,
-                    target: float = 50, scale: float = 15) -> float:
-    """
-    Normalize a metric to a 0-1 scale using z-score approach.
 
-    Args:
-        value: The metric value to normalize
-        min_val: Minimum expected value
-        max_val: Maximum expected value
-        target: Target/mean value for z-score
-        scale: Standard deviation for z-score
+# Explanation labels as (threshold, label) pairs: the first pair whose
+# threshold the value exceeds wins, the final pair is the fallback
+_IV_LABELS = (
+    (70, "Excellent volatility premium"),
+    (55, "Good volatility environment"),
+    (float('-inf'), "Adequate volatility")
+)
+_ROI_LABELS = (
+    (0.018, "Outstanding returns"),
+    (0.012, "Strong returns"),
+    (float('-inf'), "Acceptable returns")
+)
+_MARGIN_LABELS = (
+    (0.10, "Excellent safety buffer"),
+    (0.07, "Good downside protection"),
+    (0.05, "Adequate protection"),
+    (float('-inf'), "Limited protection")
+)
+_STABILITY_LABELS = (
+    (0.7, "Very stable trend"),
+    (0.5, "Moderate stability"),
+    (float('-inf'), "Volatile price action")
+)
 
-    Returns:
-        float: Normalized value between 0 and 1
-    """
-    # Use z-score normalization
-    z = zscore(value, target, scale)
+# Earnings warning per EARNINGS_PENALTY_CUTOFFS band (None past the last cutoff)
+_EARNINGS_NOTES = (
+    "⚠️ SEVERE: Earnings in <7 days (-50%)",
+    "⚠️ WARNING: Earnings in 7-14 days (-30%)",
+    "⚠️ Caution: Earnings in 14-21 days (-15%)",
+    "⚠️ Note: Earnings in 21-30 days (-7%)",
+    None
+)
 
-    # Convert to 0-1 scale (assuming ±3 sigma covers most range)
-    normalized = (z + 3) / 6
 
-    # Clamp to 0-1
-    return max(0.0, min(1.0, normalized))
+def _label(value: float, labels: tuple) -> str:
+    """Return the label of the first threshold the value exceeds."""
+    for threshold, label in labels:
+        if value > threshold:
+            return label
+    return labels[-1][1]
 
 
+@lru_cache(maxsize=16384)
 def csp_score(
     iv_rank: float,
     roi_30d: float,
     margin_of_safety: float,
     trend_stability: float,
-    theta: float = 0.0,
+    theta_abs: float = 0.0,
     gamma: float = 0.0,
     vega: float = 0.0,
     contrarian_signal: str = 'none',
-    additional_factors: Dict[str, Any] = None
+    in_uptrend: bool = False,
+    oi: float = 0,
+    spread_pct: float = 0,
+    iv_percentile: float = 50,
+    near_support: bool = False,
+    earnings_days_until: float = 999,
+    earnings_band: Optional[int] = None
 ) -> float:
     """
     Calculate comprehensive score for a cash-secured put pick.
 
+    Memoized (LRU) on the exact inputs, so re-scoring an unchanged pick,
+    e.g. when re-ranking the same chain, is a cache lookup.
+
     Formula:
     Score = w1*IV_Rank + w2*ROI + w3*Margin + w4*Stability + w5*Theta + w6*Gamma + w7*Vega
     Final Score = Score * Adjustments * Sentiment_Adjustment
@@ -62,118 +172,195 @@ def csp_score(
         roi_30d: 30-day ROI as decimal (e.g., 0.012 for 1.2%)
         margin_of_safety: How far OTM as decimal (e.g., 0.08 for 8%)
         trend_stability: Trend consistency score (0 to 1)
-        theta: Theta (time decay per day, as absolute value)
+        theta_abs: Absolute theta (time decay per day)
         gamma: Gamma (delta change per $1 stock move)
         vega: Vega (price change per 1% IV change)
         contrarian_signal: Sentiment-based contrarian signal ('long', 'short', 'none')
-        additional_factors: Optional dict with extra scoring factors
+        in_uptrend: Whether the stock is in an uptrend
+        oi: Open interest
+        spread_pct: Bid-ask spread as fraction of mid
+        iv_percentile: IV percentile (0-100)
+        near_support: Whether the strike is near a support level
+        earnings_days_until: Days until next earnings
+        earnings_band: Precomputed earnings penalty band (see _enrich_pick);
+            derived from earnings_days_until when omitted
 
     Returns:
         float: Final score (0 to 1, higher is better)
     """
-    weights = CSP_SCORING_WEIGHTS
-    additional_factors = additional_factors or {}
-
     # Normalize components
     # IV Rank: 0-100 scale
-    iv_component = normalize_metric(iv_rank, 0, 100, 55, 15) * weights['iv_rank']
+    iv_component = _normalize_iv_rank(iv_rank) * _W_IV_RANK
 
     # ROI: normalize assuming 0-2.5% monthly is typical range for CSP
-    roi_component = normalize_metric(roi_30d * 100, 0, 2.5, 1.2, 0.4) * weights['roi_30d']
+    roi_component = _normalize_roi(roi_30d * 100) * _W_ROI_30D
 
     # Margin of Safety: normalize assuming 0-15% is typical
-    margin_component = normalize_metric(margin_of_safety * 100, 0, 15, 7.5, 3) * weights['margin_of_safety']
+    margin_component = _normalize_margin(margin_of_safety * 100) * _W_MARGIN_OF_SAFETY
 
     # Trend Stability: already 0-1
-    stability_component = trend_stability * weights['trend_stability']
+    stability_component = trend_stability * _W_TREND_STABILITY
 
     # Theta: normalize assuming 0.03-0.25 range, optimal 0.05-0.15
-    theta_abs = abs(theta)
-    theta_optimal_min, theta_optimal_max = THETA_OPTIMAL_RANGE
-    if theta_optimal_min <= theta_abs <= theta_optimal_max:
-        theta_component = 1.0 * weights['theta']
-    elif theta_abs < theta_optimal_min:
-        theta_component = (theta_abs / theta_optimal_min) * weights['theta']
-    else:
-        theta_component = max(0.3, 1.0 - (theta_abs - theta_optimal_max) / 0.15) * weights['theta']
+    # (ramps up below the optimal range, decays to a 0.3 floor above it)
+    theta_component = min(
+        theta_abs / THETA_OPTIMAL_MIN,
+        1.0,
+        max(0.3, 1.0 - (theta_abs - THETA_OPTIMAL_MAX) / 0.15)
+    ) * _W_THETA
 
     # Gamma: prefer low gamma (more stable), penalize high gamma
-    if gamma <= GAMMA_LOW_THRESHOLD:
-        gamma_component = 1.0 * weights['gamma']
-    elif gamma <= GAMMA_HIGH_THRESHOLD:
-        gamma_component = 0.7 * weights['gamma']
-    else:
-        gamma_component = 0.3 * weights['gamma']
-
-    # Vega: match to IV environment (same as CC logic)
-    if iv_rank > 70 and vega > VEGA_HIGH_THRESHOLD:
-        vega_component = 1.0 * weights['vega']  # High vega in high IV = excellent
-    elif iv_rank > 70 and vega > VEGA_LOW_THRESHOLD:
-        vega_component = 0.8 * weights['vega']
-    elif iv_rank < 30 and vega < VEGA_LOW_THRESHOLD:
-        vega_component = 0.9 * weights['vega']  # Low vega in low IV = good stability
-    else:
-        vega_component = 0.6 * weights['vega']  # Moderate match
+    gamma_component = _GAMMA_COMPONENTS[
+        int(gamma > GAMMA_LOW_THRESHOLD) + (gamma > GAMMA_HIGH_THRESHOLD)
+    ]
+
+    # Vega: match to IV environment
+    vega_component = _VEGA_COMPONENTS[int(iv_rank >= 30) + (iv_rank > 70)][
+        int(vega >= VEGA_LOW_THRESHOLD) + (vega > VEGA_LOW_THRESHOLD) + (vega > VEGA_HIGH_THRESHOLD)
+    ]
 
     # Calculate base score
     base_score = (iv_component + roi_component + margin_component + stability_component +
                   theta_component + gamma_component + vega_component)
 
-    # Apply adjustments
-    final_score = base_score
-
-    # Additional factors from pick data
-    if additional_factors:
-        # Bonus for being in uptrend
-        if additional_factors.get('in_uptrend', False):
-            final_score *= 1.08
-
-        # Bonus for high liquidity
-        if additional_factors.get('oi', 0) > 2000:
-            final_score *= 1.05
-
-        # Penalty for wide spread
-        if additional_factors.get('spread_pct', 0) > 0.07:
-            final_score *= 0.95
-
-        # Bonus for high IV percentile
-        if additional_factors.get('iv_percentile', 0) > 80:
-            final_score *= 1.03
-
-        # Penalty for too close to spot
-        if margin_of_safety < 0.05:
-            final_score *= 0.92
-
-        # Bonus for strong support level nearby
-        if additional_factors.get('near_support', False):
-            final_score *= 1.04
-
-        # Earnings proximity penalty (same as CC)
-        earnings_days_until = additional_factors.get('earnings_days_until', 999)
-        if earnings_days_until < 7:
-            # Severe penalty for earnings within 7 days (high risk)
-            final_score *= 0.50
-        elif earnings_days_until < 14:
-            # Strong penalty for earnings 7-14 days out
-            final_score *= 0.70
-        elif earnings_days_until < 21:
-            # Moderate penalty for earnings 14-21 days out
-            final_score *= 0.85
-        elif earnings_days_until < 30:
-            # Light penalty for earnings 21-30 days out
-            final_score *= 0.93
-
-    # Apply sentiment-based adjustment (v2.7)
-    # For CSPs, we want to sell puts when crowd is pessimistic (LONG signal)
-    if contrarian_signal == 'long':
-        final_score *= 1.10  # 10% boost - crowd fearful, good time to sell puts
-    elif contrarian_signal == 'short':
-        final_score *= 0.90  # 10% penalty - crowd greedy, avoid selling puts
+    # Earnings proximity penalty band (same as CC)
+    if earnings_band is None:
+        earnings_band = bisect_right(EARNINGS_PENALTY_CUTOFFS, earnings_days_until)
+
+    # Apply adjustments as one product (1.0 when inactive)
+    final_score = (
+        base_score
+        * (1.08 if in_uptrend else 1.0)  # In uptrend
+        * (1.05 if oi > 2000 else 1.0)  # High liquidity
+        * (0.95 if spread_pct > 0.07 else 1.0)  # Wide spread
+        * (1.03 if iv_percentile > 80 else 1.0)  # High IV percentile
+        * (0.92 if margin_of_safety < 0.05 else 1.0)  # Too close to spot
+        * (1.04 if near_support else 1.0)  # Strong support level nearby
+        * EARNINGS_PENALTY_MULTIPLIERS[earnings_band]
+        * _CONTRARIAN_MULTIPLIERS.get(contrarian_signal, 1.0)
+    )
 
     # Ensure score stays in bounds
     return max(0.0, min(1.0, final_score))
 
 
+def csp_score_vec(
+    iv_rank: np.ndarray,
+    roi_30d: np.ndarray,
+    margin_of_safety: np.ndarray,
+    trend_stability: np.ndarray,
+    theta_abs: np.ndarray = 0.0,
+    gamma: np.ndarray = 0.0,
+    vega: np.ndarray = 0.0,
+    contrarian_signal: np.ndarray = 'none',
+    in_uptrend: np.ndarray = False,
+    oi: np.ndarray = 0,
+    spread_pct: np.ndarray = 0,
+    iv_percentile: np.ndarray = 50,
+    near_support: np.ndarray = False,
+    earnings_days_until: np.ndarray = 999,
+    earnings_band: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Vectorized csp_score over a batch of contracts.
+
+    Applies the same components and adjustments as score_csp_pick. Every input
+    may be an array (one value per contract) or a scalar shared by all
+    contracts, e.g. per-symbol inputs when scoring a single option chain.
+
+    Args:
+        iv_rank: IV Rank percentages (0-100)
+        roi_30d: 30-day ROIs as decimals
+        margin_of_safety: How far OTM as decimals
+        trend_stability: Trend consistency scores (0 to 1)
+        theta_abs: Absolute thetas (time decay per day)
+        gamma: Gammas
+        vega: Vegas
+        contrarian_signal: Sentiment-based contrarian signals ('long', 'short', 'none')
+        in_uptrend: Whether each stock is in an uptrend
+        oi: Open interest
+        spread_pct: Bid-ask spread as fraction of mid
+        iv_percentile: IV percentiles (0-100)
+        near_support: Whether each strike is near a support level
+        earnings_days_until: Days until next earnings
+        earnings_band: Precomputed earnings penalty bands (see _enrich_pick);
+            derived from earnings_days_until when omitted
+
+    Returns:
+        np.ndarray: Final scores (0 to 1, higher is better)
+    """
+    iv_rank = np.asarray(iv_rank, dtype=np.float64)
+    margin_of_safety = np.asarray(margin_of_safety, dtype=np.float64)
+    theta_abs = np.asarray(theta_abs, dtype=np.float64)
+    gamma = np.asarray(gamma, dtype=np.float64)
+    vega = np.asarray(vega, dtype=np.float64)
+    if earnings_band is None:
+        earnings_band = np.searchsorted(
+            _EARNINGS_PENALTY_CUTOFFS_ARRAY,
+            np.asarray(earnings_days_until, dtype=np.float64),
+            side='right'
+        )
+
+    iv_component = zscore_normalize(iv_rank, *_IV_RANK_NORM) * _W_IV_RANK
+    roi_component = zscore_normalize(np.asarray(roi_30d) * 100, *_ROI_NORM) * _W_ROI_30D
+    margin_component = zscore_normalize(margin_of_safety * 100, *_MARGIN_NORM) * _W_MARGIN_OF_SAFETY
+    stability_component = np.asarray(trend_stability) * _W_TREND_STABILITY
+
+    theta_component = np.minimum(
+        np.minimum(theta_abs / THETA_OPTIMAL_MIN, 1.0),
+        np.maximum(0.3, 1.0 - (theta_abs - THETA_OPTIMAL_MAX) / 0.15)
+    ) * _W_THETA
+
+    gamma_component = _GAMMA_COMPONENTS_ARRAY[
+        (gamma > GAMMA_LOW_THRESHOLD).astype(np.intp) + (gamma > GAMMA_HIGH_THRESHOLD)
+    ]
+
+    vega_component = _VEGA_COMPONENTS_ARRAY[
+        (iv_rank >= 30).astype(np.intp) + (iv_rank > 70),
+        (vega >= VEGA_LOW_THRESHOLD).astype(np.intp) + (vega > VEGA_LOW_THRESHOLD) + (vega > VEGA_HIGH_THRESHOLD)
+    ]
+
+    final_score = (iv_component + roi_component + margin_component + stability_component +
+                   theta_component + gamma_component + vega_component)
+
+    final_score *= np.where(in_uptrend, 1.08, 1.0)
+    final_score *= np.where(np.asarray(oi) > 2000, 1.05, 1.0)
+    final_score *= np.where(np.asarray(spread_pct) > 0.07, 0.95, 1.0)
+    final_score *= np.where(np.asarray(iv_percentile) > 80, 1.03, 1.0)
+    final_score *= np.where(margin_of_safety < 0.05, 0.92, 1.0)
+    final_score *= np.where(near_support, 1.04, 1.0)
+
+    final_score *= _EARNINGS_PENALTY_MULTIPLIERS_ARRAY[earnings_band]
+
+    contrarian_signal = np.asarray(contrarian_signal)
+    final_score *= np.where(
+        contrarian_signal == 'long', _CONTRARIAN_MULTIPLIERS['long'],
+        np.where(contrarian_signal == 'short', _CONTRARIAN_MULTIPLIERS['short'], 1.0)
+    )
+
+    np.maximum(final_score, 0.0, out=final_score)
+    return np.minimum(final_score, 1.0, out=final_score)
+
+
+def _is_near_support(strike: float, support_level: float) -> bool:
+    """Whether the strike is within 2% of the support level (0 means unknown)."""
+    return bool(support_level and strike and abs(strike - support_level) / support_level < 0.02)
+
+
+def _enrich_pick(pick: Dict[str, Any]) -> None:
+    """
+    Cache the derived scoring inputs on a pick so re-scoring skips them.
+
+    Sets '_near_support' and '_earnings_band' (index into
+    EARNINGS_PENALTY_MULTIPLIERS).
+
+    Args:
+        pick: Pick dictionary from screener (modified in place)
+    """
+    pick['_near_support'] = _is_near_support(pick.get('strike', 0), pick.get('support_level', 0))
+    pick['_earnings_band'] = bisect_right(EARNINGS_PENALTY_CUTOFFS, pick.get('earnings_days_until', 999))
+
+
 def score_csp_pick(pick: Dict[str, Any]) -> float:
     """
     Score a cash-secured put pick using all available data.
@@ -184,155 +371,198 @@ def score_csp_pick(pick: Dict[str, Any]) -> float:
     Returns:
         float: Score between 0 and 1
     """
-    # Extract main scoring inputs
-    iv_rank = pick.get('iv_rank', 50)
-    roi_30d = pick.get('roi_30d', 0.01)
-    margin_of_safety = pick.get('margin_of_safety', 0.07)
-    trend_stability = pick.get('trend_stability', 0.5)
-    contrarian_signal = pick.get('contrarian_signal', 'none')
-
-    # Extract Greeks
-    theta = pick.get('theta', 0.0)
-    gamma = pick.get('gamma', 0.0)
-    vega = pick.get('vega', 0.0)
-
-    # Check if near support
-    strike = pick.get('strike', 0)
-    support_level = pick.get('support_level', 0)
-    near_support = False
-    if support_level and strike:
-        # Consider "near support" if strike is within 2% of support
-        near_support = abs(strike - support_level) / support_level < 0.02
-
-    # Prepare additional factors
-    additional = {
-        'in_uptrend': pick.get('in_uptrend', False),
-        'oi': pick.get('oi', 0),
-        'spread_pct': pick.get('spread_pct', 0),
-        'iv_percentile': pick.get('iv_percentile', 50),
-        'near_support': near_support,
-        'earnings_days_until': pick.get('earnings_days_until', 999),
-        'hv_60': pick.get('hv_60', 0),
-        'volume': pick.get('volume', 0)
-    }
+    # Check if near support (reuse the flag cached by _enrich_pick, if any)
+    near_support = pick.get('_near_support')
+    if near_support is None:
+        near_support = _is_near_support(pick.get('strike', 0), pick.get('support_level', 0))
+
+    return csp_score(
+        iv_rank=pick.get('iv_rank', 50),
+        roi_30d=pick.get('roi_30d', 0.01),
+        margin_of_safety=pick.get('margin_of_safety', 0.07),
+        trend_stability=pick.get('trend_stability', 0.5),
+        theta_abs=abs(pick.get('theta', 0.0)),
+        gamma=pick.get('gamma', 0.0),
+        vega=pick.get('vega', 0.0),
+        contrarian_signal=pick.get('contrarian_signal', 'none'),
+        in_uptrend=pick.get('in_uptrend', False),
+        oi=pick.get('oi', 0),
+        spread_pct=pick.get('spread_pct', 0),
+        iv_percentile=pick.get('iv_percentile', 50),
+        near_support=near_support,
+        earnings_days_until=pick.get('earnings_days_until', 999),
+        earnings_band=pick.get('_earnings_band')
+    )
 
-    # Calculate score
-    score = csp_score(
-        iv_rank=iv_rank,
-        roi_30d=roi_30d,
-        margin_of_safety=margin_of_safety,
-        trend_stability=trend_stability,
-        theta=theta,
-        gamma=gamma,
-        vega=vega,
-        contrarian_signal=contrarian_signal,
-        additional_factors=additional
+
+def score_csp_table(table: PickTable) -> np.ndarray:
+    """
+    Score every row of a CSP pick table in one vectorized pass.
+
+    Args:
+        table: PickTable built with CSP_PICK_COLUMNS
+
+    Returns:
+        np.ndarray: Scores between 0 and 1, in table order
+    """
+    return csp_score_vec(
+        iv_rank=table['iv_rank'],
+        roi_30d=table['roi_30d'],
+        margin_of_safety=table['margin_of_safety'],
+        trend_stability=table['trend_stability'],
+        theta_abs=np.abs(table['theta']),
+        gamma=table['gamma'],
+        vega=table['vega'],
+        contrarian_signal=table['contrarian_signal'],
+        in_uptrend=table['in_uptrend'],
+        oi=table['oi'],
+        spread_pct=table['spread_pct'],
+        iv_percentile=table['iv_percentile'],
+        near_support=table['_near_support'],
+        earnings_band=table['_earnings_band']
     )
 
-    return score
 
+def score_csp_picks(picks: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Score a batch of cash-secured put picks in one vectorized pass.
 
-def rank_csp_picks(picks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    Args:
+        picks: List of pick dictionaries from screener
+
+    Returns:
+        np.ndarray: Scores between 0 and 1, in the order of picks
+    """
+    return score_csp_table(_csp_table(picks))
+
+
+def _csp_table(picks: List[Dict[str, Any]]) -> PickTable:
+    """
+    Build the columnar table scored by score_csp_table.
+
+    Derived flags are cached on each pick (see _enrich_pick) before the
+    table is built, so re-ranking skips them.
+    """
+    for pick in picks:
+        if '_near_support' not in pick:
+            _enrich_pick(pick)
+
+    return PickTable.from_dicts(picks, CSP_PICK_COLUMNS)
+
+
+def rank_csp_picks(picks: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Score and rank multiple cash-secured put picks.
 
+    Picks are converted to a columnar PickTable once; scoring and the ranking
+    permutation both operate on its columns.
+
     Args:
         picks: List of pick dictionaries from screener
+        top_k: If set, only the top_k picks are ranked and returned (as a new
+            list, leaving picks in place) without sorting the whole list
 
     Returns:
-        List[Dict]: Picks with scores added, sorted by score descending
+        List[Dict]: Picks with scores and ranks added, sorted by score descending
     """
-    # Score each pick
-    for pick in picks:
-        pick['score'] = score_csp_pick(pick)
+    if not picks:
+        return picks
+
+    table = _csp_table(picks)
+    table['score'] = score_csp_table(table)
 
-    # Sort by score (highest first)
-    picks.sort(key=lambda x: x['score'], reverse=True)
+    # Highest score first; ties keep their input order
+    ranked = table.take(ranked_indices(table['score'], top_k))
+    ranked['rank'] = np.arange(1, len(ranked) + 1)
+    ranked_picks = ranked.to_dicts(('score', 'rank'))
 
-    # Add rank
-    for i, pick in enumerate(picks, 1):
-        pick['rank'] = i
+    if top_k is not None:
+        return ranked_picks
 
+    picks[:] = ranked_picks
     return picks
 
 
-def explain_csp_score(pick: Dict[str, Any]) -> str:
+def explain_csp_score_components(pick: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Generate human-readable explanation of score components.
+    Classify a pick's score components without building any text.
+
+    Cheap enough to run for every ranked pick; pass the result to
+    format_csp_explanation only for the picks actually displayed.
 
     Args:
         pick: Pick dictionary with score
 
     Returns:
-        str: Explanation of score calculation
+        Dict: Score, IV rank/ROI/margin/stability values with their tier
+        labels, and a tuple of bonus/warning notes
     """
-    score = pick.get('score', 0)
     iv_rank = pick.get('iv_rank', 50)
     roi_30d = pick.get('roi_30d', 0.01)
     margin_of_safety = pick.get('margin_of_safety', 0.07)
     trend_stability = pick.get('trend_stability', 0.5)
 
-    explanation = f"Score: {score:.2f}\n"
-    explanation += f"Components:\n"
-
-    # IV Rank assessment
-    explanation += f"  • IV Rank ({iv_rank:.0f}%): "
-    if iv_rank > 70:
-        explanation += "Excellent volatility premium\n"
-    elif iv_rank > 55:
-        explanation += "Good volatility environment\n"
-    else:
-        explanation += "Adequate volatility\n"
-
-    # ROI assessment
-    explanation += f"  • ROI ({roi_30d:.2%}/month): "
-    if roi_30d > 0.018:
-        explanation += "Outstanding returns\n"
-    elif roi_30d > 0.012:
-        explanation += "Strong returns\n"
-    else:
-        explanation += "Acceptable returns\n"
-
-    # Margin of safety assessment
-    explanation += f"  • Margin ({margin_of_safety:.1%} OTM): "
-    if margin_of_safety > 0.10:
-        explanation += "Excellent safety buffer\n"
-    elif margin_of_safety > 0.07:
-        explanation += "Good downside protection\n"
-    elif margin_of_safety > 0.05:
-        explanation += "Adequate protection\n"
-    else:
-        explanation += "Limited protection\n"
-
-    # Trend stability assessment
-    explanation += f"  • Stability ({trend_stability:.1f}): "
-    if trend_stability > 0.7:
-        explanation += "Very stable trend\n"
-    elif trend_stability > 0.5:
-        explanation += "Moderate stability\n"
-    else:
-        explanation += "Volatile price action\n"
-
-    # Add bonuses/warnings
+    notes = []
     if pick.get('in_uptrend'):
-        explanation += "  • Bonus: Stock in uptrend\n"
+        notes.append("Bonus: Stock in uptrend")
     if pick.get('oi', 0) > 2000:
-        explanation += "  • Bonus: Excellent liquidity\n"
+        notes.append("Bonus: Excellent liquidity")
     if margin_of_safety < 0.05:
-        explanation += "  • Warning: Close to spot price\n"
+        notes.append("Warning: Close to spot price")
+    earnings_note = _EARNINGS_NOTES[
+        bisect_right(EARNINGS_PENALTY_CUTOFFS, pick.get('earnings_days_until', 999))
+    ]
+    if earnings_note:
+        notes.append(earnings_note)
+
+    return {
+        'score': pick.get('score', 0),
+        'iv_rank': iv_rank,
+        'iv_rank_label': _label(iv_rank, _IV_LABELS),
+        'roi_30d': roi_30d,
+        'roi_label': _label(roi_30d, _ROI_LABELS),
+        'margin_of_safety': margin_of_safety,
+        'margin_label': _label(margin_of_safety, _MARGIN_LABELS),
+        'trend_stability': trend_stability,
+        'stability_label': _label(trend_stability, _STABILITY_LABELS),
+        'notes': tuple(notes)
+    }
 
-    # Earnings warnings
-    earnings_days = pick.get('earnings_days_until', 999)
-    if earnings_days < 7:
-        explanation += "  • ⚠️ SEVERE: Earnings in <7 days (-50%)\n"
-    elif earnings_days < 14:
-        explanation += "  • ⚠️ WARNING: Earnings in 7-14 days (-30%)\n"
-    elif earnings_days < 21:
-        explanation += "  • ⚠️ Caution: Earnings in 14-21 days (-15%)\n"
-    elif earnings_days < 30:
-        explanation += "  • ⚠️ Note: Earnings in 21-30 days (-7%)\n"
 
-    return explanation
+def format_csp_explanation(components: Dict[str, Any]) -> str:
+    """
+    Render explain_csp_score_components output as human-readable text.
+
+    Args:
+        components: Dict from explain_csp_score_components
+
+    Returns:
+        str: Explanation of score calculation
+    """
+    parts = [
+        f"Score: {components['score']:.2f}",
+        "Components:",
+        f"  • IV Rank ({components['iv_rank']:.0f}%): {components['iv_rank_label']}",
+        f"  • ROI ({components['roi_30d']:.2%}/month): {components['roi_label']}",
+        f"  • Margin ({components['margin_of_safety']:.1%} OTM): {components['margin_label']}",
+        f"  • Stability ({components['trend_stability']:.1f}): {components['stability_label']}"
+    ]
+    parts.extend(f"  • {note}" for note in components['notes'])
+    parts.append("")
+    return "\n".join(parts)
+
+
+def explain_csp_score(pick: Dict[str, Any]) -> str:
+    """
+    Generate human-readable explanation of score components.
+
+    Args:
+        pick: Pick dictionary with score
+
+    Returns:
+        str: Explanation of score calculation
+    """
+    return format_csp_explanation(explain_csp_score_components(pick))
 
 
 def compare_csp_picks(pick1: Dict[str, Any], pick2: Dict[str, Any]) -> str:
@@ -349,37 +579,40 @@ def compare_csp_picks(pick1: Dict[str, Any], pick2: Dict[str, Any]) -> str:
     score1 = pick1.get('score', 0)
     score2 = pick2.get('score', 0)
 
-    comparison = f"Comparing {pick1['symbol']} vs {pick2['symbol']}:\n"
-    comparison += f"  {pick1['symbol']}: Score {score1:.2f}\n"
-    comparison += f"  {pick2['symbol']}: Score {score2:.2f}\n\n"
-
-    # Compare key metrics
-    comparison += "Key differences:\n"
+    parts = [
+        f"Comparing {pick1['symbol']} vs {pick2['symbol']}:",
+        f"  {pick1['symbol']}: Score {score1:.2f}",
+        f"  {pick2['symbol']}: Score {score2:.2f}",
+        "",
+        # Compare key metrics
+        "Key differences:",
+    ]
 
     # IV Rank
     iv_diff = pick1['iv_rank'] - pick2['iv_rank']
     if abs(iv_diff) > 10:
         winner = pick1['symbol'] if iv_diff > 0 else pick2['symbol']
-        comparison += f"  • IV Rank: {winner} has {abs(iv_diff):.0f}% higher IV\n"
+        parts.append(f"  • IV Rank: {winner} has {abs(iv_diff):.0f}% higher IV")
 
     # ROI
     roi_diff = pick1['roi_30d'] - pick2['roi_30d']
     if abs(roi_diff) > 0.002:
         winner = pick1['symbol'] if roi_diff > 0 else pick2['symbol']
-        comparison += f"  • ROI: {winner} offers {abs(roi_diff):.2%} better returns\n"
+        parts.append(f"  • ROI: {winner} offers {abs(roi_diff):.2%} better returns")
 
     # Margin of safety
     margin_diff = pick1['margin_of_safety'] - pick2['margin_of_safety']
     if abs(margin_diff) > 0.02:
         winner = pick1['symbol'] if margin_diff > 0 else pick2['symbol']
-        comparison += f"  • Safety: {winner} is {abs(margin_diff):.1%} further OTM\n"
+        parts.append(f"  • Safety: {winner} is {abs(margin_diff):.1%} further OTM")
 
     # Overall winner
+    parts.append("")
     if score1 > score2:
-        comparison += f"\nRecommendation: {pick1['symbol']} (higher overall score)"
+        parts.append(f"Recommendation: {pick1['symbol']} (higher overall score)")
     elif score2 > score1:
-        comparison += f"\nRecommendation: {pick2['symbol']} (higher overall score)"
+        parts.append(f"Recommendation: {pick2['symbol']} (higher overall score)")
     else:
-        comparison += f"\nRecommendation: Both equally attractive"
+        parts.append("Recommendation: Both equally attractive")
 
-    return comparison
\ No newline at end of file
+    return "\n".join(parts)
\ No newline at end of file
@@ -40,21 +40,26 @@ def select_csp_contract(
     """
     logger = get_logger()
 
-    # Filter for puts only
-    puts = [opt for opt in options_chain if opt['side'] == 'put']
-
-    if not puts:
-        logger.debug("No put options available")
-        return None
-
     # Apply filters
     min_delta, max_delta = delta_range  # Note: these are negative for puts
     min_dte, max_dte = dte_range
+    # Bound once as locals so the per-contract checks avoid global lookups
+    min_oi, min_vol, max_spread = MIN_OPTION_OI, MIN_OPTION_VOLUME, MAX_SPREAD_PCT
+
+    # Single pass over the chain, keeping only the best-scoring put so far.
+    # Score = 70% ROI + 30% margin of safety, each normalized to 0-1
+    # assuming a 30% max annual ROI and a 15% max margin of safety.
+    best_put = None
+    best_score = 0.0
+    has_puts = False
+    for put in options_chain:
+        if put['side'] != 'put':
+            continue
+        has_puts = True
 
-    suitable_puts = []
-    for put in puts:
         # Check DTE
-        if not (min_dte <= put['dte'] <= max_dte):
+        dte = put['dte']
+        if not (min_dte <= dte <= max_dte):
             continue
 
         # Check delta (negative for puts, so we need to handle the comparison correctly)
@@ -64,44 +69,41 @@ def select_csp_contract(
             continue
 
         # Check liquidity
-        if put.get('oi', 0) < MIN_OPTION_OI:
+        if put.get('oi', 0) < min_oi:
             continue
-        if put.get('vol', 0) < MIN_OPTION_VOLUME:
+        if put.get('vol', 0) < min_vol:
             continue
 
         # Check spread
         spread = calculate_spread_percentage(put['bid'], put['ask'])
-        if spread > MAX_SPREAD_PCT:
+        if spread > max_spread:
             continue
 
         # Calculate ROI for this contract
-        premium = put['mid']
         strike = put['strike']
-        roi_period = calculate_roi(premium, strike, put['dte'])  # ROI based on strike for CSP
-        roi_annual = annualize_return(roi_period, put['dte'])
+        roi_period = calculate_roi(put['mid'], strike, dte)  # ROI based on strike for CSP
+        roi_annual = annualize_return(roi_period, dte)
 
         # Calculate margin of safety (how far OTM)
         margin_of_safety = calculate_margin_of_safety(spot_price, strike)
 
-        put['roi_period'] = roi_period
-        put['roi_annual'] = roi_annual
-        put['spread_pct'] = spread
-        put['margin_of_safety'] = margin_of_safety
+        score = 0.7 * (roi_annual / 0.30) + 0.3 * (margin_of_safety / 0.15)
+        if best_put is None or score > best_score:
+            best_put = put
+            best_score = score
+            best_fields = (roi_period, roi_annual, spread, margin_of_safety)
 
-        suitable_puts.append(put)
+    if not has_puts:
+        logger.debug("No put options available")
+        return None
 
-    if not suitable_puts:
+    if best_put is None:
         logger.debug("No suitable put contracts after filtering")
         return None
 
-    # Select best contract (balance of ROI and safety)
-    # Score = 70% ROI + 30% margin of safety
-    def score_put(put):
-        roi_score = put['roi_annual'] / 0.30  # Normalize to 0-1 assuming 30% max
-        safety_score = put['margin_of_safety'] / 0.15  # Normalize to 0-1 assuming 15% max
-        return 0.7 * roi_score + 0.3 * safety_score
-
-    best_put = max(suitable_puts, key=score_put)
+    # Only the selected contract gets the derived fields attached
+    (best_put['roi_period'], best_put['roi_annual'],
+     best_put['spread_pct'], best_put['margin_of_safety']) = best_fields
 
     logger.debug(f"Selected put: Strike={best_put['strike']}, "
                 f"Delta={best_put['delta']:.2f}, "
@@ -164,13 +166,6 @@ def screen_csp(
         log_screening_result(symbol, "CSP", "failed - earnings too close")
         return None
 
-    # 5. Trend assessment (not exclusion, but affects scoring)
-    in_uptrend = False
-    if sma20 and sma50 and sma200:
-        in_uptrend = sma20 > sma50 > sma200
-
-    support_level = sma200 if sma200 else sma50 if sma50 else None
-
     # Select optimal contract
     best_contract = select_csp_contract(options_chain, spot_price)
 
@@ -185,6 +180,13 @@ def screen_csp(
                            f"target {CSP_ANNUALIZED_TARGET:.2%}")
         return None
 
+    # 5. Trend assessment (not exclusion, but affects scoring)
+    in_uptrend = False
+    if sma20 and sma50 and sma200:
+        in_uptrend = sma20 > sma50 > sma200
+
+    support_level = sma200 if sma200 else sma50 if sma50 else None
+
     # Build pick result
     pick = {
         'symbol': symbol,
@@ -219,33 +221,33 @@ def screen_csp(
         'trend_stability': trend_stability,
         'trend_strength': price_data.get('trend_strength', 0),
         'selected_option': f"PUT {best_contract['strike']} {best_contract['expiry']}",
-        'notes': []
     }
 
     # Add notes based on conditions
+    notes = []
     if pick['margin_of_safety'] > 0.10:
-        pick['notes'].append(f"✅ {pick['margin_of_safety']:.1%} OTM")
+        notes.append(f"✅ {pick['margin_of_safety']:.1%} OTM")
     elif pick['margin_of_safety'] > 0.05:
-        pick['notes'].append(f"⚠️ Only {pick['margin_of_safety']:.1%} OTM")
+        notes.append(f"⚠️ Only {pick['margin_of_safety']:.1%} OTM")
 
     if iv_rank > 70:
-        pick['notes'].append("🔥 High IV rank")
+        notes.append("🔥 High IV rank")
     if pick['roi_annual'] > 0.18:
-        pick['notes'].append("💰 Excellent ROI")
+        notes.append("💰 Excellent ROI")
     if pick['oi'] > 1000:
-        pick['notes'].append("💧 High liquidity")
+        notes.append("💧 High liquidity")
     if in_uptrend:
-        pick['notes'].append("📈 Uptrend")
+        notes.append("📈 Uptrend")
     if trend_stability > 0.7:
-        pick['notes'].append("🎯 Stable trend")
+        notes.append("🎯 Stable trend")
 
     # Warning notes
     if pick['spread_pct'] > 0.05:
-        pick['notes'].append(f"⚠️ Wide spread {pick['spread_pct']:.1%}")
+        notes.append(f"⚠️ Wide spread {pick['spread_pct']:.1%}")
     if not in_uptrend:
-        pick['notes'].append("📉 Not in uptrend")
+        notes.append("📉 Not in uptrend")
 
-    pick['notes'] = '; '.join(pick['notes']) if pick['notes'] else "Standard setup"
+    pick['notes'] = '; '.join(notes) if notes else "Standard setup"
 
     log_screening_result(symbol, "CSP", "passed")
 
@@ -291,6 +293,6 @@ def screen_multiple_csp(
             picks.append(pick)
 
     # Sort by combined score (ROI and margin of safety)
-    picks.sort(key=lambda x: x['roi_annual'] * 0.7 + x.get('margin_of_safety', 0) * 3.0, reverse=True)
+    picks.sort(key=lambda x: x['roi_annual'] * 0.7 + x['margin_of_safety'] * 3.0, reverse=True)
 
     return picks
\ No newline at end of file
@@ -5,6 +5,7 @@ Identifies profitable call options to sell against stock positions.
 Python 3.12 compatible following CLAUDE.md standards.
 """
 
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
 from datetime import date
 from ..constants import (
@@ -40,21 +41,24 @@ def select_cc_contract(
     """
     logger = get_logger()
 
-    # Filter for calls only
-    calls = [opt for opt in options_chain if opt['side'] == 'call']
-
-    if not calls:
-        logger.debug("No call options available")
-        return None
-
     # Apply filters
     min_delta, max_delta = delta_range
     min_dte, max_dte = dte_range
+    # Bound once as locals so the per-contract checks avoid global lookups
+    min_oi, min_vol, max_spread = MIN_OPTION_OI, MIN_OPTION_VOLUME, MAX_SPREAD_PCT
+
+    # Single pass over the chain, keeping the highest annualized ROI so far
+    best_call = None
+    best_roi = 0.0
+    has_calls = False
+    for call in options_chain:
+        if call['side'] != 'call':
+            continue
+        has_calls = True
 
-    suitable_calls = []
-    for call in calls:
         # Check DTE
-        if not (min_dte <= call['dte'] <= max_dte):
+        dte = call['dte']
+        if not (min_dte <= dte <= max_dte):
             continue
 
         # Check delta (positive for calls)
@@ -62,33 +66,36 @@ def select_cc_contract(
             continue
 
         # Check liquidity
-        if call.get('oi', 0) < MIN_OPTION_OI:
+        if call.get('oi', 0) < min_oi:
             continue
-        if call.get('vol', 0) < MIN_OPTION_VOLUME:
+        if call.get('vol', 0) < min_vol:
             continue
 
         # Check spread
         spread = calculate_spread_percentage(call['bid'], call['ask'])
-        if spread > MAX_SPREAD_PCT:
+        if spread > max_spread:
             continue
 
         # Calculate ROI for this contract
-        premium = call['mid']
-        roi_period = calculate_roi(premium, spot_price, call['dte'])
-        roi_annual = annualize_return(roi_period, call['dte'])
+        roi_period = calculate_roi(call['mid'], spot_price, dte)
+        roi_annual = annualize_return(roi_period, dte)
 
-        call['roi_period'] = roi_period
-        call['roi_annual'] = roi_annual
-        call['spread_pct'] = spread
+        if best_call is None or roi_annual > best_roi:
+            best_call = call
+            best_roi = roi_annual
+            best_fields = (roi_period, spread)
 
-        suitable_calls.append(call)
+    if not has_calls:
+        logger.debug("No call options available")
+        return None
 
-    if not suitable_calls:
+    if best_call is None:
         logger.debug("No suitable call contracts after filtering")
         return None
 
-    # Select best contract (highest annualized ROI)
-    best_call = max(suitable_calls, key=lambda x: x['roi_annual'])
+    # Only the selected contract gets the derived fields attached
+    best_call['roi_period'], best_call['spread_pct'] = best_fields
+    best_call['roi_annual'] = best_roi
 
     logger.debug(f"Selected call: Strike={best_call['strike']}, "
                 f"Delta={best_call['delta']:.2f}, "
@@ -144,6 +151,22 @@ def screen_cc(
         log_screening_result(symbol, "CC", f"failed - HV60 {hv_60:.2%} too high")
         return None
 
+    # Select optimal contract
+    best_contract = select_cc_contract(options_chain, spot_price)
+
+    if not best_contract:
+        log_screening_result(symbol, "CC", "failed - no suitable contracts")
+        return None
+
+    # Check if ROI meets target
+    if best_contract['roi_annual'] < CC_ANNUALIZED_TARGET:
+        log_screening_result(symbol, "CC",
+                           f"failed - ROI {best_contract['roi_annual']:.2%} < "
+                           f"target {CC_ANNUALIZED_TARGET:.2%}")
+        return None
+
+    # Warning-only checks, evaluated once the symbol has passed every exclusion
+
     # 4. Trend filter (warning only, not exclusion)
     trend_warning = False
     if sma20 and sma50:
@@ -162,20 +185,6 @@ def screen_cc(
     if near_earnings:
         logger.debug(f"{symbol}: Warning - earnings within 10 days")
 
-    # Select optimal contract
-    best_contract = select_cc_contract(options_chain, spot_price)
-
-    if not best_contract:
-        log_screening_result(symbol, "CC", "failed - no suitable contracts")
-        return None
-
-    # Check if ROI meets target
-    if best_contract['roi_annual'] < CC_ANNUALIZED_TARGET:
-        log_screening_result(symbol, "CC",
-                           f"failed - ROI {best_contract['roi_annual']:.2%} < "
-                           f"target {CC_ANNUALIZED_TARGET:.2%}")
-        return None
-
     # Build pick result
     pick = {
         'symbol': symbol,
@@ -209,28 +218,28 @@ def screen_cc(
         'near_earnings': near_earnings,
         'trend_strength': price_data.get('trend_strength', 0),
         'selected_option': f"CALL {best_contract['strike']} {best_contract['expiry']}",
-        'notes': []
     }
 
     # Add warning notes
+    notes = []
     if trend_warning:
-        pick['notes'].append("⚠️ Negative trend")
+        notes.append("⚠️ Negative trend")
     if below_200sma:
-        pick['notes'].append("🟡 Below 200 SMA")
+        notes.append("🟡 Below 200 SMA")
     if near_earnings:
-        pick['notes'].append("📅 Earnings soon")
+        notes.append("📅 Earnings soon")
     if pick['spread_pct'] > 0.05:
-        pick['notes'].append(f"💧 Wide spread {pick['spread_pct']:.1%}")
+        notes.append(f"💧 Wide spread {pick['spread_pct']:.1%}")
 
     # Add positive notes
     if iv_rank > 70:
-        pick['notes'].append("🔥 High IV rank")
+        notes.append("🔥 High IV rank")
     if pick['roi_annual'] > 0.20:
-        pick['notes'].append("💰 Excellent ROI")
+        notes.append("💰 Excellent ROI")
     if pick['oi'] > 1000:
-        pick['notes'].append("💧 High liquidity")
+        notes.append("💧 High liquidity")
 
-    pick['notes'] = '; '.join(pick['notes']) if pick['notes'] else "Standard setup"
+    pick['notes'] = '; '.join(notes) if notes else "Standard setup"
 
     log_screening_result(symbol, "CC", "passed")
 
@@ -276,6 +285,6 @@ def screen_multiple_cc(
             picks.append(pick)
 
     # Sort by ROI (will be re-sorted by score later)
-    picks.sort(key=lambda x: x['roi_annual'], reverse=True)
+    picks.sort(key=itemgetter('roi_annual'), reverse=True)
 
     return picks
@@ -13,15 +13,50 @@ Author: Options Income Screener v2.7
 """
 
 import logging
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 
-from ..data.sentiment_aggregator import SentimentMetrics
+import numpy as np
+
+from ..data.sentiment_aggregator import SentimentMetrics, SentimentMetricsTable
+from ..utils.math import ranked_indices
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _ranking_scores(table: SentimentMetricsTable, indices: Sequence[int]) -> np.ndarray:
+    """
+    Composite opportunity scores used to rank divergent symbols.
+
+    Args:
+        table: Sentiment columns for the universe
+        indices: Row indices of the symbols to score
+
+    Returns:
+        Array of ranking scores (higher is a stronger opportunity)
+    """
+    signal = table.contrarian_signal[indices]
+
+    # Component 1: Contrarian signal (highest weight)
+    score = np.where((signal == 'long') | (signal == 'short'), 50.0, 0.0)
+
+    # Component 2: Sentiment extremeness
+    # Distance from neutral (0.5)
+    score += table.sentiment_extremeness[indices] * 30.0
+
+    # Component 3: P/C ratio divergence magnitude
+    score += table.pc_divergence[indices] * 10.0
+
+    # Component 4: CMF magnitude
+    score += table.cmf_magnitude[indices] * 10.0
+
+    # Component 5: Data quality bonus
+    score += np.where(table.data_quality[indices] == 'complete', 5.0, 0.0)
+
+    return score
+
+
+@dataclass(slots=True, frozen=True)
 class FilterConfig:
     """Configuration for sentiment filtering."""
 
@@ -64,13 +99,14 @@ class SentimentFilter:
 
     def apply_two_step_filter(
         self,
-        sentiment_metrics: Dict[str, SentimentMetrics]
+        sentiment_metrics: Union[Dict[str, SentimentMetrics], SentimentMetricsTable]
     ) -> Tuple[List[str], Dict[str, str]]:
         """
         Apply two-step sentiment filter to symbol universe.
 
         Args:
-            sentiment_metrics: Dictionary mapping symbol to SentimentMetrics
+            sentiment_metrics: Dictionary mapping symbol to SentimentMetrics, or a
+                SentimentMetricsTable already built from one
 
         Returns:
             Tuple of:
@@ -83,35 +119,44 @@ class SentimentFilter:
             >>> for symbol in filtered_symbols:
             ...     print(f"  {symbol}: {reasons[symbol]}")
         """
+        is_table = isinstance(sentiment_metrics, SentimentMetricsTable)
+
         if not self.config.enabled:
             logger.info("Sentiment filter disabled - returning all symbols")
+            if is_table:
+                return sentiment_metrics.symbols.tolist(), {}
             return list(sentiment_metrics.keys()), {}
 
         logger.info(f"Applying two-step sentiment filter to {len(sentiment_metrics)} symbols")
 
+        # Walk the metrics once; every step below works on row indices
+        table = sentiment_metrics if is_table else SentimentMetricsTable.from_metrics(sentiment_metrics)
+
         # Filter Step 1: Extreme sentiment
-        step1_symbols = self._filter_step1_extreme_sentiment(sentiment_metrics)
-        logger.info(f"Step 1 (extreme sentiment): {len(step1_symbols)} symbols pass")
+        step1_indices = self._filter_step1_extreme_sentiment(table)
+        logger.info(f"Step 1 (extreme sentiment): {len(step1_indices)} symbols pass")
 
         # Filter Step 2: Divergent price action
-        step2_symbols, reasons = self._filter_step2_divergent_action(
-            sentiment_metrics,
-            step1_symbols
+        step2_indices, reasons = self._filter_step2_divergent_action(
+            table,
+            step1_indices
         )
-        logger.info(f"Step 2 (divergent action): {len(step2_symbols)} symbols pass")
+        logger.info(f"Step 2 (divergent action): {len(step2_indices)} symbols pass")
 
         # Limit to max symbols
-        if len(step2_symbols) > self.config.max_symbols_to_screen:
+        if len(step2_indices) > self.config.max_symbols_to_screen:
             logger.info(
-                f"Limiting from {len(step2_symbols)} to "
+                f"Limiting from {len(step2_indices)} to "
                 f"{self.config.max_symbols_to_screen} symbols"
             )
-            step2_symbols = self._rank_and_limit(
-                sentiment_metrics,
-                step2_symbols,
+            step2_indices = self._rank_and_limit(
+                table,
+                step2_indices,
                 self.config.max_symbols_to_screen
             )
 
+        step2_symbols = table.symbols[step2_indices].tolist()
+
         logger.info(
             f"Two-step filter complete: {len(step2_symbols)} symbols selected "
             f"for detailed screening"
@@ -121,8 +166,8 @@ class SentimentFilter:
 
     def _filter_step1_extreme_sentiment(
         self,
-        sentiment_metrics: Dict[str, SentimentMetrics]
-    ) -> List[str]:
+        table: SentimentMetricsTable
+    ) -> np.ndarray:
         """
         Step 1: Filter for symbols with extreme sentiment.
 
@@ -132,53 +177,39 @@ class SentimentFilter:
         - OR explicit extreme flags from sentiment aggregator
 
         Args:
-            sentiment_metrics: Dictionary of sentiment data
+            table: Sentiment columns for the universe
 
         Returns:
-            List of symbols with extreme sentiment
+            Row indices of symbols with extreme sentiment
         """
-        extreme_symbols = []
         cutoff = self.config.sentiment_percentile_cutoff
+        rank = table.sentiment_rank
+        pc_ratio = table.put_call_ratio_volume
+        extreme_flag = table.sentiment_extreme
 
-        for symbol, metrics in sentiment_metrics.items():
-            # Skip insufficient data
-            if metrics.data_quality == 'insufficient':
-                continue
-
+        extreme = (
             # Check 1: Percentile rank extremes
-            if metrics.sentiment_rank >= cutoff or metrics.sentiment_rank <= (100 - cutoff):
-                extreme_symbols.append(symbol)
-                logger.debug(
-                    f"{symbol}: Extreme sentiment - {metrics.sentiment_rank}th percentile"
-                )
-                continue
-
+            (rank >= cutoff) | (rank <= (100 - cutoff))
             # Check 2: Explicit extreme sentiment flag
-            if metrics.sentiment_extreme in ['negative', 'positive']:
-                extreme_symbols.append(symbol)
-                logger.debug(
-                    f"{symbol}: Extreme sentiment flag - {metrics.sentiment_extreme}"
-                )
-                continue
+            | (extreme_flag == 'negative') | (extreme_flag == 'positive')
+            # Check 3: Put/Call ratio extremes (a zero ratio counts as missing)
+            | ((pc_ratio != 0) & (
+                (pc_ratio >= self.config.putcall_extreme_high) |
+                (pc_ratio <= self.config.putcall_extreme_low)
+            ))
+        )
 
-            # Check 3: Put/Call ratio extremes (direct threshold check)
-            if metrics.put_call_ratio_volume:
-                pc_ratio = metrics.put_call_ratio_volume
-                if pc_ratio >= self.config.putcall_extreme_high or \
-                   pc_ratio <= self.config.putcall_extreme_low:
-                    extreme_symbols.append(symbol)
-                    logger.debug(
-                        f"{symbol}: Extreme P/C ratio - {pc_ratio:.2f}"
-                    )
-                    continue
+        # Skip insufficient data
+        extreme_indices = np.flatnonzero(extreme & (table.data_quality != 'insufficient'))
+        logger.debug("Step 1 extreme sentiment symbols: %s", table.symbols[extreme_indices])
 
-        return extreme_symbols
+        return extreme_indices
 
     def _filter_step2_divergent_action(
         self,
-        sentiment_metrics: Dict[str, SentimentMetrics],
-        step1_symbols: List[str]
-    ) -> Tuple[List[str], Dict[str, str]]:
+        table: SentimentMetricsTable,
+        step1_indices: np.ndarray
+    ) -> Tuple[List[int], Dict[str, str]]:
         """
         Step 2: Filter for divergent price action (sentiment vs money flow).
 
@@ -189,71 +220,82 @@ class SentimentFilter:
         This is the KEY to contrarian edge: Crowd is wrong, smart money knows it.
 
         Args:
-            sentiment_metrics: Dictionary of sentiment data
-            step1_symbols: Symbols that passed Step 1
+            table: Sentiment columns for the universe
+            step1_indices: Row indices of symbols that passed Step 1
 
         Returns:
             Tuple of:
-            - List of symbols with divergent action
+            - Row indices of symbols with divergent action
             - Dictionary mapping symbol to divergence reason
         """
-        divergent_symbols = []
-        reasons = {}
+        pc_ratio = table.put_call_ratio_volume[step1_indices]
+        cmf = table.cmf_20[step1_indices]
+        cmf_threshold = self.config.cmf_divergence_threshold
+
+        # Need both CMF and P/C ratio for divergence check; missing values are
+        # NaN and fail every comparison below
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Step 2: skipping %d symbols missing CMF or P/C data",
+                np.count_nonzero(np.isnan(pc_ratio) | np.isnan(cmf))
+            )
 
-        for symbol in step1_symbols:
-            metrics = sentiment_metrics[symbol]
+        # Divergence Type 1: Bearish sentiment + Bullish money flow
+        # High P/C (>1.5) + Positive CMF (>0.1) = Crowd fearful, smart money buying
+        long_mask = (pc_ratio >= self.config.putcall_extreme_high) & (cmf >= cmf_threshold)
 
-            # Need both CMF and P/C ratio for divergence check
-            if metrics.cmf_20 is None or metrics.put_call_ratio_volume is None:
-                logger.debug(f"{symbol}: Skipping - missing CMF or P/C data")
-                continue
+        # Divergence Type 2: Bullish sentiment + Bearish money flow
+        # Low P/C (<0.7) + Negative CMF (<-0.1) = Crowd greedy, smart money selling
+        short_mask = (pc_ratio <= self.config.putcall_extreme_low) & (cmf <= -cmf_threshold) & ~long_mask
 
-            cmf = metrics.cmf_20
-            pc_ratio = metrics.put_call_ratio_volume
+        # Divergence Type 3: Moderate divergence (less extreme but still notable)
+        # Relax thresholds slightly for secondary opportunities
+        moderate_mask = (
+            (((pc_ratio >= 1.2) & (cmf >= 0.05)) | ((pc_ratio <= 0.9) & (cmf <= -0.05)))
+            & ~long_mask & ~short_mask
+        )
 
-            # Divergence Type 1: Bearish sentiment + Bullish money flow
-            # High P/C (>1.5) + Positive CMF (>0.1) = Crowd fearful, smart money buying
-            if pc_ratio >= self.config.putcall_extreme_high and \
-               cmf >= self.config.cmf_divergence_threshold:
-                divergent_symbols.append(symbol)
+        # Reasons are formatted only for the symbols that pass
+        passed = np.flatnonzero(long_mask | short_mask | moderate_mask)
+        divergent_indices = step1_indices[passed].tolist()
+        reasons = {}
+        lines = []  # Long/short reasons, logged together after the loop
+
+        for i, pc, flow, is_long, is_short in zip(
+            divergent_indices,
+            pc_ratio[passed].tolist(), cmf[passed].tolist(),
+            long_mask[passed].tolist(), short_mask[passed].tolist()
+        ):
+            symbol = table.symbols[i]
+            if is_long:
                 reasons[symbol] = (
-                    f"LONG - Excessive pessimism (P/C {pc_ratio:.2f}) "
-                    f"+ Accumulation (CMF {cmf:+.3f})"
+                    f"LONG - Excessive pessimism (P/C {pc:.2f}) "
+                    f"+ Accumulation (CMF {flow:+.3f})"
                 )
-                logger.info(f"✓ {symbol}: {reasons[symbol]}")
-                continue
-
-            # Divergence Type 2: Bullish sentiment + Bearish money flow
-            # Low P/C (<0.7) + Negative CMF (<-0.1) = Crowd greedy, smart money selling
-            if pc_ratio <= self.config.putcall_extreme_low and \
-               cmf <= -self.config.cmf_divergence_threshold:
-                divergent_symbols.append(symbol)
+                lines.append(f"✓ {symbol}: {reasons[symbol]}")
+            elif is_short:
                 reasons[symbol] = (
-                    f"SHORT - Excessive optimism (P/C {pc_ratio:.2f}) "
-                    f"+ Distribution (CMF {cmf:+.3f})"
+                    f"SHORT - Excessive optimism (P/C {pc:.2f}) "
+                    f"+ Distribution (CMF {flow:+.3f})"
                 )
-                logger.info(f"✓ {symbol}: {reasons[symbol]}")
-                continue
-
-            # Divergence Type 3: Moderate divergence (less extreme but still notable)
-            # Relax thresholds slightly for secondary opportunities
-            if (pc_ratio >= 1.2 and cmf >= 0.05) or \
-               (pc_ratio <= 0.9 and cmf <= -0.05):
-                divergent_symbols.append(symbol)
+                lines.append(f"✓ {symbol}: {reasons[symbol]}")
+            else:
                 reasons[symbol] = (
-                    f"MODERATE - P/C {pc_ratio:.2f}, CMF {cmf:+.3f}"
+                    f"MODERATE - P/C {pc:.2f}, CMF {flow:+.3f}"
                 )
-                logger.debug(f"✓ {symbol}: {reasons[symbol]}")
-                continue
+                logger.debug("✓ %s: %s", symbol, reasons[symbol])
 
-        return divergent_symbols, reasons
+        if lines:
+            logger.info("Divergent symbols:\n" + "\n".join(lines))
+
+        return divergent_indices, reasons
 
     def _rank_and_limit(
         self,
-        sentiment_metrics: Dict[str, SentimentMetrics],
-        symbols: List[str],
+        table: SentimentMetricsTable,
+        indices: List[int],
         limit: int
-    ) -> List[str]:
+    ) -> List[int]:
         """
         Rank symbols by sentiment strength and limit to top N.
 
@@ -263,66 +305,33 @@ class SentimentFilter:
         3. Data quality (complete > partial)
 
         Args:
-            sentiment_metrics: Dictionary of sentiment data
-            symbols: List of symbols to rank
+            table: Sentiment columns for the universe
+            indices: Row indices of symbols to rank
             limit: Maximum number to return
 
         Returns:
-            Top N symbols ranked by opportunity strength
+            Row indices of the top N symbols ranked by opportunity strength
         """
-        # Calculate composite ranking score for each symbol
-        scored_symbols = []
-
-        for symbol in symbols:
-            metrics = sentiment_metrics[symbol]
-            score = 0.0
-
-            # Component 1: Contrarian signal (highest weight)
-            if metrics.contrarian_signal in ['long', 'short']:
-                score += 50.0
-
-            # Component 2: Sentiment extremeness
-            # Distance from neutral (0.5)
-            extremeness = abs(metrics.sentiment_score - 0.5)
-            score += extremeness * 30.0
+        scores = _ranking_scores(table, indices).tolist()
 
-            # Component 3: P/C ratio divergence magnitude
-            if metrics.put_call_ratio_volume:
-                pc_ratio = metrics.put_call_ratio_volume
-                if pc_ratio >= 1.5:
-                    score += (pc_ratio - 1.5) * 10.0
-                elif pc_ratio <= 0.7:
-                    score += (0.7 - pc_ratio) * 10.0
-
-            # Component 4: CMF magnitude
-            if metrics.cmf_20:
-                score += abs(metrics.cmf_20) * 10.0
-
-            # Component 5: Data quality bonus
-            if metrics.data_quality == 'complete':
-                score += 5.0
-
-            scored_symbols.append((symbol, score))
-
-        # Sort by score descending
-        scored_symbols.sort(key=lambda x: x[1], reverse=True)
-
-        # Take top N
-        top_symbols = [symbol for symbol, score in scored_symbols[:limit]]
+        # Top N by score descending (O(N log K) heap selection, ties keep input order)
+        top = ranked_indices(scores, limit)
+        top_indices = [indices[p] for p in top]
 
         # Log ranking
         logger.info(f"Top {limit} symbols by sentiment opportunity:")
-        for i, (symbol, score) in enumerate(scored_symbols[:limit], 1):
-            metrics = sentiment_metrics[symbol]
+        for rank, (i, score) in enumerate(((indices[p], scores[p]) for p in top), 1):
+            symbol = table.symbols[i]
+            metrics = table.metrics[i]
             pc_str = f"{metrics.put_call_ratio_volume:.2f}" if metrics.put_call_ratio_volume else "N/A"
             cmf_str = f"{metrics.cmf_20:+.3f}" if metrics.cmf_20 else "N/A"
             logger.info(
-                f"  {i}. {symbol}: score={score:.1f}, "
+                f"  {rank}. {symbol}: score={score:.1f}, "
                 f"signal={metrics.contrarian_signal}, "
                 f"P/C={pc_str}, CMF={cmf_str}"
             )
 
-        return top_symbols
+        return top_indices
 
     def get_filter_statistics(
         self,
@@ -342,25 +351,16 @@ class SentimentFilter:
         total_symbols = len(sentiment_metrics)
         passed_symbols = len(filtered_symbols)
 
-        # Count by signal type
-        long_signals = sum(
-            1 for s in filtered_symbols
-            if sentiment_metrics[s].contrarian_signal == 'long'
-        )
-        short_signals = sum(
-            1 for s in filtered_symbols
-            if sentiment_metrics[s].contrarian_signal == 'short'
-        )
-
-        # Count by sentiment extreme
-        negative_sentiment = sum(
-            1 for s in filtered_symbols
-            if sentiment_metrics[s].sentiment_extreme == 'negative'
-        )
-        positive_sentiment = sum(
-            1 for s in filtered_symbols
-            if sentiment_metrics[s].sentiment_extreme == 'positive'
-        )
+        # Count by signal type and sentiment extreme in one pass
+        long_signals = short_signals = negative_sentiment = positive_sentiment = 0
+        for s in filtered_symbols:
+            metrics = sentiment_metrics[s]
+            signal = metrics.contrarian_signal
+            extreme = metrics.sentiment_extreme
+            long_signals += signal == 'long'
+            short_signals += signal == 'short'
+            negative_sentiment += extreme == 'negative'
+            positive_sentiment += extreme == 'positive'
 
         return {
             'total_symbols_analyzed': total_symbols,
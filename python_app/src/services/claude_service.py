@@ -6,9 +6,17 @@ Python 3.12 compatible following CLAUDE.md standards.
 """
 
 import json
+import string
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..config import ANTHROPIC_API_KEY
 from ..utils.logging import get_logger
 
@@ -45,21 +53,180 @@ NOTES: {notes}
 """
 
 
+def _compile_prompt(template: str):
+    """
+    Compile a str.format template into an equivalent f-string function.
+
+    The template is parsed once here instead of on every format() call.
+
+    Args:
+        template: Template using named {field:spec} replacement fields
+
+    Returns:
+        Function taking the template's fields as keyword arguments
+    """
+    fields = sorted({name for _, name, _, _ in string.Formatter().parse(template) if name})
+    source = f"def render(*, {', '.join(fields)}):\n    return f{template!r}\n"
+    namespace = {}
+    exec(compile(source, "<claude-prompt>", "exec"), namespace)
+    return namespace['render']
+
+
+_render_prompt = _compile_prompt(CLAUDE_PROMPT)
+
+
+@lru_cache(maxsize=512)
+def _build_prompt(
+    symbol: str,
+    strategy: str,
+    spot_price: float,
+    strike: float,
+    expiry: str,
+    premium: float,
+    roi_30d: float,
+    iv_rank: float,
+    score: float,
+    extra_metrics: str,
+    trend_strength: float,
+    below_200sma: bool,
+    contrarian_signal: str,
+    put_call_ratio: Optional[float],
+    cmf_20: Optional[float],
+    notes: str
+) -> str:
+    """
+    Build the Claude prompt from a pick's fields.
+
+    Memoized on the field values, so retries and repeated picks reuse the
+    formatted prompt.
+
+    Returns:
+        Formatted prompt string
+    """
+    # Trend description
+    if trend_strength > 0.5:
+        trend = "Strong uptrend"
+    elif trend_strength > 0:
+        trend = "Mild uptrend"
+    elif trend_strength > -0.5:
+        trend = "Sideways/weak"
+    else:
+        trend = "Downtrend"
+
+    # SMA position
+    sma_position = "Above" if not below_200sma else "Below"
+
+    # Sentiment metrics (v2.7)
+    contrarian_signal = contrarian_signal.upper()
+
+    # Format sentiment values
+    if put_call_ratio is not None:
+        put_call_str = f"{put_call_ratio:.2f}"
+        if put_call_ratio > 1.5:
+            put_call_str += " (excessive pessimism)"
+        elif put_call_ratio < 0.7:
+            put_call_str += " (excessive optimism)"
+    else:
+        put_call_str = "N/A"
+
+    if cmf_20 is not None:
+        cmf_str = f"{cmf_20:+.3f}"
+        if cmf_20 > 0.1:
+            cmf_str += " (accumulation)"
+        elif cmf_20 < -0.1:
+            cmf_str += " (distribution)"
+        else:
+            cmf_str += " (neutral)"
+    else:
+        cmf_str = "N/A"
+
+    # Sentiment context explanation
+    sentiment_context = ""
+    if contrarian_signal == 'LONG':
+        sentiment_context = "→ Crowd fearful + Smart money buying = Contrarian long opportunity"
+    elif contrarian_signal == 'SHORT':
+        sentiment_context = "→ Crowd greedy + Smart money selling = Contrarian short signal"
+
+    return _render_prompt(
+        symbol=symbol,
+        strategy=strategy,
+        spot_price=spot_price,
+        strike=strike,
+        expiry=expiry,
+        premium=premium,
+        roi_30d=roi_30d,
+        iv_rank=iv_rank,
+        score=score,
+        extra_metrics=extra_metrics,
+        trend=trend,
+        sma_position=sma_position,
+        contrarian_signal=contrarian_signal,
+        put_call_ratio=put_call_str,
+        cmf_20=cmf_str,
+        sentiment_context=sentiment_context,
+        notes=notes
+    )
+
+
 class ClaudeService:
     """Service for generating AI-powered pick explanations using Claude API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, requests_per_second: int = 2,
+                 pool_size: int = 16):
         """
         Initialize Claude service.
 
         Args:
             api_key: Anthropic API key (defaults to env var)
+            requests_per_second: Rate limit for generate_batch_rationales, the
+                                 daily job's (only) concurrent rationale path
+            pool_size: Keep-alive connections kept to the API, enough for
+                       generate_batch_rationales' worker threads
         """
         self.api_key = api_key or ANTHROPIC_API_KEY
         self.logger = get_logger()
         self.base_url = "https://api.anthropic.com/v1/messages"
         self.is_mock = not self.api_key or self.api_key.startswith("mock_")
 
+        # One keep-alive session so requests reuse TLS connections; throttling
+        # and transient server errors are retried with backoff
+        self.session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({'POST'})
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json"
+        })
+
+        # Start times of the most recent batch requests (sliding one-second window)
+        self.requests_per_second = requests_per_second
+        self._request_times = deque(maxlen=requests_per_second)
+        self._rate_lock = threading.Lock()
+
+    def _wait_for_request_slot(self) -> None:
+        """Block until another request fits within the per-second rate limit."""
+        with self._rate_lock:
+            now = time.monotonic()
+            if len(self._request_times) == self.requests_per_second:
+                wait = self._request_times[0] + 1.0 - now
+                if wait > 0:
+                    time.sleep(wait)
+                    now = time.monotonic()
+            self._request_times.append(now)
+
+    def _rate_limited_rationale(self, pick: Dict[str, Any]) -> Optional[str]:
+        """Generate a rationale once the rate limiter allows another request."""
+        if not self.is_mock:
+            self._wait_for_request_slot()
+        return self.generate_rationale(pick)
+
     def _format_pick_data(self, pick: Dict[str, Any]) -> str:
         """
         Format pick data for Claude prompt.
@@ -77,71 +244,23 @@ class ClaudeService:
         elif pick['strategy'] == 'CC' and 'dividend_yield' in pick:
             extra_metrics = f"- Dividend Yield: {pick.get('dividend_yield', 0):.2%}"
 
-        # Trend description
-        trend_strength = pick.get('trend_strength', 0)
-        if trend_strength > 0.5:
-            trend = "Strong uptrend"
-        elif trend_strength > 0:
-            trend = "Mild uptrend"
-        elif trend_strength > -0.5:
-            trend = "Sideways/weak"
-        else:
-            trend = "Downtrend"
-
-        # SMA position
-        sma_position = "Above" if not pick.get('below_200sma', False) else "Below"
-
-        # Sentiment metrics (v2.7)
-        contrarian_signal = pick.get('contrarian_signal', 'none').upper()
-        put_call_ratio = pick.get('put_call_ratio')
-        cmf_20 = pick.get('cmf_20')
-
-        # Format sentiment values
-        if put_call_ratio is not None:
-            put_call_str = f"{put_call_ratio:.2f}"
-            if put_call_ratio > 1.5:
-                put_call_str += " (excessive pessimism)"
-            elif put_call_ratio < 0.7:
-                put_call_str += " (excessive optimism)"
-        else:
-            put_call_str = "N/A"
-
-        if cmf_20 is not None:
-            cmf_str = f"{cmf_20:+.3f}"
-            if cmf_20 > 0.1:
-                cmf_str += " (accumulation)"
-            elif cmf_20 < -0.1:
-                cmf_str += " (distribution)"
-            else:
-                cmf_str += " (neutral)"
-        else:
-            cmf_str = "N/A"
-
-        # Sentiment context explanation
-        sentiment_context = ""
-        if contrarian_signal == 'LONG':
-            sentiment_context = "→ Crowd fearful + Smart money buying = Contrarian long opportunity"
-        elif contrarian_signal == 'SHORT':
-            sentiment_context = "→ Crowd greedy + Smart money selling = Contrarian short signal"
-
-        return CLAUDE_PROMPT.format(
-            symbol=pick['symbol'],
-            strategy=pick['strategy'],
-            spot_price=pick.get('spot_price', 0),
-            strike=pick['strike'],
-            expiry=pick['expiry'],
-            premium=pick['premium'],
-            roi_30d=pick['roi_30d'],
-            iv_rank=pick['iv_rank'],
-            score=pick.get('score', 0),
-            extra_metrics=extra_metrics,
-            trend=trend,
-            sma_position=sma_position,
-            contrarian_signal=contrarian_signal,
-            put_call_ratio=put_call_str,
-            cmf_20=cmf_str,
-            sentiment_context=sentiment_context,
-            notes=pick.get('notes', 'Standard setup')
+        return _build_prompt(
+            pick['symbol'],
+            pick['strategy'],
+            pick.get('spot_price', 0),
+            pick['strike'],
+            pick['expiry'],
+            pick['premium'],
+            pick['roi_30d'],
+            pick['iv_rank'],
+            pick.get('score', 0),
+            extra_metrics,
+            pick.get('trend_strength', 0),
+            pick.get('below_200sma', False),
+            pick.get('contrarian_signal', 'none'),
+            pick.get('put_call_ratio'),
+            pick.get('cmf_20'),
+            pick.get('notes', 'Standard setup')
         )
 
     def generate_rationale(self, pick: Dict[str, Any]) -> Optional[str]:
@@ -161,12 +280,6 @@ class ClaudeService:
         try:
             prompt = self._format_pick_data(pick)
 
-            headers = {
-                "x-api-key": self.api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json"
-            }
-
             payload = {
                 "model": "claude-3-haiku-20240307",  # Fast, cost-effective model
                 "max_tokens": 500,  # Increased to allow complete rationales without truncation
@@ -179,15 +292,14 @@ class ClaudeService:
             # Log what we're sending to Claude for debugging
             self.logger.debug(f"Generating rationale for {pick['symbol']} {pick['strategy']} ${pick['strike']}")
 
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
-                headers=headers,
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=30
             )
             response.raise_for_status()
 
-            result = response.json()
+            result = orjson.loads(response.content)
             if 'content' in result and len(result['content']) > 0:
                 rationale = result['content'][0].get('text', '').strip()
 
@@ -218,6 +330,9 @@ class ClaudeService:
         """
         Generate rationales for multiple picks.
 
+        Requests run on up to max_workers threads and are throttled to
+        requests_per_second; callers should not add their own pool.
+
         Args:
             picks: List of pick dictionaries
             max_workers: Maximum parallel API calls
@@ -226,19 +341,16 @@ class ClaudeService:
             Dictionary mapping pick_id to rationale text
         """
         rationales = {}
+        picks_to_explain = [pick for pick in picks if pick.get('id')]
 
-        for pick in picks:
-            pick_id = pick.get('id')
-            if not pick_id:
-                continue
-
-            rationale = self.generate_rationale(pick)
-            if rationale:
-                rationales[pick_id] = rationale
-
-            # Rate limiting to avoid API throttling
-            if not self.is_mock:
-                time.sleep(0.5)  # 2 requests per second max
+        if picks_to_explain:
+            # Requests overlap their API latency; the rate limiter (rather than a
+            # fixed sleep after each call) keeps us under the API's throttling
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for pick, rationale in zip(picks_to_explain,
+                                           pool.map(self._rate_limited_rationale, picks_to_explain)):
+                    if rationale:
+                        rationales[pick['id']] = rationale
 
         self.logger.info(f"Generated {len(rationales)} rationales for {len(picks)} picks")
         return rationales
@@ -282,12 +394,6 @@ class ClaudeService:
             return True
 
         try:
-            headers = {
-                "x-api-key": self.api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json"
-            }
-
             # Simple test message
             payload = {
                 "model": "claude-3-haiku-20240307",
@@ -297,10 +403,9 @@ class ClaudeService:
                 ]
             }
 
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
-                headers=headers,
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=10
             )
             response.raise_for_status()
@@ -7,10 +7,16 @@ Python 3.12 compatible following CLAUDE.md standards.
 
 import os
 import json
+import queue
+import atexit
 import sqlite3
 import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timedelta, date
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from .telegram_service import TelegramService
@@ -18,6 +24,116 @@ from .telegram_service import TelegramService
 
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning applied whenever a connection is opened. WAL itself is
+# persistent in the database file and is enabled by the read-write connection.
+# (The default 5 s connect timeout already serves as the busy timeout.)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",     # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",   # 256 MiB memory-mapped I/O
+)
+
+# Monitoring tables (name -> column definitions). Timestamps are INTEGER unix
+# epoch seconds.
+_MONITORING_TABLES = {
+    'pipeline_runs': '''(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_date DATE NOT NULL,
+        started_at INTEGER NOT NULL,
+        completed_at INTEGER,
+        status TEXT NOT NULL,
+        symbols_attempted INTEGER DEFAULT 0,
+        symbols_succeeded INTEGER DEFAULT 0,
+        symbols_failed INTEGER DEFAULT 0,
+        total_picks INTEGER DEFAULT 0,
+        cc_picks INTEGER DEFAULT 0,
+        csp_picks INTEGER DEFAULT 0,
+        api_calls INTEGER DEFAULT 0,
+        duration_seconds REAL,
+        error_message TEXT,
+        error_details TEXT,
+        created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+    )''',
+    'monitoring_meta': '''(
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )''',
+    'performance_metrics': '''(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_id INTEGER,
+        metric_name TEXT NOT NULL,
+        metric_value REAL NOT NULL,
+        metric_unit TEXT,
+        recorded_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+        FOREIGN KEY (run_id) REFERENCES pipeline_runs(id)
+    )''',
+    'monitoring_alerts': '''(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        alert_type TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        message TEXT NOT NULL,
+        details TEXT,
+        sent_via TEXT,
+        acknowledged BOOLEAN DEFAULT 0,
+        created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+    )''',
+}
+
+# Write statements, kept as module constants so every call passes the same
+# text and hits the connection's prepared-statement cache
+_SQL_INSERT_RUN = '''
+    INSERT INTO pipeline_runs (
+        run_date, started_at, status, created_at
+    ) VALUES (?, ?, ?, ?)
+'''
+
+# INSERT ... RETURNING (SQLite 3.35+) hands back the new run id from the same
+# statement; older libraries fall back to cursor.lastrowid
+_SQL_INSERT_RUN_RETURNING = _SQL_INSERT_RUN.rstrip() + " RETURNING id"
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_SQL_UPDATE_RUN = '''
+    UPDATE pipeline_runs
+    SET completed_at = ?,
+        status = ?,
+        symbols_attempted = ?,
+        symbols_succeeded = ?,
+        symbols_failed = ?,
+        total_picks = ?,
+        cc_picks = ?,
+        csp_picks = ?,
+        api_calls = ?,
+        duration_seconds = ?,
+        error_message = ?,
+        error_details = ?
+    WHERE id = ?
+'''
+
+_SQL_INSERT_METRIC = '''
+    INSERT INTO performance_metrics (
+        run_id, metric_name, metric_value, metric_unit, recorded_at
+    ) VALUES (?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_ALERT = '''
+    INSERT INTO monitoring_alerts (
+        created_at, alert_type, severity, message, details, sent_via
+    ) VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+# Size of each connection's prepared-statement cache (sqlite3 default: 128)
+_CACHED_STATEMENTS = 256
+
+# Timestamp columns that tables created before the switch to epoch seconds
+# stored as TEXT, with the strftime() modifier converting each: started_at and
+# completed_at were written in local time, the CURRENT_TIMESTAMP defaults in UTC.
+_LEGACY_TIMESTAMP_COLUMNS = {
+    'pipeline_runs': {'started_at': ", 'utc'", 'completed_at': ", 'utc'", 'created_at': ''},
+    'performance_metrics': {'recorded_at': ''},
+    'monitoring_alerts': {'created_at': ''},
+}
+
 
 class MonitoringService:
     """
@@ -47,76 +163,202 @@ class MonitoringService:
         self.db_path = db_path
         self.telegram = TelegramService()
 
+        # Connections are opened on first use and reused until close(): one
+        # read-write connection plus a read-only one for the status reports
+        self._db = None
+        self._db_lock = threading.RLock()
+        self._reader = None
+        self._reader_lock = threading.RLock()
+        atexit.register(self.close)
+
         # Configuration
         self.max_consecutive_failures = 3
         self.max_hours_without_run = 26  # Alert if no run in 26 hours (> 1 day)
         self.performance_threshold_seconds = 300  # Alert if run takes > 5 minutes
+        self.health_cache_seconds = 5.0  # Reuse get_health_status results this long
+        self.performance_cache_seconds = 60.0  # Reuse get_performance_summary results this long
+        self.maintenance_interval_seconds = 86400  # Run maybe_maintain() work at most daily
+        self.vacuum_freelist_ratio = 0.2  # VACUUM when > 20% of pages are free
+        self.retention_days = 90  # maybe_maintain() prunes history older than this
+
+        # Report cache: key -> (computed_at, report); cleared on every write
+        self._report_cache: Dict[Any, Tuple[float, Dict[str, Any]]] = {}
+        self._report_cache_lock = threading.Lock()
+
+        # Alerts are posted to Telegram by a background thread, buffered in
+        # memory and written to monitoring_alerts in batches by a second one,
+        # so callers never wait on the network. Started on the first alert.
+        self.alert_flush_seconds = 5.0
+        self._alert_buffer: deque = deque(maxlen=1000)
+        self._telegram_queue: queue.Queue = queue.Queue()
+        self._alert_workers: List[threading.Thread] = []
+        self._alert_workers_lock = threading.Lock()
+        self._stop_alert_workers = threading.Event()
 
         # Ensure monitoring tables exist
         self._init_monitoring_tables()
 
-    def _init_monitoring_tables(self):
-        """Create monitoring tables if they don't exist."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Pipeline execution history
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS pipeline_runs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    run_date DATE NOT NULL,
-                    started_at TIMESTAMP NOT NULL,
-                    completed_at TIMESTAMP,
-                    status TEXT NOT NULL,
-                    symbols_attempted INTEGER DEFAULT 0,
-                    symbols_succeeded INTEGER DEFAULT 0,
-                    symbols_failed INTEGER DEFAULT 0,
-                    total_picks INTEGER DEFAULT 0,
-                    cc_picks INTEGER DEFAULT 0,
-                    csp_picks INTEGER DEFAULT 0,
-                    api_calls INTEGER DEFAULT 0,
-                    duration_seconds REAL,
-                    error_message TEXT,
-                    error_details TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    @property
+    def db(self) -> sqlite3.Connection:
+        """Read-write connection to the monitoring database, opened once and kept until close()."""
+        with self._db_lock:
+            if self._db is None:
+                self._db = sqlite3.connect(
+                    self.db_path, isolation_level=None, check_same_thread=False,
+                    cached_statements=_CACHED_STATEMENTS
                 )
-            ''')
-
-            # Performance metrics
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS performance_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    run_id INTEGER,
-                    metric_name TEXT NOT NULL,
-                    metric_value REAL NOT NULL,
-                    metric_unit TEXT,
-                    recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (run_id) REFERENCES pipeline_runs(id)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                for pragma in _CONNECTION_PRAGMAS:
+                    self._db.execute(pragma)
+            return self._db
+
+    @property
+    def reader(self) -> sqlite3.Connection:
+        """Read-only connection for the health and performance reports."""
+        with self._reader_lock:
+            if self._reader is None:
+                self._reader = sqlite3.connect(
+                    Path(self.db_path).resolve().as_uri() + "?mode=ro",
+                    uri=True, isolation_level=None, check_same_thread=False,
+                    cached_statements=_CACHED_STATEMENTS
                 )
-            ''')
+                for pragma in _CONNECTION_PRAGMAS:
+                    self._reader.execute(pragma)
+            return self._reader
 
-            # Alert history
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS monitoring_alerts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    alert_type TEXT NOT NULL,
-                    severity TEXT NOT NULL,
-                    message TEXT NOT NULL,
-                    details TEXT,
-                    sent_via TEXT,
-                    acknowledged BOOLEAN DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Run statements on the read-write connection inside one transaction.
+
+        Commits on success and rolls back if the block raises. Holds the
+        connection lock, so pipeline threads can record safely.
+        """
+        with self._db_lock:
+            cursor = self.db.cursor()
+            cursor.execute("BEGIN")
+            try:
+                yield cursor
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+        self._clear_report_cache()
+
+    def _cached_report(self, key: Any, max_age: float) -> Optional[Dict[str, Any]]:
+        """Return a cached report younger than max_age seconds, if any."""
+        with self._report_cache_lock:
+            entry = self._report_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < max_age:
+            return entry[1]
+        return None
+
+    def _cache_report(self, key: Any, report: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a freshly computed report and return it."""
+        with self._report_cache_lock:
+            self._report_cache[key] = (time.monotonic(), report)
+        return report
+
+    def _clear_report_cache(self) -> None:
+        """Drop cached reports after the monitoring data changes."""
+        with self._report_cache_lock:
+            self._report_cache.clear()
+
+    def close(self) -> None:
+        """
+        Finish sending queued alerts, record them and close the monitoring
+        database connections, if open.
+        """
+        with self._alert_workers_lock:
+            workers, self._alert_workers = self._alert_workers, []
+        if workers:
+            self._telegram_queue.put(None)
+            self._stop_alert_workers.set()
+            for worker in workers:
+                worker.join()
+            self._stop_alert_workers.clear()
+        self.flush_alerts(wait=False)
+
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+        with self._reader_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    def _init_monitoring_tables(self):
+        """Create monitoring tables if they don't exist."""
+        try:
+            with self._transaction() as cursor:
+                # Pipeline execution history, performance metrics, alert history
+                self._migrate_legacy_timestamps(cursor)
+                for table, columns in _MONITORING_TABLES.items():
+                    cursor.execute(f"CREATE TABLE IF NOT EXISTS {table} {columns}")
+
+                # Indexes for the "latest runs" lookups, failure streaks,
+                # alert counts by severity and per-run metrics
+                cursor.execute(
+                    "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name IN "
+                    "('idx_runs_started_at', 'idx_alerts_severity_created', 'idx_metrics_run_id')"
                 )
-            ''')
+                new_indexes = cursor.fetchone()[0] < 3
+
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_runs_started_at
+                    ON pipeline_runs(started_at DESC, id DESC)
+                ''')
+                cursor.execute("DROP INDEX IF EXISTS idx_alerts_created_severity")
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_alerts_severity_created
+                    ON monitoring_alerts(severity, created_at DESC)
+                ''')
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_metrics_run_id
+                    ON performance_metrics(run_id)
+                ''')
+
+                # Give the query planner statistics for the new indexes
+                if new_indexes:
+                    cursor.execute("ANALYZE")
 
-            conn.commit()
-            conn.close()
             logger.info("Monitoring tables initialized")
 
         except Exception as e:
             logger.error(f"Error initializing monitoring tables: {e}")
 
+    def _migrate_legacy_timestamps(self, cursor: sqlite3.Cursor):
+        """
+        Rebuild monitoring tables that still declare TEXT timestamps, converting
+        their rows to epoch seconds. Tables already migrated are left alone.
+
+        Args:
+            cursor: Cursor of the open initialization transaction
+        """
+        for table, legacy_columns in _LEGACY_TIMESTAMP_COLUMNS.items():
+            info = cursor.execute(f"PRAGMA table_info({table})").fetchall()
+            column_types = {row[1]: row[2] for row in info}
+            if all(column_types.get(name, 'INTEGER') == 'INTEGER' for name in legacy_columns):
+                continue
+
+            names = [row[1] for row in info]
+            values = [
+                f"CASE WHEN typeof({name}) = 'text' "
+                f"THEN CAST(strftime('%s', {name}{legacy_columns[name]}) AS INTEGER) "
+                f"ELSE {name} END"
+                if name in legacy_columns else name
+                for name in names
+            ]
+            cursor.execute(f"CREATE TABLE {table}_new {_MONITORING_TABLES[table]}")
+            cursor.execute(
+                f"INSERT INTO {table}_new ({', '.join(names)}) "
+                f"SELECT {', '.join(values)} FROM {table}"
+            )
+            cursor.execute(f"DROP TABLE {table}")
+            cursor.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+            logger.info(f"Migrated {table} timestamps to epoch seconds")
+
     def record_pipeline_start(self, run_date: date = None) -> int:
         """
         Record the start of a pipeline run.
@@ -128,24 +370,16 @@ class MonitoringService:
             Run ID for tracking
         """
         run_date = run_date or date.today()
+        started_at = int(time.time())
+        params = (run_date.isoformat(), started_at, 'running', started_at)
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                INSERT INTO pipeline_runs (
-                    run_date, started_at, status
-                ) VALUES (?, ?, ?)
-            ''', (
-                run_date.isoformat(),
-                datetime.now().isoformat(),
-                'running'
-            ))
-
-            run_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+            with self._transaction() as cursor:
+                if _SUPPORTS_RETURNING:
+                    run_id = cursor.execute(_SQL_INSERT_RUN_RETURNING, params).fetchone()[0]
+                else:
+                    cursor.execute(_SQL_INSERT_RUN, params)
+                    run_id = cursor.lastrowid
 
             logger.info(f"Pipeline run {run_id} started")
             return run_id
@@ -171,26 +405,9 @@ class MonitoringService:
             error_message: Error message if failed
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                UPDATE pipeline_runs
-                SET completed_at = ?,
-                    status = ?,
-                    symbols_attempted = ?,
-                    symbols_succeeded = ?,
-                    symbols_failed = ?,
-                    total_picks = ?,
-                    cc_picks = ?,
-                    csp_picks = ?,
-                    api_calls = ?,
-                    duration_seconds = ?,
-                    error_message = ?,
-                    error_details = ?
-                WHERE id = ?
-            ''', (
-                datetime.now().isoformat(),
+            # Build the row before taking the write lock so it is held for I/O only
+            params = (
+                int(time.time()),
                 status,
                 stats.get('symbols_attempted', 0),
                 stats.get('symbols_succeeded', 0),
@@ -203,16 +420,23 @@ class MonitoringService:
                 error_message,
                 json.dumps(stats.get('errors', [])),
                 run_id
-            ))
+            )
+
+            with self._transaction() as cursor:
+                cursor.execute(_SQL_UPDATE_RUN, params)
 
-            conn.commit()
-            conn.close()
+                # Read the failure streak in the same transaction as the update
+                consecutive_failures = (
+                    self._get_consecutive_failures(cursor) if status == 'failed' else 0
+                )
 
             logger.info(f"Pipeline run {run_id} completed with status: {status}")
 
-            # Check for alerting conditions
-            self._check_failure_alerts(run_id, status, stats)
-            self._check_performance_alerts(run_id, stats)
+            # Check for alerting conditions; alerts go out after the commit so
+            # no transaction is held open across Telegram calls
+            alerts = self._check_failure_alerts(run_id, status, stats, consecutive_failures)
+            alerts += self._check_performance_alerts(run_id, stats)
+            self._send_alerts(alerts)
 
         except Exception as e:
             logger.error(f"Error recording pipeline completion: {e}")
@@ -227,30 +451,41 @@ class MonitoringService:
             value: Metric value
             unit: Optional unit (e.g., 'seconds', 'count')
         """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+        self.record_metrics(run_id, [(metric_name, value, unit)])
 
-            cursor.execute('''
-                INSERT INTO performance_metrics (
-                    run_id, metric_name, metric_value, metric_unit
-                ) VALUES (?, ?, ?, ?)
-            ''', (run_id, metric_name, value, unit))
+    def record_metrics(self, run_id: int, metrics: List[Tuple[str, float, Optional[str]]]):
+        """
+        Record several performance metrics for a run in one transaction.
 
-            conn.commit()
-            conn.close()
+        Args:
+            run_id: Run ID
+            metrics: List of (metric_name, value, unit) tuples; unit may be None
+        """
+        recorded_at = int(time.time())
+
+        try:
+            with self._transaction() as cursor:
+                cursor.executemany(
+                    _SQL_INSERT_METRIC,
+                    [(run_id, name, value, unit, recorded_at) for name, value, unit in metrics]
+                )
 
         except Exception as e:
             logger.error(f"Error recording metric: {e}")
 
-    def _check_failure_alerts(self, run_id: int, status: str, stats: Dict):
-        """Check if failure alerts should be sent."""
-        if status == 'failed':
-            # Get consecutive failure count
-            consecutive_failures = self._get_consecutive_failures()
+    def _check_failure_alerts(
+        self,
+        run_id: int,
+        status: str,
+        stats: Dict,
+        consecutive_failures: int
+    ) -> List[Dict[str, Any]]:
+        """Return the failure alerts that should be sent (as _send_alert kwargs)."""
+        alerts = []
 
+        if status == 'failed':
             if consecutive_failures >= self.max_consecutive_failures:
-                self._send_alert(
+                alerts.append(dict(
                     alert_type='consecutive_failures',
                     severity='critical',
                     message=f"⚠️ **{consecutive_failures} Consecutive Pipeline Failures**",
@@ -259,13 +494,13 @@ class MonitoringService:
                         'threshold': self.max_consecutive_failures,
                         'last_run_id': run_id
                     }
-                )
+                ))
 
         # Check symbol failure rate
         if stats.get('symbols_attempted', 0) > 0:
             failure_rate = stats.get('symbols_failed', 0) / stats['symbols_attempted']
             if failure_rate > 0.5:  # More than 50% failed
-                self._send_alert(
+                alerts.append(dict(
                     alert_type='high_failure_rate',
                     severity='warning',
                     message=f"⚠️ **High Symbol Failure Rate: {failure_rate:.1%}**",
@@ -274,14 +509,17 @@ class MonitoringService:
                         'symbols_failed': stats['symbols_failed'],
                         'failure_rate': failure_rate
                     }
-                )
+                ))
+
+        return alerts
 
-    def _check_performance_alerts(self, run_id: int, stats: Dict):
-        """Check if performance alerts should be sent."""
+    def _check_performance_alerts(self, run_id: int, stats: Dict) -> List[Dict[str, Any]]:
+        """Return the performance alerts that should be sent (as _send_alert kwargs)."""
+        alerts = []
         duration = stats.get('duration', 0)
 
         if duration > self.performance_threshold_seconds:
-            self._send_alert(
+            alerts.append(dict(
                 alert_type='slow_performance',
                 severity='info',
                 message=f"⏱️ **Slow Pipeline Execution: {duration:.1f}s**",
@@ -290,7 +528,9 @@ class MonitoringService:
                     'threshold_seconds': self.performance_threshold_seconds,
                     'run_id': run_id
                 }
-            )
+            ))
+
+        return alerts
 
     def check_dead_mans_switch(self):
         """
@@ -298,19 +538,14 @@ class MonitoringService:
         Should be called independently of pipeline execution.
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
             # Get last run
-            cursor.execute('''
-                SELECT started_at, status
-                FROM pipeline_runs
-                ORDER BY started_at DESC
-                LIMIT 1
-            ''')
-
-            result = cursor.fetchone()
-            conn.close()
+            with self._db_lock:
+                result = self.db.execute('''
+                    SELECT started_at, status
+                    FROM pipeline_runs
+                    ORDER BY started_at DESC, id DESC
+                    LIMIT 1
+                ''').fetchone()
 
             if not result:
                 # No runs recorded
@@ -320,50 +555,137 @@ class MonitoringService:
                     message="🚨 **No Pipeline Runs Recorded**",
                     details={'message': 'No pipeline execution history found'}
                 )
-                return
+            else:
+                last_run_time = datetime.fromtimestamp(result[0])
+                hours_since_run = (time.time() - result[0]) / 3600
 
-            last_run_time = datetime.fromisoformat(result[0])
-            hours_since_run = (datetime.now() - last_run_time).total_seconds() / 3600
+                if hours_since_run > self.max_hours_without_run:
+                    self._send_alert(
+                        alert_type='dead_mans_switch',
+                        severity='critical',
+                        message=f"🚨 **Pipeline Not Running**\n\nLast run: {hours_since_run:.1f} hours ago",
+                        details={
+                            'last_run_time': last_run_time.isoformat(),
+                            'hours_since_run': hours_since_run,
+                            'threshold_hours': self.max_hours_without_run
+                        }
+                    )
 
-            if hours_since_run > self.max_hours_without_run:
-                self._send_alert(
-                    alert_type='dead_mans_switch',
-                    severity='critical',
-                    message=f"🚨 **Pipeline Not Running**\n\nLast run: {hours_since_run:.1f} hours ago",
-                    details={
-                        'last_run_time': last_run_time.isoformat(),
-                        'hours_since_run': hours_since_run,
-                        'threshold_hours': self.max_hours_without_run
-                    }
+        except Exception as e:
+            logger.error(f"Error checking dead man's switch: {e}")
+
+        # Record any alert raised above before callers read the health report
+        self.flush_alerts()
+
+        self.maybe_maintain()
+
+    def maybe_maintain(self):
+        """
+        Run database maintenance if none has run for maintenance_interval_seconds.
+
+        Prunes history older than retention_days, always runs PRAGMA optimize
+        (which re-analyzes tables whose statistics are stale) and VACUUMs when
+        free pages exceed vacuum_freelist_ratio of the file. The monitoring
+        tables share screener.db with picks, sentiment and earnings data, so
+        VACUUM rewrites that whole file. The last successful run time is kept
+        in monitoring_meta; a failed run is retried on the next call.
+        """
+        try:
+            now = int(time.time())
+            with self._db_lock:
+                row = self.db.execute(
+                    "SELECT value FROM monitoring_meta WHERE key = 'last_maintenance'"
+                ).fetchone()
+            if row and now - int(row[0]) < self.maintenance_interval_seconds:
+                return
+
+            self._prune(self.retention_days)
+
+            # The read-write connection is in autocommit mode, so VACUUM can
+            # run on it directly (outside any transaction) under its lock
+            with self._db_lock:
+                self.db.execute("PRAGMA optimize")
+                free_pages = self.db.execute("PRAGMA freelist_count").fetchone()[0]
+                total_pages = self.db.execute("PRAGMA page_count").fetchone()[0]
+                if total_pages and free_pages / total_pages > self.vacuum_freelist_ratio:
+                    logger.info(f"Vacuuming screener database {self.db_path} "
+                                f"({free_pages}/{total_pages} pages free)")
+                    self.db.execute("VACUUM")
+
+            # Stamped only once everything above succeeded
+            with self._transaction() as cursor:
+                cursor.execute(
+                    "INSERT OR REPLACE INTO monitoring_meta (key, value) "
+                    "VALUES ('last_maintenance', ?)",
+                    (str(now),)
                 )
 
+            logger.info("Monitoring database maintenance complete")
+
         except Exception as e:
-            logger.error(f"Error checking dead man's switch: {e}")
+            logger.error(f"Error maintaining monitoring database: {e}")
 
-    def _get_consecutive_failures(self) -> int:
-        """Get count of consecutive failures."""
+    def prune(self, days: int = 90) -> int:
+        """
+        Delete pipeline runs, their metrics and alerts older than N days.
+
+        Args:
+            days: Number of days of history to keep
+
+        Returns:
+            Number of pipeline runs deleted
+        """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            return self._prune(days)
 
+        except Exception as e:
+            logger.error(f"Error pruning monitoring history: {e}")
+            return 0
+
+    def _prune(self, days: int) -> int:
+        """Delete history older than N days, raising on database errors (see prune)."""
+        cutoff = int(time.time()) - days * 86400
+
+        with self._transaction() as cursor:
+            # Metrics go with their runs; recorded_at also catches metrics
+            # whose run was never recorded
             cursor.execute('''
-                SELECT status
-                FROM pipeline_runs
-                ORDER BY started_at DESC
-                LIMIT 10
-            ''')
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            consecutive = 0
-            for row in rows:
-                if row[0] == 'failed':
-                    consecutive += 1
-                else:
-                    break
+                DELETE FROM performance_metrics
+                WHERE run_id IN (SELECT id FROM pipeline_runs WHERE started_at < ?)
+                OR recorded_at < ?
+            ''', (cutoff, cutoff))
+            cursor.execute("DELETE FROM monitoring_alerts WHERE created_at < ?", (cutoff,))
+            cursor.execute("DELETE FROM pipeline_runs WHERE started_at < ?", (cutoff,))
+            runs_deleted = cursor.rowcount
+
+        if runs_deleted:
+            logger.info(f"Pruned {runs_deleted} pipeline runs older than {days} days")
+        return runs_deleted
+
+    def _get_consecutive_failures(self, cursor: Optional[sqlite3.Cursor] = None) -> int:
+        """
+        Get count of consecutive failures.
 
-            return consecutive
+        Counts the failed runs recorded after the most recent run that did not
+        fail (ids follow start order; started_at has one-second resolution).
+
+        Args:
+            cursor: Cursor of an open transaction to read through (optional)
+        """
+        try:
+            with self._db_lock:
+                return (cursor or self.db.cursor()).execute('''
+                    SELECT COUNT(*)
+                    FROM pipeline_runs
+                    WHERE status = 'failed'
+                    AND id > COALESCE((
+                        SELECT id
+                        FROM pipeline_runs
+                        WHERE status != 'failed'
+                        ORDER BY started_at DESC, id DESC
+                        LIMIT 1
+                    ), 0)
+                ''').fetchone()[0]
 
         except Exception as e:
             logger.error(f"Error getting consecutive failures: {e}")
@@ -377,7 +699,7 @@ class MonitoringService:
         details: Dict = None
     ):
         """
-        Send an alert via Telegram and record it.
+        Queue an alert to be sent via Telegram and recorded.
 
         Args:
             alert_type: Type of alert
@@ -385,48 +707,126 @@ class MonitoringService:
             message: Alert message
             details: Additional details dictionary
         """
-        try:
-            # Format alert message
-            severity_emoji = {
-                'info': 'ℹ️',
-                'warning': '⚠️',
-                'critical': '🚨'
-            }
+        self._send_alerts([dict(
+            alert_type=alert_type, severity=severity, message=message, details=details
+        )])
+
+    def _send_alerts(self, alerts: List[Dict[str, Any]]):
+        """
+        Queue alerts for the Telegram thread without waiting on the network.
 
-            full_message = f"{severity_emoji.get(severity, '📊')} **Monitoring Alert**\n"
-            full_message += f"━━━━━━━━━━━━━━━━━━━━\n"
-            full_message += f"{message}\n"
-            full_message += f"━━━━━━━━━━━━━━━━━━━━\n"
-            full_message += f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            full_message += f"🔔 Type: {alert_type}\n"
-            full_message += f"📊 Severity: {severity.upper()}"
+        Args:
+            alerts: List of _send_alert keyword-argument dictionaries
+        """
+        if not alerts:
+            return
+        self._start_alert_workers()
+
+        # Format alert message
+        severity_emoji = {
+            'info': 'ℹ️',
+            'warning': '⚠️',
+            'critical': '🚨'
+        }
+
+        sent_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        created_at = int(time.time())  # rows are written after the fact
+
+        for alert in alerts:
+            try:
+                alert_type = alert['alert_type']
+                severity = alert['severity']
+                message = alert['message']
+                details = alert.get('details')
+
+                full_message = f"{severity_emoji.get(severity, '📊')} **Monitoring Alert**\n"
+                full_message += f"━━━━━━━━━━━━━━━━━━━━\n"
+                full_message += f"{message}\n"
+                full_message += f"━━━━━━━━━━━━━━━━━━━━\n"
+                full_message += f"📅 {sent_at}\n"
+                full_message += f"🔔 Type: {alert_type}\n"
+                full_message += f"📊 Severity: {severity.upper()}"
+
+                self._telegram_queue.put((full_message, (
+                    created_at,
+                    alert_type,
+                    severity,
+                    message,
+                    json.dumps(details) if details else None
+                )))
+
+            except Exception as e:
+                logger.error(f"Error sending alert: {e}")
+
+    def _start_alert_workers(self):
+        """Start the Telegram and alert-flush threads if not already running."""
+        with self._alert_workers_lock:
+            if self._alert_workers:
+                return
+            self._alert_workers = [
+                threading.Thread(target=worker, name=name, daemon=True)
+                for worker, name in (
+                    (self._telegram_worker, 'monitoring-telegram'),
+                    (self._alert_flush_worker, 'monitoring-alert-flush'),
+                )
+            ]
+            for worker in self._alert_workers:
+                worker.start()
+
+    def _telegram_worker(self):
+        """Send queued alerts via Telegram and buffer them for recording."""
+        while True:
+            item = self._telegram_queue.get()
+            try:
+                if item is None:
+                    return
+                full_message, row = item
+                try:
+                    sent = self.telegram.send_message(full_message)
+                except Exception as e:
+                    logger.error(f"Error sending alert: {e}")
+                    continue
+                self._alert_buffer.append(row + ('telegram' if sent else 'failed',))
+            finally:
+                self._telegram_queue.task_done()
+
+    def _alert_flush_worker(self):
+        """Record buffered alerts every alert_flush_seconds until close()."""
+        while not self._stop_alert_workers.wait(self.alert_flush_seconds):
+            self.flush_alerts(wait=False)
+
+    def flush_alerts(self, wait: bool = True):
+        """
+        Record buffered alerts in monitoring_alerts in one transaction.
 
-            # Send via Telegram
-            sent = self.telegram.send_message(full_message)
+        Args:
+            wait: First wait for alerts still queued for Telegram to be sent
+        """
+        if wait:
+            with self._alert_workers_lock:
+                running = bool(self._alert_workers)
+            if running:
+                self._telegram_queue.join()
 
-            # Record alert
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+        rows = []
+        try:
+            while True:
+                rows.append(self._alert_buffer.popleft())
+        except IndexError:
+            pass
 
-            cursor.execute('''
-                INSERT INTO monitoring_alerts (
-                    alert_type, severity, message, details, sent_via
-                ) VALUES (?, ?, ?, ?, ?)
-            ''', (
-                alert_type,
-                severity,
-                message,
-                json.dumps(details) if details else None,
-                'telegram' if sent else 'failed'
-            ))
+        if not rows:
+            return
 
-            conn.commit()
-            conn.close()
+        try:
+            with self._transaction() as cursor:
+                cursor.executemany(_SQL_INSERT_ALERT, rows)
 
-            logger.info(f"Alert sent: {alert_type} ({severity})")
+            for _, alert_type, severity, *_ in rows:
+                logger.info(f"Alert sent: {alert_type} ({severity})")
 
         except Exception as e:
-            logger.error(f"Error sending alert: {e}")
+            logger.error(f"Error recording alerts: {e}")
 
     def get_health_status(self) -> Dict[str, Any]:
         """
@@ -435,92 +835,96 @@ class MonitoringService:
         Returns:
             Dictionary with health status information
         """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Last run info
-            cursor.execute('''
-                SELECT id, run_date, started_at, completed_at, status,
-                       symbols_attempted, symbols_succeeded, symbols_failed,
-                       total_picks, duration_seconds
-                FROM pipeline_runs
-                ORDER BY started_at DESC
-                LIMIT 1
-            ''')
-
-            last_run = cursor.fetchone()
-
-            # Success rate (last 7 days)
-            cursor.execute('''
-                SELECT
-                    COUNT(*) as total_runs,
-                    SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as successful_runs
-                FROM pipeline_runs
-                WHERE started_at >= datetime('now', '-7 days')
-            ''')
-
-            week_stats = cursor.fetchone()
-
-            # Recent alerts
-            cursor.execute('''
-                SELECT COUNT(*)
-                FROM monitoring_alerts
-                WHERE created_at >= datetime('now', '-24 hours')
-                AND severity IN ('warning', 'critical')
-            ''')
-
-            recent_alerts = cursor.fetchone()[0]
-
-            conn.close()
+        cached = self._cached_report('health', self.health_cache_seconds)
+        if cached is not None:
+            return cached
 
-            # Calculate health score
-            health_score = 100
-            status = 'healthy'
-
-            if last_run:
-                last_run_time = datetime.fromisoformat(last_run[2])
-                hours_since_run = (datetime.now() - last_run_time).total_seconds() / 3600
-
-                if hours_since_run > self.max_hours_without_run:
-                    health_score -= 50
-                    status = 'critical'
-                elif last_run[4] == 'failed':
-                    health_score -= 30
-                    status = 'degraded'
-
-                # Check symbol success rate
-                if last_run[5] > 0:  # symbols_attempted
-                    success_rate = last_run[6] / last_run[5]  # succeeded / attempted
-                    if success_rate < 0.5:
-                        health_score -= 20
-                        if status == 'healthy':
-                            status = 'degraded'
-            else:
-                health_score = 0
-                status = 'critical'
-
-            # Weekly success rate
-            weekly_success_rate = 0
-            if week_stats and week_stats[0] > 0:
-                weekly_success_rate = (week_stats[1] / week_stats[0]) * 100
-                if weekly_success_rate < 80:
-                    health_score -= 15
-
-            # Recent alerts
-            if recent_alerts > 5:
-                health_score -= 10
-
-            health_score = max(0, health_score)
-
-            return {
+        try:
+            # Last run, 7-day success rate, 24h alert count and the resulting
+            # health score in one query (one consistent snapshot). week and
+            # alerts always yield one row; the last-run columns are NULL when
+            # no run has been recorded.
+            now = int(time.time())
+            with self._reader_lock:
+                row = self.reader.execute('''
+                    WITH last_run AS (
+                        SELECT id, run_date, started_at, completed_at, status,
+                               symbols_attempted, symbols_succeeded, symbols_failed,
+                               total_picks, duration_seconds,
+                               (:now - started_at) / 3600.0
+                                   as hours_since_run,
+                               CASE WHEN symbols_attempted > 0
+                                    THEN symbols_succeeded * 1.0 / symbols_attempted
+                               END as success_rate
+                        FROM pipeline_runs
+                        ORDER BY started_at DESC, id DESC
+                        LIMIT 1
+                    ),
+                    week AS (
+                        SELECT
+                            COUNT(*) as total_runs,
+                            SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as successful_runs,
+                            CASE WHEN COUNT(*) > 0
+                                 THEN SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END)
+                                      * 1.0 / COUNT(*) * 100
+                                 ELSE 0
+                            END as weekly_success_rate
+                        FROM pipeline_runs
+                        WHERE started_at >= :week_since
+                    ),
+                    alerts AS (
+                        SELECT COUNT(*) as recent_alerts
+                        FROM monitoring_alerts
+                        WHERE severity IN ('warning', 'critical')
+                        AND created_at >= :alerts_since
+                    ),
+                    snapshot AS (
+                        SELECT last_run.*, week.*, alerts.recent_alerts
+                        FROM week CROSS JOIN alerts LEFT JOIN last_run ON 1
+                    )
+                    SELECT
+                        snapshot.*,
+                        MAX(0,
+                            CASE WHEN id IS NULL THEN 0
+                                 ELSE 100
+                                      - CASE WHEN hours_since_run > :max_hours THEN 50
+                                             WHEN status = 'failed' THEN 30
+                                             ELSE 0 END
+                                      - CASE WHEN success_rate < 0.5 THEN 20 ELSE 0 END
+                            END
+                            - CASE WHEN total_runs > 0 AND weekly_success_rate < 80
+                                   THEN 15 ELSE 0 END
+                            - CASE WHEN recent_alerts > 5 THEN 10 ELSE 0 END
+                        ) as health_score,
+                        CASE WHEN id IS NULL OR hours_since_run > :max_hours THEN 'critical'
+                             WHEN status = 'failed' OR success_rate < 0.5 THEN 'degraded'
+                             ELSE 'healthy'
+                        END as health_status
+                    FROM snapshot
+                ''', {
+                    'now': now,
+                    'week_since': now - 7 * 86400,
+                    'alerts_since': now - 86400,
+                    'max_hours': self.max_hours_without_run
+                }).fetchone()
+
+            last_run = row[:10] if row[0] is not None else None
+            week_stats = row[12:14]
+            weekly_success_rate = row[14]
+            recent_alerts = row[15]
+            health_score = row[16]
+            status = row[17]
+
+            return self._cache_report('health', {
                 'status': status,
                 'health_score': health_score,
                 'last_run': {
                     'id': last_run[0] if last_run else None,
                     'date': last_run[1] if last_run else None,
-                    'started_at': last_run[2] if last_run else None,
-                    'completed_at': last_run[3] if last_run else None,
+                    'started_at': datetime.fromtimestamp(last_run[2]).isoformat(),
+                    'completed_at': (
+                        datetime.fromtimestamp(last_run[3]).isoformat() if last_run[3] else None
+                    ),
                     'status': last_run[4] if last_run else None,
                     'symbols_attempted': last_run[5] if last_run else 0,
                     'symbols_succeeded': last_run[6] if last_run else 0,
@@ -534,7 +938,7 @@ class MonitoringService:
                 },
                 'recent_alerts_24h': recent_alerts,
                 'timestamp': datetime.now().isoformat()
-            }
+            })
 
         except Exception as e:
             logger.error(f"Error getting health status: {e}")
@@ -555,27 +959,26 @@ class MonitoringService:
         Returns:
             Performance summary dictionary
         """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT
-                    AVG(duration_seconds) as avg_duration,
-                    MIN(duration_seconds) as min_duration,
-                    MAX(duration_seconds) as max_duration,
-                    AVG(api_calls) as avg_api_calls,
-                    AVG(total_picks) as avg_picks,
-                    COUNT(*) as total_runs
-                FROM pipeline_runs
-                WHERE started_at >= datetime('now', ? || ' days')
-                AND status = 'success'
-            ''', (f'-{days}',))
-
-            stats = cursor.fetchone()
-            conn.close()
+        cached = self._cached_report(('performance', days), self.performance_cache_seconds)
+        if cached is not None:
+            return cached
 
-            return {
+        try:
+            with self._reader_lock:
+                stats = self.reader.execute('''
+                    SELECT
+                        AVG(duration_seconds) as avg_duration,
+                        MIN(duration_seconds) as min_duration,
+                        MAX(duration_seconds) as max_duration,
+                        AVG(api_calls) as avg_api_calls,
+                        AVG(total_picks) as avg_picks,
+                        COUNT(*) as total_runs
+                    FROM pipeline_runs
+                    WHERE started_at >= strftime('%s', 'now') - ? * 86400
+                    AND status = 'success'
+                ''', (days,)).fetchone()
+
+            return self._cache_report(('performance', days), {
                 'period_days': days,
                 'total_runs': stats[5] if stats else 0,
                 'avg_duration_seconds': round(stats[0], 2) if stats and stats[0] else 0,
@@ -583,7 +986,7 @@ class MonitoringService:
                 'max_duration_seconds': round(stats[2], 2) if stats and stats[2] else 0,
                 'avg_api_calls': round(stats[3], 2) if stats and stats[3] else 0,
                 'avg_picks': round(stats[4], 2) if stats and stats[4] else 0
-            }
+            })
 
         except Exception as e:
             logger.error(f"Error getting performance summary: {e}")
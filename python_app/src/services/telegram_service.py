@@ -8,6 +8,7 @@ Python 3.12 compatible following CLAUDE.md standards.
 import os
 import time
 from typing import Dict, Any, List, Optional, Union
+import orjson
 import requests
 from ..config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, TELEGRAM_CHAT_IDS
 from ..utils.logging import get_logger
@@ -195,10 +196,15 @@ class TelegramService:
                     "disable_web_page_preview": True
                 }
 
-                response = requests.post(url, json=payload, timeout=10)
+                response = requests.post(
+                    url,
+                    data=orjson.dumps(payload),
+                    headers={"Content-Type": "application/json"},
+                    timeout=10
+                )
                 response.raise_for_status()
 
-                result = response.json()
+                result = orjson.loads(response.content)
                 if result.get('ok'):
                     chat_type = "group" if chat_id.startswith("-") else "user"
                     self.logger.info(f"Telegram message sent to {chat_type} {chat_id}")
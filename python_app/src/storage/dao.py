@@ -5,7 +5,7 @@ Provides structured access to all database tables with proper error handling.
 Python 3.12 compatible following CLAUDE.md standards.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from datetime import date, datetime
 from .database import get_database
 from ..utils.logging import get_logger
@@ -100,12 +100,15 @@ class PricesDAO(BaseDAO):
 class OptionsDAO(BaseDAO):
     """DAO for options table operations."""
 
-    def insert_options_chain(self, options_data: List[Dict[str, Any]]) -> None:
+    def insert_options_chain(self, options_data: Iterable[Dict[str, Any]]) -> None:
         """
         Batch insert option chain data.
 
+        Rows are streamed to SQLite from a generator, so large chains are never
+        copied into an intermediate list of parameter tuples.
+
         Args:
-            options_data: List of option contracts with keys:
+            options_data: List or iterable of option contracts with keys:
                 symbol, asof, expiry, side, strike, bid, ask, mid, delta, iv, oi, vol, dte
         """
         query = """
@@ -113,16 +116,16 @@ class OptionsDAO(BaseDAO):
             (symbol, asof, expiry, side, strike, bid, ask, mid, delta, iv, oi, vol, dte)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
-        params_list = [
+        params_iter = (
             (
                 o['symbol'], o['asof'], o['expiry'], o['side'], o['strike'],
                 o['bid'], o['ask'], o['mid'], o['delta'], o['iv'],
                 o['oi'], o['vol'], o['dte']
             )
             for o in options_data
-        ]
-        self.db.execute_many(query, params_list)
-        self.logger.info(f"Inserted {len(options_data)} option contracts")
+        )
+        inserted = self.db.execute_many(query, params_iter)
+        self.logger.info(f"Inserted {inserted} option contracts")
 
     def get_option_chain(self, symbol: str, asof: date) -> List[Dict[str, Any]]:
         """Get full option chain for a symbol on a date."""
@@ -214,12 +217,14 @@ class EarningsDAO(BaseDAO):
 class PicksDAO(BaseDAO):
     """DAO for picks table operations."""
 
-    def insert_picks(self, picks: List[Dict[str, Any]]) -> List[int]:
+    def insert_picks(self, picks: List[Dict[str, Any]], asof: Optional[date] = None) -> List[int]:
         """
         Insert screened picks.
 
         Args:
             picks: List of pick dictionaries from screeners
+            asof: As-of date bound for every pick (defaults to each pick's
+                'asof' key, then today). Pick dicts are not modified.
 
         Returns:
             List of inserted pick IDs
@@ -229,11 +234,11 @@ class PicksDAO(BaseDAO):
             (asof, symbol, strategy, selected_option, strike, expiry, premium,
              roi_30d, iv_rank, score, notes)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
         """
-        pick_ids = []
-        for pick in picks:
-            params = (
-                pick.get('asof', date.today()),
+        params_list = [
+            (
+                asof or pick.get('asof', date.today()),
                 pick['symbol'],
                 pick['strategy'],
                 pick['selected_option'],
@@ -245,14 +250,21 @@ class PicksDAO(BaseDAO):
                 pick.get('score', 0),
                 pick.get('notes', '')
             )
-            self.db.execute(query, params)
-
-            # Get last inserted ID
-            id_rows = self.db.execute("SELECT last_insert_rowid() as id")
-            if id_rows:
-                pick_ids.append(id_rows[0]['id'])
+            for pick in picks
+        ]
 
-        self.logger.info(f"Inserted {len(picks)} picks")
+        # One connection and transaction; IDs come straight back from RETURNING
+        # (a separate last_insert_rowid() query would run on a new connection)
+        with self.db.get_connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                pick_ids = [conn.execute(query, params).fetchone()[0] for params in params_list]
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        self.logger.info(f"Inserted {len(pick_ids)} picks")
         return pick_ids
 
     def get_picks_by_date(self, asof: date, strategy: str = None) -> List[Dict[str, Any]]:
@@ -8,7 +8,7 @@ Python 3.12 compatible following CLAUDE.md standards.
 import sqlite3
 import os
 from contextlib import contextmanager
-from typing import Optional, Generator
+from typing import Optional, Generator, Iterable
 from ..config import DB_URL
 from ..utils.logging import get_logger
 
@@ -88,18 +88,31 @@ class Database:
                 conn.commit()
                 return None
 
-    def execute_many(self, query: str, params_list: list[tuple]) -> None:
+    def execute_many(self, query: str, params_list: Iterable[tuple]) -> int:
         """
         Execute a query multiple times with different parameters.
 
         Args:
             query: SQL query to execute
-            params_list: List of parameter tuples
+            params_list: List or iterator of parameter tuples (iterators are
+                consumed lazily by sqlite3)
+
+        Returns:
+            Number of rows modified
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.executemany(query, params_list)
-            conn.commit()
+            # Connections are autocommit; wrap the batch in one transaction
+            cursor.execute("BEGIN")
+            try:
+                cursor.executemany(query, params_list)
+                rowcount = cursor.rowcount
+                cursor.execute("COMMIT")
+            except Exception:
+                # Also covers errors raised while consuming a params iterator
+                cursor.execute("ROLLBACK")
+                raise
+            return rowcount
 
     def begin_transaction(self) -> sqlite3.Connection:
         """Begin an explicit transaction."""
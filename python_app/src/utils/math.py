@@ -5,8 +5,9 @@ Provides statistical and financial calculations.
 Python 3.12 compatible following CLAUDE.md standards.
 """
 
+import heapq
 import numpy as np
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 
 def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> float:
@@ -43,6 +44,85 @@ def zscore(value: float, mean: float, std: float) -> float:
     return (value - mean) / std
 
 
+def make_normalizer(target: float, scale: float) -> Callable[[float], float]:
+    """
+    Build a 0-1 z-score normalizer specialized to one (target, scale) pair.
+
+    Scoring call sites use fixed constants, so binding them once at import
+    leaves only the value to process per call.
+
+    Args:
+        target: Target/mean value for z-score
+        scale: Standard deviation for z-score (must be non-zero)
+
+    Returns:
+        Callable: Function mapping a value to the 0-1 scale
+    """
+    def normalize(value: float) -> float:
+        # z-score shifted by 3 sigma, then mapped onto 0-1 and clamped
+        shifted = (value - target) / scale + 3
+        return 0.0 if shifted <= 0 else (1.0 if shifted >= 6 else shifted / 6)
+
+    return normalize
+
+
+def normalize_metric(value: float, target: float, scale: float) -> float:
+    """
+    Normalize a metric to a 0-1 scale using z-score approach.
+
+    Args:
+        value: The metric value to normalize
+        target: Target/mean value for z-score
+        scale: Standard deviation for z-score (must be non-zero)
+
+    Returns:
+        float: Normalized value between 0 and 1
+    """
+    return make_normalizer(target, scale)(value)
+
+
+def zscore_normalize(values: np.ndarray, mean: float, std: float) -> np.ndarray:
+    """
+    Map values to a 0-1 scale via z-score, treating ±3 sigma as the range.
+
+    Vectorized counterpart of normalize_metric().
+
+    Args:
+        values: Values to normalize
+        mean: Mean of the distribution
+        std: Standard deviation of the distribution (must be non-zero)
+
+    Returns:
+        np.ndarray: Normalized values between 0 and 1
+    """
+    # One buffer updated in place; min/max avoids np.clip's dispatch overhead
+    z = np.subtract(values, mean, dtype=np.float64)
+    z /= std
+    z += 3
+    z /= 6
+    np.maximum(z, 0.0, out=z)
+    return np.minimum(z, 1.0, out=z)
+
+
+def ranked_indices(scores: np.ndarray, top_k: Optional[int] = None) -> List[int]:
+    """
+    Indices of scores ordered best first, ties kept in input order.
+
+    Args:
+        scores: Scores to rank
+        top_k: If set, only the indices of the top_k scores are returned,
+            found with a partial O(N log K) heap selection
+
+    Returns:
+        List[int]: Indices into scores, highest score first
+    """
+    if top_k is None:
+        return np.argsort(-np.asarray(scores), kind='stable').tolist()
+
+    values = np.asarray(scores).tolist()
+    return heapq.nlargest(top_k, range(len(values)), key=values.__getitem__)
+
+
 def percentile_rank(value: float, series: List[float]) -> float:
     """
     Calculate percentile rank of a value in a series.
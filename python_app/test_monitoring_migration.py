@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Test the monitoring database migration from ISO-text to epoch timestamps.
+
+Builds a monitoring database with the original TEXT-timestamp schema (as
+created before the switch to epoch seconds), opens it with MonitoringService
+and checks the converted values and the health/performance reports.
+Runs under a non-UTC timezone, since run timestamps were written in local time.
+Run from project root: python3 python_app/test_monitoring_migration.py
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+import calendar
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add python_app to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.services import monitoring_service
+
+
+LEGACY_SCHEMA = '''
+    CREATE TABLE pipeline_runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_date DATE NOT NULL,
+        started_at TIMESTAMP NOT NULL,
+        completed_at TIMESTAMP,
+        status TEXT NOT NULL,
+        symbols_attempted INTEGER DEFAULT 0,
+        symbols_succeeded INTEGER DEFAULT 0,
+        symbols_failed INTEGER DEFAULT 0,
+        total_picks INTEGER DEFAULT 0,
+        cc_picks INTEGER DEFAULT 0,
+        csp_picks INTEGER DEFAULT 0,
+        api_calls INTEGER DEFAULT 0,
+        duration_seconds REAL,
+        error_message TEXT,
+        error_details TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE performance_metrics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_id INTEGER,
+        metric_name TEXT NOT NULL,
+        metric_value REAL NOT NULL,
+        metric_unit TEXT,
+        recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (run_id) REFERENCES pipeline_runs(id)
+    );
+    CREATE TABLE monitoring_alerts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        alert_type TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        message TEXT NOT NULL,
+        details TEXT,
+        sent_via TEXT,
+        acknowledged BOOLEAN DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX idx_runs_started_at ON pipeline_runs(started_at DESC);
+'''
+
+
+class _NoTelegram:
+    """Stands in for TelegramService so the test never sends messages."""
+
+    def send_message(self, text):
+        return True
+
+
+def _utc_text(moment: datetime) -> str:
+    """Format a local datetime the way CURRENT_TIMESTAMP stored it (UTC)."""
+    return moment.astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _create_legacy_db(db_path: str, now: datetime) -> dict:
+    """Create a legacy monitoring database and return the values written."""
+    old_start = now - timedelta(days=3)
+    new_start = now - timedelta(hours=2)
+    values = {
+        'old_start': old_start.isoformat(),
+        'new_start': new_start.isoformat(),
+        'new_end': (new_start + timedelta(seconds=95)).isoformat(),
+        'run_created': _utc_text(new_start),
+        'recent_alert': _utc_text(now - timedelta(hours=1)),
+        'old_alert': _utc_text(now - timedelta(days=3)),
+    }
+
+    conn = sqlite3.connect(db_path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.execute('''
+        INSERT INTO pipeline_runs (run_date, started_at, completed_at, status,
+                                   symbols_attempted, symbols_succeeded, duration_seconds)
+        VALUES (?, ?, ?, 'failed', 10, 2, 40.0)
+    ''', (old_start.date().isoformat(), values['old_start'], values['old_start']))
+    conn.execute('''
+        INSERT INTO pipeline_runs (run_date, started_at, completed_at, status,
+                                   symbols_attempted, symbols_succeeded, duration_seconds,
+                                   created_at)
+        VALUES (?, ?, ?, 'success', 10, 10, 95.0, ?)
+    ''', (new_start.date().isoformat(), values['new_start'], values['new_end'],
+          values['run_created']))
+    conn.execute('''
+        INSERT INTO performance_metrics (run_id, metric_name, metric_value, recorded_at)
+        VALUES (2, 'screen_time', 1.5, ?)
+    ''', (values['run_created'],))
+    conn.executemany('''
+        INSERT INTO monitoring_alerts (alert_type, severity, message, sent_via, created_at)
+        VALUES (?, ?, ?, 'telegram', ?)
+    ''', [
+        ('high_failure_rate', 'warning', 'recent', values['recent_alert']),
+        ('consecutive_failures', 'critical', 'old', values['old_alert']),
+    ])
+    conn.commit()
+    conn.close()
+    return values
+
+
+def test_monitoring_migration():
+    """Migrate a legacy ISO-text monitoring database and check the results."""
+    print("\nTesting monitoring timestamp migration...")
+
+    saved_tz = os.environ.get('TZ')
+    saved_telegram = monitoring_service.TelegramService
+    os.environ['TZ'] = 'America/New_York'
+    time.tzset()
+    monitoring_service.TelegramService = _NoTelegram
+
+    try:
+        db_path = os.path.join(tempfile.mkdtemp(), 'screener.db')
+        now = datetime.now().replace(microsecond=123456)
+        legacy = _create_legacy_db(db_path, now)
+
+        monitoring = monitoring_service.MonitoringService(db_path)
+        conn = sqlite3.connect(db_path)
+
+        # Columns are now declared INTEGER and hold epoch seconds
+        for table, column in (('pipeline_runs', 'started_at'),
+                              ('performance_metrics', 'recorded_at'),
+                              ('monitoring_alerts', 'created_at')):
+            types = {row[1]: row[2] for row in conn.execute(f"PRAGMA table_info({table})")}
+            assert types[column] == 'INTEGER', f"{table}.{column} is {types[column]}"
+
+        runs = conn.execute(
+            "SELECT started_at, completed_at, created_at FROM pipeline_runs ORDER BY id"
+        ).fetchall()
+        assert runs[0][0] == int(datetime.fromisoformat(legacy['old_start']).timestamp())
+        assert runs[1][0] == int(datetime.fromisoformat(legacy['new_start']).timestamp())
+        assert runs[1][1] == int(datetime.fromisoformat(legacy['new_end']).timestamp())
+        assert runs[1][2] == calendar.timegm(time.strptime(legacy['run_created'], '%Y-%m-%d %H:%M:%S'))
+        print(f"  ✓ Run timestamps converted from local time: {runs[1]}")
+
+        recorded_at = conn.execute("SELECT recorded_at FROM performance_metrics").fetchone()[0]
+        assert recorded_at == runs[1][2]
+        alerts = [row[0] for row in conn.execute("SELECT created_at FROM monitoring_alerts ORDER BY id")]
+        assert alerts == [
+            calendar.timegm(time.strptime(legacy[key], '%Y-%m-%d %H:%M:%S'))
+            for key in ('recent_alert', 'old_alert')
+        ]
+        assert conn.execute("SELECT COUNT(*) FROM pipeline_runs").fetchone()[0] == 2
+        print("  ✓ Metric and alert timestamps converted from UTC")
+
+        # Reports read the migrated rows
+        health = monitoring.get_health_status()
+        assert health['status'] == 'healthy', health
+        assert health['health_score'] == 85, health  # 1 of 2 runs this week succeeded
+        assert health['last_run']['id'] == 2
+        assert health['last_run']['started_at'] == legacy['new_start'][:19]
+        assert health['weekly_stats'] == {'total_runs': 2, 'successful_runs': 1, 'success_rate': 50.0}
+        assert health['recent_alerts_24h'] == 1
+        print(f"  ✓ Health status: {health['status']} ({health['health_score']})")
+
+        performance = monitoring.get_performance_summary()
+        assert performance['total_runs'] == 1
+        assert performance['avg_duration_seconds'] == 95.0
+        print(f"  ✓ Performance summary: {performance['total_runs']} successful run(s)")
+
+        # Reopening leaves migrated tables alone, and new runs sort after old ones
+        monitoring.close()
+        monitoring = monitoring_service.MonitoringService(db_path)
+        assert conn.execute("SELECT started_at FROM pipeline_runs WHERE id = 2").fetchone()[0] == runs[1][0]
+        run_id = monitoring.record_pipeline_start()
+        assert run_id == 3
+        assert monitoring.get_health_status()['last_run']['id'] == 3
+        print("  ✓ Reopened without re-migrating")
+
+        conn.close()
+        monitoring.close()
+        print("✅ Monitoring migration test passed")
+
+    finally:
+        monitoring_service.TelegramService = saved_telegram
+        if saved_tz is None:
+            os.environ.pop('TZ', None)
+        else:
+            os.environ['TZ'] = saved_tz
+        time.tzset()
+
+
+if __name__ == "__main__":
+    test_monitoring_migration()
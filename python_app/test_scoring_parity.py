@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Test that the vectorized scorers agree with the per-pick scorers.
+
+Scores randomly generated covered call and cash-secured put picks with
+score_*_pick (one dict at a time) and with score_*_picks / rank_*_picks
+(columnar PickTable kernels), plus ProductionPipeline.score_candidates, and
+requires identical scores and rankings.
+Run from project root: python3 python_app/test_scoring_parity.py
+"""
+
+import copy
+import random
+import sys
+from operator import itemgetter
+from pathlib import Path
+
+# Add python_app to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.scoring.score_cc import score_cc_pick, score_cc_picks, rank_cc_picks
+from src.scoring.score_csp import score_csp_pick, score_csp_picks, rank_csp_picks
+from src.pipelines.daily_job import ProductionPipeline
+
+
+PICK_COUNT = 5000
+TOP_K = 25
+
+
+def _random_common(rng: random.Random) -> dict:
+    """Fields shared by both strategies; values are rounded so thresholds get hit exactly."""
+    return {
+        'iv_rank': float(rng.randint(0, 100)),
+        'roi_30d': round(rng.uniform(0, 0.06), 3),
+        'theta': -round(rng.uniform(0, 0.3), 2),
+        'gamma': round(rng.uniform(0, 0.12), 2),
+        'vega': round(rng.uniform(0, 0.6), 2),
+        'contrarian_signal': rng.choice(['none', 'long', 'short']),
+        'oi': rng.choice([0, 50, 100, 500, 1000, rng.randint(0, 5000)]),
+        'spread_pct': round(rng.uniform(0, 0.25), 2),
+        'earnings_days_until': rng.choice([999, rng.randint(0, 60)]),
+    }
+
+
+def _drop_some(rng: random.Random, pick: dict) -> dict:
+    """Remove a few keys so the scorers' defaults are exercised too."""
+    for key in list(pick):
+        if key not in ('symbol', 'strike') and rng.random() < 0.05:
+            del pick[key]
+    return pick
+
+
+def random_cc_pick(rng: random.Random) -> dict:
+    """Generate a covered call pick dictionary."""
+    pick = _random_common(rng)
+    pick.update({
+        'symbol': 'CC',
+        'trend_strength': round(rng.uniform(-1, 1), 1),
+        'dividend_yield': round(rng.uniform(0, 0.05), 3),
+        'below_200sma': rng.random() < 0.3,
+        'trend_consistency': round(rng.uniform(0, 1), 1),
+    })
+    return _drop_some(rng, pick)
+
+
+def random_csp_pick(rng: random.Random) -> dict:
+    """Generate a cash-secured put pick dictionary."""
+    strike = float(rng.randint(20, 300))
+    pick = _random_common(rng)
+    pick.update({
+        'symbol': 'CSP',
+        'strike': strike,
+        'support_level': rng.choice([0, strike * rng.uniform(0.97, 1.03), strike * 0.9]),
+        'margin_of_safety': round(rng.uniform(-0.05, 0.2), 2),
+        'trend_stability': round(rng.uniform(0, 1), 1),
+        'in_uptrend': rng.random() < 0.5,
+        'iv_percentile': float(rng.randint(0, 100)),
+    })
+    return _drop_some(rng, pick)
+
+
+def _expected_ranking(picks: list, scores: list) -> list:
+    """Indices by score descending, ties in input order (the documented ranking)."""
+    return sorted(range(len(picks)), key=lambda i: -scores[i])
+
+
+def _check_strategy(name, make_pick, score_pick, score_picks, rank_picks):
+    """Compare scalar and vectorized scoring and ranking for one strategy."""
+    rng = random.Random(20251102)
+    picks = [make_pick(rng) for _ in range(PICK_COUNT)]
+    for i, pick in enumerate(picks):
+        pick['id'] = i
+
+    expected = [score_pick(copy.deepcopy(pick)) for pick in picks]
+
+    batch = score_picks(copy.deepcopy(picks)).tolist()
+    mismatches = [i for i, (a, b) in enumerate(zip(expected, batch)) if a != b]
+    assert not mismatches, f"{name}: {len(mismatches)} scores differ, first pick {picks[mismatches[0]]}"
+    print(f"  ✓ {name} score_*_picks matches score_*_pick for {PICK_COUNT} picks")
+
+    order = _expected_ranking(picks, expected)
+
+    top = rank_picks(copy.deepcopy(picks), top_k=TOP_K)
+    assert [p['id'] for p in top] == order[:TOP_K], f"{name}: top_k ranking differs"
+    assert [p['rank'] for p in top] == list(range(1, TOP_K + 1))
+    assert [p['score'] for p in top] == [expected[i] for i in order[:TOP_K]]
+
+    ranked = rank_picks(copy.deepcopy(picks))
+    assert [p['id'] for p in ranked] == order, f"{name}: full ranking differs"
+    print(f"  ✓ {name} rank_*_picks (top_k={TOP_K} and full) matches the scalar ranking")
+
+
+def _check_score_candidates():
+    """Compare ProductionPipeline.score_candidates with per-pick scoring and ranking."""
+    rng = random.Random(7)
+    pipeline = ProductionPipeline.__new__(ProductionPipeline)
+
+    for _ in range(200):
+        stock_price = float(rng.randint(20, 300))
+        candidates = []
+        for i in range(rng.randint(1, 40)):
+            if candidates and rng.random() < 0.3:
+                # Duplicate an earlier contract so scores tie
+                candidate = dict(rng.choice(candidates))
+            else:
+                candidate = {
+                    'symbol': 'XYZ',
+                    'strike': float(rng.randint(10, 350)),
+                    'expiry': f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                    'mid': rng.choice([0, round(rng.uniform(0.05, 8), 2)]),
+                    'iv': round(rng.uniform(0.05, 1.4), 2),
+                    'roi_30d': round(rng.uniform(0, 0.06), 3),
+                    'theta': -round(rng.uniform(0, 0.3), 2),
+                    'gamma': round(rng.uniform(0, 0.12), 2),
+                    'vega': round(rng.uniform(0, 0.6), 2),
+                    'oi': rng.choice([0, 100, 1000, rng.randint(0, 5000)]),
+                    'spread_pct': round(rng.uniform(0, 0.25), 2),
+                }
+            candidate['id'] = i
+            candidates.append(candidate)
+        features = {
+            'trend_strength': round(rng.uniform(-1, 1), 1),
+            'below_200sma': rng.random() < 0.3,
+            'trend_stability': round(rng.uniform(0, 1), 1),
+            'in_uptrend': rng.random() < 0.5,
+        }
+        earnings_days_until = rng.choice([None, rng.randint(1, 60)])
+        earnings_date = "2026-06-15" if earnings_days_until else None
+
+        for strategy, score_pick in (('CC', score_cc_pick), ('CSP', score_csp_pick)):
+            args = (strategy, stock_price, features, 0.02, earnings_date, earnings_days_until)
+
+            # Score every priced candidate, then rank them the way the
+            # per-candidate loop did: score descending, ties in chain order
+            scored, count = pipeline.score_candidates(copy.deepcopy(candidates), *args, top_n=len(candidates))
+            assert len(scored) == count
+            for pick in scored:
+                assert pick['score'] == score_pick(copy.deepcopy(pick)), (strategy, pick)
+            expected = [p['id'] for p in sorted(sorted(scored, key=itemgetter('id')),
+                                                key=itemgetter('score'), reverse=True)]
+            assert [p['id'] for p in scored] == expected, (strategy, expected)
+
+            picks, _ = pipeline.score_candidates(copy.deepcopy(candidates), *args, top_n=3)
+            assert [p['id'] for p in picks] == expected[:3], (strategy, expected)
+
+    print("  ✓ score_candidates picks, order and scores match per-pick scoring")
+
+
+def test_scoring_parity():
+    """Vectorized and scalar scoring must agree exactly."""
+    print("\nTesting scoring parity...")
+    _check_strategy('CC', random_cc_pick, score_cc_pick, score_cc_picks, rank_cc_picks)
+    _check_strategy('CSP', random_csp_pick, score_csp_pick, score_csp_picks, rank_csp_picks)
+    _check_score_candidates()
+    print("✅ Scoring parity test passed")
+
+
+if __name__ == "__main__":
+    test_scoring_parity()